@@ -4,21 +4,80 @@ Adaptive Base Scraper Logic
 Core resilience layer for HostingArena scrapers.
 Handles:
 1. Anti-bot evasion (User-Agents, Delays)
-2. Hybrid Data Loading (Live Scrape > Verified JSON > Cache)
+2. Hybrid Data Loading (Live Scrape > Verified JSON > Cache), every plan
+   updated from one parse of the pricing page
 3. Standardized Error Handling
 """
+import asyncio
+import json
 import logging
 import random
-import time
-import json
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any, Dict
-from pathlib import Path
-import requests
-from bs4 import BeautifulSoup
+from typing import Optional, List, Any, Dict, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from . import metrics
+from .verified_registry import get_registry
+from .utils import http_client
+from .utils.live_memo import get_live_memo
+from .utils.parse_pool import get_parse_pool
+from .utils.selector_stats import get_selector_stats
+from .utils.html_parser import parse_html, strainer_for
+from .utils.http_client import FetchResponse
+
+
+# Live per-plan values that replace the registry's
+LIVE_PLAN_FIELDS = ('price', 'renewal', 'features')
+
+# Part of the key stored extractions are reused under (304s and identical bodies): bump when extraction output changes
+LIVE_EXTRACTION_VERSION = 2
+
+
+def _plan_key(name: Any) -> str:
+    return ''.join(c for c in str(name).lower() if c.isalnum())
+
+
+def _pair_plans(plans: List[dict], live_plans: List[dict]) -> List[Tuple[int, dict]]:
+    """(registry plan index, live record) pairs: by name when the page has names, else by position"""
+    if not live_plans:
+        return []
+    if not all(record.get('name') for record in live_plans):
+        return list(enumerate(live_plans)) if len(live_plans) == len(plans) else []
+    keys = [_plan_key(plan.get('name', '')) for plan in plans]
+    pairs, used = [], set()
+    for record in live_plans:
+        key = _plan_key(record['name'])
+        if not key:
+            continue
+        # "Basic" matches "Basic"; else "WordPress Basic", if no other plan name fits too
+        candidates = ([i for i, k in enumerate(keys) if k == key]
+                      or [i for i, k in enumerate(keys) if k and (k in key or key in k)])
+        if len(candidates) == 1 and candidates[0] not in used:
+            used.add(candidates[0])
+            pairs.append((candidates[0], record))
+    return pairs
+
+
+def merge_live_plans(plans: List[dict], live: dict) -> List[dict]:
+    """
+    Registry plans with the live values patched in
+
+    Live plan records (see get_live_data) update every plan they can be paired
+    with. Without any pair, the live price updates the first (Basic) plan.
+    Registry records are shared process-wide: copies are patched, never the originals.
+    """
+    pairs = _pair_plans(plans, live.get('plans') or [])
+    updates = [(i, {k: record[k] for k in LIVE_PLAN_FIELDS if k in record}) for i, record in pairs]
+    updates = [(i, values) for i, values in updates if values]
+    if not updates and live.get('price'):
+        updates = [(0, {'price': live['price']})]
+    if not updates:
+        return plans
+    merged = [dict(p) for p in plans]
+    for index, values in updates:
+        merged[index].update(values)
+        merged[index]['last_checked'] = "Live just now"
+    return merged
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
 
 class AdaptiveBaseScraper(ABC):
     """
@@ -39,7 +98,6 @@ class AdaptiveBaseScraper(ABC):
         self.provider_name = provider_name
         self.provider_type = provider_type  # 'hosting' or 'vpn'
         self.logger = logging.getLogger(f"Scraper.{provider_name}")
-        self.session = requests.Session()
         
         # Load verified data registry
         self.verified_data = self._load_verified_data()
@@ -52,116 +110,106 @@ class AdaptiveBaseScraper(ABC):
         }
 
     def _load_verified_data(self) -> Dict[str, Any]:
-        """Loads the 'Truth Source' JSON to use as fallback or enrichment"""
-        try:
-            # Assuming data is in /Users/juan/Documents/HostingArena/data/verified_data.json
-            path = Path(__file__).parent.parent / "data" / "verified_data.json"
-            if path.exists():
-                with open(path, 'r') as f:
-                    all_data = json.load(f)
-                    self.logger.info(f"Loaded {len(all_data.get('hosting', []))} hosting providers from {path}")
-                    
-                # Find our specific provider in the list
-                category = self.provider_type  # 'hosting' or 'vpn'
-                if category in all_data:
-                    for p in all_data[category]:
-                        if p.get('name', '').lower() == self.provider_name.lower():
-                            self.logger.info(f"✅ Found Verified Data for {self.provider_name}")
-                            return p
-                        # Debug close matches
-                        if 'tmd' in p.get('name', '').lower() and 'tmd' in self.provider_name.lower():
-                             self.logger.warning(f"⚠️ Mismatch: JSON '{p.get('name')}' vs Scraper '{self.provider_name}'")
-            return {}
-        except Exception as e:
-            self.logger.warning(f"Failed to load verified data registry: {e}")
-            return {}
+        """Looks up the 'Truth Source' record to use as fallback or enrichment"""
+        record = get_registry().get(self.provider_type, self.provider_name)
+        if record:
+            self.logger.info(f"✅ Found Verified Data for {self.provider_name}")
+        return record
 
-    def fetch_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-        """Adaptive fetch with exponential backoff"""
-        for i in range(retries):
-            try:
-                headers = self._get_random_header()
-                # Random delay to look human
-                time.sleep(random.uniform(1.0, 3.0))
-                
-                response = self.session.get(url, headers=headers, timeout=15)
-                response.raise_for_status()
-                
-                return BeautifulSoup(response.text, 'html.parser')
-                
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code in [403, 429]:
-                    self.logger.warning(f"Anti-bot triggered (Attempt {i+1}/{retries}). Retrying...")
-                    time.sleep(2 ** i)  # 1s, 2s, 4s...
-                else:
-                    self.logger.error(f"HTTP Error: {e}")
-                    break
-            except Exception as e:
-                self.logger.error(f"Network Error: {e}")
-                
-        return None
+    async def _fetch_response(self, url: str, retries: int = 3) -> Optional[FetchResponse]:
+        """Fetch policy: rotating headers + human-like jitter. Subclasses may override."""
+        return await http_client.fetch_page(url, headers=self._get_random_header(), retries=retries)
 
-    def _smart_extract_price(self, soup: BeautifulSoup) -> float:
+    def parse_target(self, field: str = 'price_css') -> Optional[SoupStrainer]:
+        """Strainer for the registry selector `field`, or None (parse the whole page)"""
+        from .selector_registry import get_selectors
+        selectors = get_selectors(self.provider_name) or {}
+        return strainer_for(selectors[field]) if selectors.get(field) else None
+
+    async def fetch_page_async(self, url: str, retries: int = 3, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """
-        FALLBACK: Smart Heuristic to find the lowest price on page.
-        Looks for '$X.XX' patterns near keywords like 'mo', 'month', 'starting'.
+        Adaptive fetch with exponential backoff (non-blocking)
+
+        Args:
+            parse_only: Build only part of the tree, e.g. self.parse_target()
         """
-        import re
-        text = soup.get_text()
-        # Regex for $X.XX or $XX
-        price_pattern = re.compile(r'\$\s?(\d+\.?\d{0,2})')
-        matches = price_pattern.findall(text)
-        
-        valid_prices = []
-        for m in matches:
-            try:
-                val = float(m)
-                # Filter unreasonable hosting prices (e.g. $0.01 or $5000)
-                if 0.5 < val < 100: 
-                    valid_prices.append(val)
-            except:
-                pass
-                
-        if valid_prices:
-            # Usually the "Starting at" price is the lowest valid one
-            return min(valid_prices)
-        return 0.0
+        response = await self._fetch_response(url, retries)
+        if response is None:
+            return None
+        # Parse off the event loop so other fetches keep flowing
+        with metrics.span('parse'):
+            return await asyncio.to_thread(parse_html, response.text, None, parse_only)
+
+    def fetch_page(self, url: str, retries: int = 3, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Blocking adapter over fetch_page_async for synchronous scrapers"""
+        response = http_client.run_sync(self._fetch_response(url, retries))
+        if response is None:
+            return None
+        with metrics.span('parse'):
+            return parse_html(response.text, parse_only=parse_only)
 
     def get_live_data(self, url: str) -> dict:
         """
         attempts to scrape LIVE data using:
         1. Dedicated Selectors (if available in selector_registry)
         2. Smart Heuristics (if no selector)
+
+        Memoized per (provider, url) for the whole run, so repeated
+        get_verified_field('plans') calls fetch and parse the page once.
         """
+        return get_live_memo().get_or_compute(self.provider_name, url, lambda: self._scrape_live_data(url))
+
+    def _scrape_live_data(self, url: str) -> dict:
+        """Fetch + extract for get_live_data (uncached)"""
         try:
-            from .selector_registry import get_selectors
+            from .selector_registry import PLAN_FIELDS, get_selectors, plan_selectors
             selectors = get_selectors(self.provider_name)
             
-            soup = self.fetch_page(url)
-            if not soup:
+            response = http_client.run_sync(self._fetch_response(url))
+            if response is None:
                 return {}
-
-            live_price = 0.0
             
-            # METHOD 1: Dedicated Selectors (Top 40)
-            if selectors and 'price_css' in selectors:
-                element = soup.select_one(selectors['price_css'])
-                if element:
-                    # Clean string: "$ 2.95 /mo" -> 2.95
-                    raw = element.get_text().strip()
-                    import re
-                    found = re.search(r'(\d+\.?\d{0,2})', raw)
-                    if found:
-                        live_price = float(found.group(1))
-                        self.logger.info(f"🎯 Dedicated Scrape Success: {self.provider_name} -> ${live_price}")
-            
-            # METHOD 2: Smart Heuristics (The REST)
-            if live_price == 0.0:
-                live_price = self._smart_extract_price(soup)
-                if live_price > 0:
-                    self.logger.info(f"🧠 Smart Scrape Success: {self.provider_name} -> ${live_price}")
+            css = selectors.get('price_css') if selectors else None
+            plan_css = plan_selectors(self.provider_name)
+            fields = {PLAN_FIELDS[field]: selector for field, selector in plan_css.items()}
+            # Body + extractor version + selectors: a result is only reused under the same key
+            content_key = f"{response.body_hash}/{http_client.content_hash(json.dumps([LIVE_EXTRACTION_VERSION, css, fields]))}"
+
+            # Page unchanged since we last extracted it (fresh cache hit or 304): skip the parse
+            if response.extracted is not None and response.extraction_key == content_key:
+                metrics.incr('extraction_reused')
+                self.logger.info(f"♻️  Unchanged page, reusing last extraction for {self.provider_name}")
+                return dict(response.extracted)
+
+            # Same bytes as a page extracted before (no validators needed): reuse that result
+            unchanged = http_client.unchanged_extraction(content_key)
+            if unchanged is not None:
+                self.logger.info(f"♻️  Identical page body, reusing last extraction for {self.provider_name}")
+                http_client.remember_extraction(url, unchanged, content_key)
+                return unchanged
+
+            # Selector lookups + heuristics run in the parse pool; only the result comes back.
+            # All of the provider's plan selectors are matched in the same single tree walk.
+            extraction = get_parse_pool().extract(response.text, css, fields or None)
+            stats = get_selector_stats()
+            if css:
+                timings = extraction['timings']
+                stats.record(self.provider_name, 'price_css', css, extraction['selector_hit'],
+                             timings.get('parse', 0.0), timings.get('extract', 0.0))
+            fields_hit = extraction.get('fields_hit', {})
+            for field, selector in plan_css.items():
+                stats.record(self.provider_name, field, selector, fields_hit.get(PLAN_FIELDS[field], False), 0.0)
+            live_price = extraction.get('price', 0.0)
+            if extraction.get('method') == 'selector':
+                self.logger.info(f"🎯 Dedicated Scrape Success: {self.provider_name} -> ${live_price}")
+            elif live_price > 0:
+                self.logger.info(f"🧠 Smart Scrape Success: {self.provider_name} -> ${live_price}")
 
-            return {'price': live_price} if live_price > 0 else {}
+            result = {'price': live_price} if live_price > 0 else {}
+            if extraction.get('plans'):
+                result['plans'] = extraction['plans']
+            http_client.remember_extraction(url, result, content_key)
+            return result
 
         except Exception as e:
             self.logger.error(f"Live scrape failed: {e}")
@@ -204,10 +252,8 @@ class AdaptiveBaseScraper(ABC):
         # Only inject if we are looking for pricing (inside plans) or main price
         if field == 'plans' and url:
             live = self.get_live_data(url)
-            if live.get('price') and isinstance(registry_value, list) and len(registry_value) > 0:
-                # Update the Basic plan price with the LIVE price
-                registry_value[0]['price'] = live['price']
-                registry_value[0]['last_checked'] = "Live just now"
+            if isinstance(registry_value, list) and len(registry_value) > 0:
+                registry_value = merge_live_plans(registry_value, live)
                 
         return registry_value
         
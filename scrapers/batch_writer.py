@@ -0,0 +1,145 @@
+"""
+Batched Supabase Writer
+-----------------------
+Collects upsert payloads and writes them as multi-row upserts.
+Handles:
+1. Grouping per table + conflict target (one round trip per chunk, not per row)
+2. De-duplication on the conflict key (last write wins, as with per-row upserts)
+3. Per-row error attribution: a failed chunk is bisected until the bad rows are isolated
+4. Auto-flush at chunk size and flush-on-exit
+"""
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import SUPABASE_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RowError:
+    """A row the database rejected"""
+    table: str
+    label: str
+    payload: Dict[str, Any]
+    error: str
+
+
+class BatchWriter:
+    """Thread-safe multi-row upsert buffer in front of a Supabase client"""
+
+    def __init__(self, client, chunk_size: int = SUPABASE_BATCH_SIZE):
+        """
+        Args:
+            client: supabase.Client
+            chunk_size: Rows per upsert request
+        """
+        self.client = client
+        self.chunk_size = max(1, chunk_size)
+        self._lock = threading.Lock()
+        # (table, on_conflict) -> OrderedDict[conflict key values -> (label, payload)]
+        self._pending: Dict[Tuple[str, str], "OrderedDict[tuple, Tuple[str, Dict[str, Any]]]"] = {}
+        self.failures: List[RowError] = []
+        self.round_trips = 0
+        self.rows_written = 0
+        atexit.register(self.flush)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+    @staticmethod
+    def _conflict_key(payload: Dict[str, Any], on_conflict: str) -> tuple:
+        return tuple(payload.get(col.strip()) for col in on_conflict.split(','))
+
+    def add(self, table: str, payload: Dict[str, Any], on_conflict: str, label: Optional[str] = None):
+        """
+        Queue one row
+
+        Args:
+            table: Target table
+            payload: Row (JSON-serializable)
+            on_conflict: Comma-separated conflict columns, e.g. "provider_name,plan_name"
+            label: Name used when reporting errors for this row (default: conflict key)
+        """
+        key = self._conflict_key(payload, on_conflict)
+        label = label or " / ".join(str(k) for k in key)
+        ready = None
+        with self._lock:
+            bucket = self._pending.setdefault((table, on_conflict), OrderedDict())
+            bucket.pop(key, None)
+            bucket[key] = (label, payload)
+            if len(bucket) >= self.chunk_size:
+                ready = list(bucket.values())
+                bucket.clear()
+        if ready:
+            self._write(table, on_conflict, ready)
+
+    def pending_row(self, table: str, on_conflict: str, key: tuple) -> Optional[Dict[str, Any]]:
+        """A queued (not yet flushed) payload, so callers can amend it before flush"""
+        with self._lock:
+            entry = self._pending.get((table, on_conflict), {}).get(key)
+            return entry[1] if entry else None
+
+    def flush(self, tables: Optional[List[str]] = None) -> List[RowError]:
+        """
+        Write queued rows
+
+        Args:
+            tables: Only flush these tables (default: all)
+
+        Returns:
+            Errors from this flush
+        """
+        with self._lock:
+            batches = []
+            for (table, on_conflict), bucket in self._pending.items():
+                if bucket and (tables is None or table in tables):
+                    batches.append((table, on_conflict, list(bucket.values())))
+                    bucket.clear()
+
+        errors: List[RowError] = []
+        for table, on_conflict, rows in batches:
+            for i in range(0, len(rows), self.chunk_size):
+                errors.extend(self._write(table, on_conflict, rows[i:i + self.chunk_size]))
+        return errors
+
+    def _write(self, table: str, on_conflict: str, rows: List[Tuple[str, Dict[str, Any]]]) -> List[RowError]:
+        """Upsert rows; on failure bisect to find the offending ones"""
+        errors: List[RowError] = []
+        # PostgREST bulk upserts need identical keys per object: one request per key set
+        by_columns: Dict[frozenset, List[Tuple[str, Dict[str, Any]]]] = OrderedDict()
+        for label, payload in rows:
+            by_columns.setdefault(frozenset(payload), []).append((label, payload))
+        for group in by_columns.values():
+            errors.extend(self._upsert(table, on_conflict, group))
+        if errors:
+            with self._lock:
+                self.failures.extend(errors)
+        return errors
+
+    def _upsert(self, table: str, on_conflict: str, rows: List[Tuple[str, Dict[str, Any]]]) -> List[RowError]:
+        try:
+            self.round_trips += 1
+            self.client.table(table).upsert([p for _, p in rows], on_conflict=on_conflict).execute()
+            self.rows_written += len(rows)
+            return []
+        except Exception as e:
+            if len(rows) == 1:
+                label, payload = rows[0]
+                logger.warning(f"Upsert into {table} failed for {label}: {e}")
+                return [RowError(table, label, payload, str(e))]
+            mid = len(rows) // 2
+            return self._upsert(table, on_conflict, rows[:mid]) + self._upsert(table, on_conflict, rows[mid:])
+
+    def report(self) -> str:
+        return (
+            f"Supabase: {self.rows_written} rows in {self.round_trips} round trips"
+            f"{f', {len(self.failures)} rows failed' if self.failures else ''}"
+        )
@@ -0,0 +1,97 @@
+"""
+Entry-Point Bootstrap
+---------------------
+Process setup shared by the pipeline scripts, done on demand instead of at import.
+Handles:
+1. Loading .env and frontend/.env.local once per process
+2. Logging configuration (library modules never call basicConfig themselves)
+3. One lazily created Supabase client (the supabase package alone costs ~0.4s to import)
+4. One BatchWriter in front of that client
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from supabase import Client
+    from .batch_writer import BatchWriter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+
+_lock = threading.Lock()
+_env_loaded = False
+_client: Optional['Client'] = None
+_client_error: Optional[str] = None
+_writer: Optional['BatchWriter'] = None
+
+
+def load_env():
+    """Load the project .env and the frontend's .env.local (existing variables win)"""
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv(PROJECT_ROOT / ".env")
+    load_dotenv(PROJECT_ROOT / "frontend" / ".env.local")
+    _env_loaded = True
+
+
+def setup_logging(level: int = logging.INFO):
+    """Configure root logging for a script (no-op if the host app already did)"""
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
+
+def supabase_credentials() -> Tuple[Optional[str], Optional[str]]:
+    """(url, key), accepting the names used by the frontend as fallbacks"""
+    load_env()
+    url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
+    key = (os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+           or os.getenv("SUPABASE_ANON_KEY"))
+    return url, key
+
+
+def get_supabase(required: bool = False) -> Optional['Client']:
+    """
+    Process-wide Supabase client, created on first use
+
+    Args:
+        required: Raise RuntimeError instead of returning None when no client can be built
+    """
+    global _client, _client_error
+    if _client is None and _client_error is None:
+        with _lock:
+            if _client is None and _client_error is None:
+                url, key = supabase_credentials()
+                if not url or not key:
+                    _client_error = "SUPABASE_URL or SUPABASE_KEY not found in environment"
+                else:
+                    try:
+                        from supabase import create_client
+                        _client = create_client(url, key)
+                    except Exception as e:
+                        _client_error = f"Failed to init Supabase client: {e}"
+    if _client is None and required:
+        raise RuntimeError(_client_error)
+    return _client
+
+
+def supabase_error() -> Optional[str]:
+    """Why get_supabase() returned None (None if it hasn't failed)"""
+    return _client_error
+
+
+def get_writer() -> Optional['BatchWriter']:
+    """Process-wide BatchWriter over get_supabase(), or None without a client"""
+    global _writer
+    if _writer is None:
+        client = get_supabase()
+        if client is None:
+            return None
+        from .batch_writer import BatchWriter
+        with _lock:
+            if _writer is None:
+                _writer = BatchWriter(client)
+    return _writer
@@ -1,9 +1,11 @@
 """Configuration settings for scrapers and API clients"""
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (explicit path: no directory search on every import;
+# scripts also load frontend/.env.local via scrapers.bootstrap.load_env)
+load_dotenv(Path(__file__).resolve().parent.parent / '.env')
 
 # API Keys - Hosting Providers
 DIGITALOCEAN_API_KEY = os.getenv('DIGITALOCEAN_API_KEY', '')
@@ -14,9 +16,22 @@ CLOUDWAYS_EMAIL = os.getenv('CLOUDWAYS_EMAIL', '')
 KINSTA_API_KEY = os.getenv('KINSTA_API_KEY', '')
 GODADDY_API_KEY = os.getenv('GODADDY_API_KEY', '')
 GODADDY_API_SECRET = os.getenv('GODADDY_API_SECRET', '')
+DREAMHOST_API_KEY = os.getenv('DREAMHOST_API_KEY', '')
+LIQUIDWEB_API_KEY = os.getenv('LIQUIDWEB_API_KEY', '')
+NAMECHEAP_API_KEY = os.getenv('NAMECHEAP_API_KEY', '')
+WPENGINE_API_KEY = os.getenv('WPENGINE_API_KEY', '')
+# The pipeline runs every API client above whose key is set
 
 # Scraping Settings
-RATE_LIMIT_DELAY = int(os.getenv('RATE_LIMIT_DELAY', '2'))
+RATE_LIMIT_DELAY = float(os.getenv('RATE_LIMIT_DELAY', '2'))  # seconds between requests to one host
+RATE_LIMIT_BURST = int(os.getenv('RATE_LIMIT_BURST', '2'))  # back-to-back requests allowed after idling
+MAX_RETRY_AFTER = 120  # cap on a server's Retry-After (seconds)
+# Per-host overrides: {host: (requests_per_second, burst)}
+RATE_LIMIT_HOSTS = {
+    'api.digitalocean.com': (5.0, 10),
+    'api.vultr.com': (2.0, 5),
+    'api.linode.com': (5.0, 10),
+}
 USER_AGENT = os.getenv(
     'USER_AGENT',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -24,11 +39,69 @@ USER_AGENT = os.getenv(
 
 # Database
 DATABASE_PATH = os.getenv('DATABASE_PATH', 'data/providers.db')
+# Unchanged rows replicated longer ago than this are written again, so the
+# last_updated the dashboard shows keeps moving (12h: every daily run refreshes)
+LOCAL_STORE_REFRESH_HOURS = float(os.getenv('LOCAL_STORE_REFRESH_HOURS', '12'))
+
+# Supabase writes
+SUPABASE_BATCH_SIZE = int(os.getenv('SUPABASE_BATCH_SIZE', '500'))  # rows per multi-row upsert
 
 # Output
 OUTPUT_JSON_PATH = 'data/providers_data.json'
 OUTPUT_CSV_PATH = 'data/providers_data.csv'
+OUTPUT_PARQUET_DIR = os.getenv('OUTPUT_PARQUET_DIR', 'data/providers_parquet')  # one file per run per table
+# Appended after every pipeline run: any of 'csv', 'ndjson', 'parquet' (needs pyarrow), '' = off.
+# Opt-in: the files only accumulate where data/ outlives the run (not on CI runners)
+EXPORT_FORMATS = os.getenv('EXPORT_FORMATS', '')
 
 # Timeout settings
 REQUEST_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
+
+# Shared HTTP connection pool (async fetch layer)
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '100'))
+HTTP_POOL_PER_HOST = int(os.getenv('HTTP_POOL_PER_HOST', '4'))
+
+# Hosting provider API clients (scrapers/hosting/api/)
+API_PAGE_WORKERS = int(os.getenv('API_PAGE_WORKERS', '4'))  # pages fetched in parallel after the first
+API_POOL_MAXSIZE = int(os.getenv('API_POOL_MAXSIZE', '10'))  # keep-alive connections per API host, all clients
+API_BACKOFF_BASE = float(os.getenv('API_BACKOFF_BASE', '0.5'))  # seconds; doubles per retry, full jitter
+API_BACKOFF_MAX = float(os.getenv('API_BACKOFF_MAX', '30'))
+
+# HTML parsing: 'auto' (selectolax > lxml > html.parser), 'selectolax', 'lxml' or 'html.parser'
+HTML_PARSER = os.getenv('HTML_PARSER', 'auto')
+
+# Live price extraction in worker processes (selector + heuristics), 0 or 1 = in the scraper thread
+PARSE_POOL_WORKERS = int(os.getenv('PARSE_POOL_WORKERS', str(min(os.cpu_count() or 1, 8))))
+PARSE_POOL_CHUNKSIZE = int(os.getenv('PARSE_POOL_CHUNKSIZE', '4'))  # pages per worker task in batch extraction
+PARSE_POOL_MIN_BYTES = int(os.getenv('PARSE_POOL_MIN_BYTES', '16384'))  # smaller pages aren't worth the IPC
+
+# Conditional-GET page cache (ETag / Last-Modified)
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', '1') == '1'
+HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', 'data/http_cache')
+HTTP_CACHE_FRESH_TTL = int(os.getenv('HTTP_CACHE_FRESH_TTL', str(6 * 3600)))  # served without revalidating
+HTTP_CACHE_MAX_AGE = int(os.getenv('HTTP_CACHE_MAX_AGE', str(14 * 86400)))  # dropped after this
+HTTP_CACHE_MAX_BYTES = int(os.getenv('HTTP_CACHE_MAX_BYTES', str(200 * 1024 * 1024)))
+HTTP_CACHE_MAX_EXTRACTIONS = int(os.getenv('HTTP_CACHE_MAX_EXTRACTIONS', '5000'))  # body hash -> extraction results kept
+
+# Registry selector telemetry (checks, hits, latency), kept across runs
+SELECTOR_STATS_PATH = os.getenv('SELECTOR_STATS_PATH', 'data/selector_stats.json')
+SELECTOR_DEAD_AFTER = int(os.getenv('SELECTOR_DEAD_AFTER', '5'))  # checks without a hit before a selector is dead
+
+# Live page extractions reused across scrapers within a run, keyed by (provider, url)
+LIVE_DATA_MEMO_TTL = float(os.getenv('LIVE_DATA_MEMO_TTL', '3600'))  # seconds, 0 = refetch every call
+
+# Record/replay transport for offline benchmarks: 'off', 'record' or 'replay'
+HTTP_REPLAY_MODE = os.getenv('HTTP_REPLAY_MODE', 'off')
+HTTP_REPLAY_DIR = os.getenv('HTTP_REPLAY_DIR', 'data/replay')
+HTTP_REPLAY_LATENCY = float(os.getenv('HTTP_REPLAY_LATENCY', '0'))  # seconds added per replayed response
+HTTP_REPLAY_JITTER = float(os.getenv('HTTP_REPLAY_JITTER', '0'))  # extra random 0..N seconds
+
+# Per-phase run metrics: Prometheus text format, or JSON if the path ends in .json
+METRICS_PATH = os.getenv('METRICS_PATH', 'data/metrics/pipeline.prom')
+SCRAPER_STATUS_TIMINGS = os.getenv('SCRAPER_STATUS_TIMINGS', '1') == '1'  # phase_timings (jsonb) on scraper_status
+
+# Pipeline execution
+PIPELINE_WORKERS = int(os.getenv('PIPELINE_WORKERS', '8'))
+PIPELINE_PER_HOST_LIMIT = int(os.getenv('PIPELINE_PER_HOST_LIMIT', '1'))
+SCRAPER_TIMEOUT = int(os.getenv('SCRAPER_TIMEOUT', '120'))  # seconds per scraper
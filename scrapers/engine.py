@@ -0,0 +1,212 @@
+"""
+Scraper Execution Engine
+------------------------
+Concurrent runner for the daily pipeline.
+Handles:
+1. Bounded worker pool (wall-clock time ~ slowest host, not total count)
+2. Per-host concurrency caps (never hammer one provider in parallel)
+3. Per-scraper timeouts (a hung provider can't stall the whole run)
+4. Timed-out jobs keep their host slot until their thread really exits,
+   so abandoned requests still count towards the per-host cap
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .utils.helpers import host_of
+from .config import PIPELINE_WORKERS, PIPELINE_PER_HOST_LIMIT, SCRAPER_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# How often a dispatch blocked only by abandoned threads re-checks their hosts
+ABANDONED_POLL_SECONDS = 0.05
+
+
+@dataclass
+class JobResult:
+    """Outcome of a single scraper job"""
+    scraper_class: type
+    host: str
+    status: str  # 'success', 'empty', 'error' or 'timeout'
+    duration: float
+    result: Any = None
+    error: Optional[str] = None
+
+
+def job_name(scraper: Any) -> str:
+    """Display name of a job: class name for classes and manifest entries alike"""
+    return getattr(scraper, '__name__', None) or str(scraper)
+
+
+def host_for(scraper_class: Any) -> str:
+    """
+    Resolve the host a scraper talks to, used as its concurrency key.
+
+    Manifest entries carry their host. For classes: BASE_URL / PRICING_URL
+    when declared, otherwise the class name (every generated scraper targets
+    its own provider domain).
+    """
+    host = getattr(scraper_class, 'host', None)
+    if isinstance(host, str) and host:
+        return host
+    for attr in ('BASE_URL', 'PRICING_URL'):
+        url = getattr(scraper_class, attr, None)
+        if url:
+            return host_of(url)
+    return job_name(scraper_class)
+
+
+class ScraperEngine:
+    """Runs scraper jobs on a bounded pool with per-host caps and timeouts"""
+
+    def __init__(
+        self,
+        job: Callable[[type, threading.Event], Any],
+        workers: int = PIPELINE_WORKERS,
+        per_host_limit: int = PIPELINE_PER_HOST_LIMIT,
+        timeout: Optional[float] = SCRAPER_TIMEOUT,
+        on_timeout: Optional[Callable[[type, float], None]] = None,
+        host_resolver: Callable[[type], str] = host_for,
+    ):
+        """
+        Initialize engine
+
+        Args:
+            job: Callable run per scraper (class or manifest entry). Receives a cancel event that is
+                 set when the job exceeds its timeout, so late results can be dropped.
+            workers: Maximum number of scrapers running at the same time
+            per_host_limit: Maximum concurrent scrapers against the same host
+            timeout: Seconds before a scraper is abandoned (None = no limit)
+            on_timeout: Callback(scraper_class, elapsed) fired when a job times out
+            host_resolver: Maps a scraper class to its host key
+        """
+        self.job = job
+        self.workers = max(1, workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.timeout = timeout if timeout and timeout > 0 else None
+        self.on_timeout = on_timeout
+        self.host_resolver = host_resolver
+        # host -> timed-out jobs whose threads are still running (guarded by _slots)
+        self._abandoned: Dict[str, int] = {}
+        self._slots = threading.Condition()
+
+    def _busy(self, host: str, active_per_host: Dict[str, int]) -> bool:
+        """Whether `host` is at its cap, abandoned threads included. Caller holds _slots."""
+        return active_per_host.get(host, 0) + self._abandoned.get(host, 0) >= self.per_host_limit
+
+    def _execute(self, scraper_class: type, host: str) -> JobResult:
+        """Run one job in its own daemon thread so it can be abandoned on timeout"""
+        cancel = threading.Event()
+        outcome: Dict[str, Any] = {}
+        finished = threading.Event()
+
+        def target():
+            try:
+                outcome['result'] = self.job(scraper_class, cancel)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                with self._slots:
+                    finished.set()
+                    if cancel.is_set():
+                        # Abandoned earlier: hand the host slot back now
+                        self._abandoned[host] -= 1
+                        if not self._abandoned[host]:
+                            del self._abandoned[host]
+                        self._slots.notify_all()
+
+        start = time.time()
+        runner = threading.Thread(target=target, name=f"scraper-{job_name(scraper_class)}", daemon=True)
+        runner.start()
+        runner.join(self.timeout)
+        duration = time.time() - start
+
+        if runner.is_alive():
+            with self._slots:
+                cancel.set()
+                if not finished.is_set():
+                    # Still holds a connection to the host: keep counting it against the cap
+                    self._abandoned[host] = self._abandoned.get(host, 0) + 1
+            logger.warning(f"⏱️  {job_name(scraper_class)} timed out after {duration:.1f}s")
+            if self.on_timeout:
+                try:
+                    self.on_timeout(scraper_class, duration)
+                except Exception as e:
+                    logger.error(f"Timeout callback failed for {job_name(scraper_class)}: {e}")
+            return JobResult(scraper_class, host, 'timeout', duration, error=f"Timed out after {duration:.1f}s")
+
+        if 'error' in outcome:
+            return JobResult(scraper_class, host, 'error', duration, error=str(outcome['error']))
+
+        result = outcome.get('result')
+        return JobResult(scraper_class, host, 'success' if result else 'empty', duration, result=result)
+
+    def _host_still_busy(self, scraper_class: type, host: str, waited: float) -> JobResult:
+        """Give up on a job whose host never got its slot back from a timed-out job"""
+        error = f"{host} still busy with a timed-out job after {waited:.1f}s"
+        logger.warning(f"⏱️  {job_name(scraper_class)} not run: {error}")
+        if self.on_timeout:
+            try:
+                self.on_timeout(scraper_class, waited)
+            except Exception as e:
+                logger.error(f"Timeout callback failed for {job_name(scraper_class)}: {e}")
+        return JobResult(scraper_class, host, 'timeout', waited, error=error)
+
+    def run(self, scraper_classes: List[type]) -> List[JobResult]:
+        """
+        Run all scrapers and wait for completion
+
+        Jobs are only dispatched when their host has a free slot, so a busy
+        host never blocks a worker that could be serving another provider.
+        A slot held by a timed-out job's thread is waited for up to `timeout`;
+        jobs still blocked after that are reported as timeouts without running.
+
+        Returns:
+            One JobResult per scraper class, in completion order
+        """
+        pending: Deque[tuple] = deque((cls, self.host_resolver(cls)) for cls in scraper_classes)
+        active_per_host: Dict[str, int] = {}
+        results: List[JobResult] = []
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="engine") as pool:
+            running = {}
+            while pending or running:
+                # Dispatch every job whose host has capacity, up to the pool size
+                deferred: Deque[tuple] = deque()
+                with self._slots:
+                    while pending and len(running) < self.workers:
+                        cls, host = pending.popleft()
+                        if self._busy(host, active_per_host):
+                            deferred.append((cls, host))
+                            continue
+                        active_per_host[host] = active_per_host.get(host, 0) + 1
+                        running[pool.submit(self._execute, cls, host)] = host
+                    pending.extendleft(reversed(deferred))
+                    waiting_on_abandoned = bool(deferred and self._abandoned)
+
+                if running:
+                    timeout = ABANDONED_POLL_SECONDS if waiting_on_abandoned else None
+                    done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        host = running.pop(future)
+                        active_per_host[host] -= 1
+                        results.append(future.result())
+                    continue
+
+                # Nothing running: every pending host is held by an abandoned thread
+                blocked_at = time.time()
+                with self._slots:
+                    freed = self._slots.wait_for(
+                        lambda: any(not self._busy(host, active_per_host) for _, host in pending),
+                        timeout=self.timeout,
+                    )
+                if not freed:
+                    while pending:
+                        cls, host = pending.popleft()
+                        results.append(self._host_still_busy(cls, host, time.time() - blocked_at))
+
+        return results
@@ -0,0 +1,214 @@
+"""
+Run Exporter
+------------
+Writes the provider models of a pipeline run to local files for analysis.
+Handles:
+1. A stable column schema derived from the pydantic models (field order, types)
+2. Streaming CSV and NDJSON, appended per run (one row per plan/provider per snapshot)
+3. Columnar Parquet via pyarrow, one file per run in a per-table dataset directory
+4. Header checks: a CSV written with an older schema is rotated, never mixed
+"""
+import csv
+import enum
+import json
+import logging
+import os
+import typing
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .config import OUTPUT_JSON_PATH, OUTPUT_CSV_PATH, OUTPUT_PARQUET_DIR, EXPORT_FORMATS
+from .models import HostingProvider, VPNProvider
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    pa = pq = None
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+FORMATS = ('csv', 'ndjson', 'parquet')
+# Export name per model (file suffix / dataset directory)
+TABLES: Dict[Type[BaseModel], str] = {HostingProvider: 'hosting', VPNProvider: 'vpn'}
+SNAPSHOT_COLUMN = 'snapshot_at'
+
+# Column kinds: 'string', 'float', 'int', 'bool', 'timestamp', 'date', 'list' (of strings), 'json'
+Column = Tuple[str, str]
+
+
+def _kind(annotation: Any) -> str:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _kind(args[0]) if len(args) == 1 else 'json'
+    if origin in (list, List, tuple, set):
+        return 'list'
+    if origin in (dict, Dict):
+        return 'json'
+    if isinstance(annotation, type):
+        if issubclass(annotation, bool):
+            return 'bool'
+        if issubclass(annotation, enum.Enum):
+            return 'string'
+        if issubclass(annotation, int):
+            return 'int'
+        if issubclass(annotation, float):
+            return 'float'
+        if issubclass(annotation, datetime):
+            return 'timestamp'
+        if issubclass(annotation, date):
+            return 'date'
+    return 'string'
+
+
+def model_schema(model: Type[BaseModel]) -> List[Column]:
+    """[(column, kind)] in model field order, after the snapshot timestamp"""
+    return [(SNAPSHOT_COLUMN, 'timestamp')] + [
+        (name, _kind(field.annotation)) for name, field in model.model_fields.items()
+    ]
+
+
+def arrow_schema(model: Type[BaseModel]) -> 'pa.Schema':
+    types = {
+        'string': pa.string(), 'float': pa.float64(), 'int': pa.int64(), 'bool': pa.bool_(),
+        'timestamp': pa.timestamp('us'), 'date': pa.date32(), 'list': pa.list_(pa.string()),
+        'json': pa.string(),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in model_schema(model)])
+
+
+def _records(items: Iterable[BaseModel], schema: List[Column], snapshot_at: datetime) -> Iterable[Dict[str, Any]]:
+    """Python values per column; 'json' columns are encoded, lists keep their items as strings"""
+    for item in items:
+        data = item.model_dump()
+        data[SNAPSHOT_COLUMN] = snapshot_at
+        row = {}
+        for name, kind in schema:
+            value = data.get(name)
+            if isinstance(value, enum.Enum):
+                value = value.value
+            if value is not None:
+                if kind == 'json':
+                    value = json.dumps(value, sort_keys=True, default=str)
+                elif kind == 'list':
+                    value = [str(v) for v in value]
+            row[name] = value
+        yield row
+
+
+def _text(value: Any) -> Any:
+    """CSV cell: ISO dates, JSON lists, empty for None"""
+    if value is None:
+        return ''
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, list):
+        return json.dumps(value)
+    return value
+
+
+def _table_path(base: str, table: str, suffix: Optional[str] = None) -> Path:
+    """'data/providers_data.csv' + 'hosting' -> <root>/data/providers_data_hosting.csv"""
+    path = Path(base) if Path(base).is_absolute() else PROJECT_ROOT / base
+    return path.with_name(f"{path.stem}_{table}{suffix or path.suffix}")
+
+
+def append_csv(path: Path, rows: Iterable[Dict[str, Any]], schema: List[Column]) -> int:
+    """Stream rows into a CSV, writing the header for a new file (older schemas are rotated)"""
+    header = [name for name, _ in schema]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        with open(path, newline='') as f:
+            existing = next(csv.reader(f), None)
+        if existing != header:
+            rotated = path.with_name(f"{path.stem}.{datetime.now():%Y%m%dT%H%M%S}{path.suffix}")
+            logger.warning(f"{path.name} has a different schema, moved to {rotated.name}")
+            os.replace(path, rotated)
+    new_file = not path.exists()
+    count = 0
+    with open(path, 'a', newline='') as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(header)
+        for row in rows:
+            writer.writerow([_text(row[name]) for name in header])
+            count += 1
+    return count
+
+
+def append_ndjson(path: Path, rows: Iterable[Dict[str, Any]]) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(path, 'a') as f:
+        for row in rows:
+            f.write(json.dumps(row, default=_text, separators=(',', ':')))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def write_parquet(directory: Path, rows: List[Dict[str, Any]], model: Type[BaseModel], snapshot_at: datetime) -> Path:
+    """One Parquet file per run; read the directory as a dataset for history"""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{snapshot_at:%Y%m%dT%H%M%S}.parquet"
+    table = pa.Table.from_pylist(rows, schema=arrow_schema(model))
+    tmp = path.with_suffix('.tmp')
+    pq.write_table(table, tmp, compression='zstd')
+    os.replace(tmp, path)
+    return path
+
+
+def export_run(
+    items: Iterable[BaseModel],
+    formats: Optional[Iterable[str]] = None,
+    snapshot_at: Optional[datetime] = None,
+) -> str:
+    """
+    Append a run's providers to the configured exports
+
+    Args:
+        items: HostingProvider / VPNProvider results of the run
+        formats: Subset of FORMATS (default: EXPORT_FORMATS from config)
+        snapshot_at: Run timestamp stored with every row (default: now)
+
+    Returns:
+        One-line summary for the pipeline log
+    """
+    formats = [f.strip() for f in (formats if formats is not None else EXPORT_FORMATS.split(',')) if f.strip()]
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown export formats: {', '.join(sorted(unknown))}")
+    if 'parquet' in formats and not HAS_PYARROW:
+        logger.warning("pyarrow is not installed, skipping the Parquet export")
+        formats = [f for f in formats if f != 'parquet']
+    snapshot_at = snapshot_at or datetime.now()
+
+    by_model: Dict[Type[BaseModel], List[BaseModel]] = {}
+    for item in items:
+        by_model.setdefault(type(item), []).append(item)
+
+    written = []
+    for model, table in TABLES.items():
+        models = by_model.get(model)
+        if not models:
+            continue
+        schema = model_schema(model)
+        rows = list(_records(models, schema, snapshot_at))
+        if 'csv' in formats:
+            append_csv(_table_path(OUTPUT_CSV_PATH, table), rows, schema)
+        if 'ndjson' in formats:
+            append_ndjson(_table_path(OUTPUT_JSON_PATH, table, '.ndjson'), rows)
+        if 'parquet' in formats:
+            base = Path(OUTPUT_PARQUET_DIR) if Path(OUTPUT_PARQUET_DIR).is_absolute() else PROJECT_ROOT / OUTPUT_PARQUET_DIR
+            write_parquet(base / table, rows, model, snapshot_at)
+        written.append(f"{len(rows)} {table}")
+    if not written:
+        return "Export: nothing to write"
+    return f"Export ({', '.join(formats) or 'none'}): {', '.join(written)} rows"
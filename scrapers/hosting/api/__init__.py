@@ -0,0 +1,69 @@
+"""
+Hosting API Clients
+-------------------
+Provider APIs (cloud plan catalogs) run as pipeline jobs next to the HTML scrapers.
+Handles:
+1. The client list, with the scrapers/config.py settings holding each one's credentials
+2. Pipeline entries for the clients whose credentials are set, shaped like
+   manifest entries so the engine schedules them under the same worker pool,
+   per-host caps and timeouts
+3. Binding credentials at load time, so the job runs like a scraper: construct, run()
+
+An API job reports as "<Provider> API": its status row never overwrites the
+HTML scraper of the same provider (e.g. DreamHost).
+"""
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from ...scraper_manifest import ScraperEntry
+
+
+@dataclass(frozen=True)
+class APIClientEntry(ScraperEntry):
+    """Pipeline job for one API client (credentials are read from config when it runs)"""
+    key_setting: str = ''
+    secret_setting: Optional[str] = None
+
+    def credentials(self) -> Tuple[str, Optional[str]]:
+        from ... import config
+        secret = getattr(config, self.secret_setting, '') if self.secret_setting else None
+        return getattr(config, self.key_setting, ''), secret or None
+
+    def load(self) -> Callable[[], object]:
+        """The client class with its credentials bound, called with no arguments like a scraper class"""
+        client_class = super().load()
+        api_key, api_secret = self.credentials()
+        provider_name = self.provider_name
+
+        def client():
+            instance = client_class(api_key, api_secret)
+            instance.provider_name = provider_name
+            return instance
+
+        return client
+
+
+def _entry(provider: str, module: str, class_name: str, host: str,
+           key_setting: str, secret_setting: Optional[str] = None) -> APIClientEntry:
+    return APIClientEntry(f"{provider} API", 'hosting', f"{__name__}.{module}", class_name, host,
+                          key_setting, secret_setting)
+
+
+# Hosts match each client's BASE_URL (per-host caps, RATE_LIMIT_HOSTS)
+API_CLIENTS = (
+    _entry('DigitalOcean', 'digitalocean', 'DigitalOceanClient', 'api.digitalocean.com', 'DIGITALOCEAN_API_KEY'),
+    _entry('Vultr', 'vultr', 'VultrClient', 'api.vultr.com', 'VULTR_API_KEY'),
+    _entry('Linode', 'linode', 'LinodeClient', 'api.linode.com', 'LINODE_API_KEY'),
+    _entry('Cloudways', 'cloudways', 'CloudwaysClient', 'api.cloudways.com', 'CLOUDWAYS_API_KEY', 'CLOUDWAYS_EMAIL'),
+    _entry('Kinsta', 'kinsta', 'KinstaClient', 'api.kinsta.com', 'KINSTA_API_KEY'),
+    _entry('GoDaddy', 'godaddy', 'GoDaddyClient', 'api.godaddy.com', 'GODADDY_API_KEY', 'GODADDY_API_SECRET'),
+    _entry('DreamHost', 'dreamhost', 'DreamHostClient', 'api.dreamhost.com', 'DREAMHOST_API_KEY'),
+    _entry('Liquid Web', 'liquidweb', 'LiquidWebClient', 'cart.liquidweb.com', 'LIQUIDWEB_API_KEY'),
+    _entry('Namecheap', 'namecheap', 'NamecheapClient', 'api.namecheap.com', 'NAMECHEAP_API_KEY'),
+    _entry('WP Engine', 'wpengine', 'WPEngineClient', 'wpengineapi.com', 'WPENGINE_API_KEY'),
+)
+
+
+def configured_clients() -> List[APIClientEntry]:
+    """API clients whose credentials are set (no client module is imported)"""
+    return [entry for entry in API_CLIENTS if entry.credentials()[0]]
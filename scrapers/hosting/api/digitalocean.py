@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 
 class DigitalOceanClient(BaseAPIClient):
     BASE_URL = "https://api.digitalocean.com/v2"
+    PER_PAGE = 200  # API maximum
     
     def _setup_auth_headers(self):
         self.session.headers.update({
@@ -16,16 +17,19 @@ class DigitalOceanClient(BaseAPIClient):
             'Content-Type': 'application/json'
         })
     
+    def page_count(self, data: dict) -> int:
+        return self.pages_for((data.get('meta') or {}).get('total'), self.PER_PAGE)
+    
     def get_plans(self) -> List[HostingProvider]:
-        """Get plans from DigitalOcean"""
+        """Get plans from DigitalOcean (every page of /sizes)"""
         plans = []
-        data = self.make_request(f"{self.BASE_URL}/sizes")
+        sizes = list(self.iter_pages(f"{self.BASE_URL}/sizes", 'sizes'))
         
-        if not data or 'sizes' not in data:
+        if not sizes:
             logger.warning("DigitalOcean API returned no data")
             return plans
         
-        for size in data.get('sizes', []):
+        for size in sizes:
             if not size.get('available'):
                 continue
             
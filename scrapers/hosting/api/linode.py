@@ -9,6 +9,8 @@ logger = logging.getLogger(__name__)
 
 class LinodeClient(BaseAPIClient):
     BASE_URL = "https://api.linode.com/v4"
+    PER_PAGE_PARAM = 'page_size'
+    PER_PAGE = 500  # API maximum
     
     def _setup_auth_headers(self):
         self.session.headers.update({
@@ -16,7 +18,41 @@ class LinodeClient(BaseAPIClient):
             'Content-Type': 'application/json'
         })
     
+    def page_count(self, data: dict) -> int:
+        return int(data.get('pages') or 1)
+    
     def get_plans(self) -> List[HostingProvider]:
-        """Get plans from Linode"""
-        logger.warning("Linode API client placeholder - not fully implemented")
-        return []
+        """Get plans from Linode (every page of /linode/types)"""
+        plans = []
+        types = list(self.iter_pages(f"{self.BASE_URL}/linode/types", 'data'))
+        
+        if not types:
+            logger.warning("Linode API returned no data")
+            return plans
+        
+        for linode_type in types:
+            try:
+                price = (linode_type.get('price') or {}).get('monthly') or 0.0
+                plan = HostingProvider(
+                    provider_name='Linode',
+                    provider_type='cloud',
+                    plan_name=linode_type.get('id', 'unknown'),
+                    pricing_monthly=price,
+                    pricing_yearly=price * 12,
+                    storage_gb=linode_type.get('disk', 0) // 1024,  # MB
+                    bandwidth=f"{linode_type.get('transfer', 0) / 1000:g} TB/month",  # MB
+                    ram_mb=linode_type.get('memory', 0),
+                    cpu_cores=linode_type.get('vcpus', 0),
+                    free_domain=False,
+                    free_ssl=True,
+                    uptime_guarantee=99.9,
+                    money_back_days=0,
+                    control_panel='Akamai Cloud Manager',
+                    website_url="https://www.linode.com",
+                    last_updated=datetime.now()
+                )
+                plans.append(plan)
+            except Exception as e:
+                logger.warning(f"Error processing type: {e}")
+        
+        return plans
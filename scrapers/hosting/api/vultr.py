@@ -2,13 +2,15 @@
 from ..base_api_client import BaseAPIClient
 from ...models import HostingProvider
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 class VultrClient(BaseAPIClient):
     BASE_URL = "https://api.vultr.com"
+    PAGE_PARAM = None  # cursor pagination
+    PER_PAGE = 500  # API maximum
     
     def _setup_auth_headers(self):
         self.session.headers.update({
@@ -16,7 +18,45 @@ class VultrClient(BaseAPIClient):
             'Content-Type': 'application/json'
         })
     
+    def next_cursor(self, data: dict) -> Optional[str]:
+        return ((data.get('meta') or {}).get('links') or {}).get('next') or None
+    
     def get_plans(self) -> List[HostingProvider]:
-        """Get plans from Vultr"""
-        logger.warning("Vultr API client placeholder - not fully implemented")
-        return []
+        """Get plans from Vultr (every page of /v2/plans)"""
+        plans = []
+        vultr_plans = list(self.iter_pages(f"{self.BASE_URL}/v2/plans", 'plans'))
+        
+        if not vultr_plans:
+            logger.warning("Vultr API returned no data")
+            return plans
+        
+        for vultr_plan in vultr_plans:
+            # Plans deployable nowhere are retired
+            if not vultr_plan.get('locations'):
+                continue
+            
+            try:
+                price = vultr_plan.get('monthly_cost', 0.0)
+                plan = HostingProvider(
+                    provider_name='Vultr',
+                    provider_type='cloud',
+                    plan_name=vultr_plan.get('id', 'unknown'),
+                    pricing_monthly=price,
+                    pricing_yearly=price * 12,
+                    storage_gb=vultr_plan.get('disk', 0) * max(1, vultr_plan.get('disk_count', 1)),
+                    bandwidth=f"{vultr_plan.get('bandwidth', 0)} GB/month",
+                    ram_mb=vultr_plan.get('ram', 0),
+                    cpu_cores=vultr_plan.get('vcpu_count', 0),
+                    free_domain=False,
+                    free_ssl=True,
+                    uptime_guarantee=100.0,
+                    money_back_days=0,
+                    control_panel='Vultr Customer Portal',
+                    website_url="https://www.vultr.com",
+                    last_updated=datetime.now()
+                )
+                plans.append(plan)
+            except Exception as e:
+                logger.warning(f"Error processing plan: {e}")
+        
+        return plans
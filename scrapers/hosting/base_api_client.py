@@ -1,23 +1,70 @@
-"""Base API client class for hosting providers"""
+"""
+Base API client class for hosting providers
+Handles:
+1. One keep-alive connection pool shared by every client (shared_adapter)
+2. Retries with exponential backoff and full jitter on network errors, 429 and 5xx
+3. Rate-limit headers: Retry-After and exhausted RateLimit-Remaining pause the
+   whole API host through its shared token bucket
+4. iter_pages(): every item of a paginated list endpoint, pages after the first
+   fetched in parallel (page-number APIs) or followed in order (cursor APIs)
+"""
+import contextvars
+import json
+import math
+import random
+import threading
+import time
 import requests
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+from requests.adapters import HTTPAdapter
+from .. import metrics
 from ..models import HostingProvider
-from ..config import REQUEST_TIMEOUT, MAX_RETRIES
+from ..config import (
+    REQUEST_TIMEOUT, MAX_RETRIES, API_PAGE_WORKERS, API_POOL_MAXSIZE, API_BACKOFF_BASE, API_BACKOFF_MAX,
+)
+from ..utils.rate_limiter import get_rate_limiter, parse_rate_limit_reset, parse_retry_after
+from ..utils.replay import Recording, get_replay_store
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_adapter: Optional[HTTPAdapter] = None
+_adapter_lock = threading.Lock()
+
+
+def shared_adapter() -> HTTPAdapter:
+    """Transport mounted on every client session: one connection pool per API host, process-wide"""
+    global _adapter
+    if _adapter is None:
+        with _adapter_lock:
+            if _adapter is None:
+                # Retries are ours (backoff + rate-limit headers), not urllib3's
+                _adapter = HTTPAdapter(pool_connections=16, pool_maxsize=API_POOL_MAXSIZE, max_retries=0)
+    return _adapter
+
+
+def _retryable(status: int) -> bool:
+    return status == 429 or status >= 500
+
 
 class BaseAPIClient(ABC):
     """Base class for hosting provider API clients"""
-    
+
+    # Pagination of list endpoints (see iter_pages); PAGE_PARAM = None means cursor pagination
+    PAGE_PARAM: Optional[str] = 'page'
+    PER_PAGE_PARAM: Optional[str] = 'per_page'
+    PER_PAGE = 200
+    CURSOR_PARAM = 'cursor'
+
+    # Set by the pipeline job (see scrapers.hosting.api), as for scrapers
+    provider_name = "Unknown"
+
     def __init__(self, api_key: str, api_secret: Optional[str] = None):
         """
         Initialize API client
-        
+
         Args:
             api_key: API key for authentication
             api_secret: Optional API secret for authentication
@@ -25,61 +72,201 @@ class BaseAPIClient(ABC):
         self.api_key = api_key
         self.api_secret = api_secret
         self.session = requests.Session()
+        adapter = shared_adapter()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.timeout = REQUEST_TIMEOUT
         self.max_retries = MAX_RETRIES
+        self.backoff_base = API_BACKOFF_BASE
+        self.backoff_max = API_BACKOFF_MAX
         self._setup_auth_headers()
-    
+
     @abstractmethod
     def _setup_auth_headers(self):
         """Set up authentication headers (provider-specific)"""
         pass
-    
+
     @abstractmethod
     def get_plans(self) -> List[HostingProvider]:
         """
         Get all hosting plans from API
-        
+
         Returns:
             List of HostingProvider objects
         """
         pass
-    
+
     def make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[dict]:
         """
         Make HTTP request to API with retry logic
-        
+
+        Network errors, 429 and 5xx are retried after a jittered exponential
+        backoff, or after the server's Retry-After; other 4xx fail at once.
+
         Args:
             url: API endpoint URL
             method: HTTP method (GET, POST, etc.)
             **kwargs: Additional arguments for requests
-        
+
         Returns:
             JSON response as dict or None if failed
         """
+        replay = get_replay_store()
+        request_body = kwargs.get('json', kwargs.get('data'))
+        if replay is not None and replay.replaying:
+            recording = replay.get(method, url, kwargs.get('params'), request_body)
+            time.sleep(replay.delay())
+            if recording is None or recording.status >= 400:
+                return None
+            return json.loads(recording.body)
+
+        limiter = get_rate_limiter(url)
         for attempt in range(self.max_retries):
+            retry_after = None
+            with metrics.span('rate_limit'):
+                limiter.wait()
             try:
                 logger.info(f"{method} {url} (attempt {attempt + 1}/{self.max_retries})")
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    timeout=self.timeout,
-                    **kwargs
-                )
-                response.raise_for_status()
-                return response.json()
-                
+                metrics.incr('api_requests')
+                with metrics.span('network'):
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        timeout=self.timeout,
+                        **kwargs
+                    )
             except requests.RequestException as e:
+                metrics.incr('api_network_errors')
                 logger.warning(f"API request error: {e}")
-                if attempt == self.max_retries - 1:
-                    logger.error(f"Failed after {self.max_retries} attempts")
+            else:
+                if replay is not None:
+                    replay.put(
+                        Recording(method.upper(), url, response.status_code, response.text, dict(response.headers)),
+                        kwargs.get('params'), request_body,
+                    )
+                # Quota used up: hold every request to this host until the window resets
+                reset = parse_rate_limit_reset(response.headers)
+                if reset:
+                    limiter.defer(reset)
+                if response.status_code < 400:
+                    try:
+                        return response.json()
+                    except ValueError as e:
+                        logger.error(f"Invalid JSON from {url}: {e}")
+                        return None
+                if not _retryable(response.status_code):
+                    metrics.incr('api_errors')
+                    logger.error(f"API error {response.status_code} for {url}")
                     return None
-        
+                metrics.incr('api_throttled' if response.status_code == 429 else 'api_errors')
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is None and response.status_code == 429:
+                    retry_after = reset
+                logger.warning(f"API returned {response.status_code} for {url}")
+
+            if attempt == self.max_retries - 1:
+                logger.error(f"Failed after {self.max_retries} attempts")
+                return None
+            self._backoff(attempt, limiter, retry_after)
+
         return None
-    
+
+    def _backoff(self, attempt: int, limiter, retry_after: Optional[float] = None):
+        """Wait before retry `attempt + 1`"""
+        if retry_after is not None:
+            # Server said when: block the host (parallel pages too); the next wait() sleeps it off
+            limiter.defer(retry_after)
+            return
+        # Full jitter: uniform(0, base * 2^attempt), capped
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        with metrics.span('backoff'):
+            time.sleep(delay)
+
+    def page_count(self, data: Dict[str, Any]) -> int:
+        """Total pages, read from the first page's response (page-number APIs)"""
+        return 1
+
+    def next_cursor(self, data: Dict[str, Any]) -> Optional[str]:
+        """Cursor of the next page, or None on the last page (cursor APIs)"""
+        return None
+
+    def iter_pages(self, url: str, items_key: str, params: Optional[dict] = None) -> Iterator[dict]:
+        """
+        Every item of a paginated list endpoint, in API order
+
+        Page-number APIs: page 1 tells page_count(), the rest are fetched in
+        parallel (API_PAGE_WORKERS threads, same session and host rate limit).
+        Cursor APIs follow next_cursor() one page at a time. A page that still
+        fails after retries is logged and skipped.
+
+        Args:
+            url: List endpoint URL
+            items_key: Key of the item list in each page ('sizes', 'data', ...)
+            params: Extra query parameters for every page
+        """
+        params = dict(params or {})
+        if self.PER_PAGE_PARAM:
+            params[self.PER_PAGE_PARAM] = self.PER_PAGE
+        if self.PAGE_PARAM is None:
+            yield from self._iter_cursor(url, items_key, params)
+            return
+
+        first = self.make_request(url, params={**params, self.PAGE_PARAM: 1})
+        if first is None:
+            return
+        yield from first.get(items_key) or []
+        pages = self.page_count(first)
+        if pages <= 1:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(API_PAGE_WORKERS, pages - 1)),
+                                thread_name_prefix="api-pages") as pool:
+            # copy_context: page requests count towards the calling scraper's metrics
+            futures = [
+                pool.submit(contextvars.copy_context().run, self.make_request, url,
+                            params={**params, self.PAGE_PARAM: page})
+                for page in range(2, pages + 1)
+            ]
+            for page, future in enumerate(futures, start=2):
+                data = future.result()
+                if data is None:
+                    metrics.incr('api_page_errors')
+                    logger.warning(f"{self.__class__.__name__}: page {page}/{pages} of {url} failed, skipped")
+                    continue
+                yield from data.get(items_key) or []
+
+    def _iter_cursor(self, url: str, items_key: str, params: dict) -> Iterator[dict]:
+        seen = set()
+        cursor = None
+        while True:
+            data = self.make_request(url, params={**params, self.CURSOR_PARAM: cursor} if cursor else params)
+            if data is None:
+                if cursor:
+                    metrics.incr('api_page_errors')
+                    logger.warning(f"{self.__class__.__name__}: page after cursor {cursor} of {url} failed, stopping")
+                return
+            yield from data.get(items_key) or []
+            seen.add(cursor)
+            cursor = self.next_cursor(data)
+            if not cursor or cursor in seen:
+                return
+
+    @staticmethod
+    def pages_for(total: Any, per_page: int) -> int:
+        """Page count from an item total (APIs that report only the total)"""
+        try:
+            return max(1, math.ceil(int(total) / per_page))
+        except (TypeError, ValueError):
+            return 1
+
+    def run(self) -> List[HostingProvider]:
+        """Pipeline entry point, same contract as a hosting scraper's run()"""
+        return self.collect_data()
+
     def collect_data(self) -> List[HostingProvider]:
         """
         Main collection method
-        
+
         Returns:
             List of HostingProvider objects
         """
@@ -88,7 +275,7 @@ class BaseAPIClient(ABC):
             plans = self.get_plans()
             logger.info(f"✅ Successfully collected {len(plans)} plans from {self.__class__.__name__}")
             return plans
-            
+
         except Exception as e:
             logger.error(f"❌ Error collecting from {self.__class__.__name__}: {e}")
             return []
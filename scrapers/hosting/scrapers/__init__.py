@@ -1,38 +1,22 @@
-"""Hosting scrapers — 25 verified providers with real data"""
-from .bluehost import BluehostScraper
-from .hostgator import HostGatorScraper
-from .siteground import SiteGroundScraper
-from .inmotionhosting import InMotionHostingScraper
-from .greengeeks import GreenGeeksScraper
-from .hostinger import HostingerScraper
-from .godaddy import GoDaddyScraper
-from .dreamhost import DreamHostScraper
-from .namecheap import NamecheapScraper
-from .banahosting import BanaHostingScraper
-from .a2hosting import A2HostingScraper
-from .hostarmada import HostArmadaScraper
-from .fastcomet import FastCometScraper
-from .scalahosting import ScalaHostingScraper
-from .interserver import InterServerScraper
-from .hostpapa import HostPapaScraper
-from .ionos import IONOSScraper
-from .hostwinds import HostwindsScraper
-from .chemicloud import ChemiCloudScraper
-from .wpengine import WPEngineScraper
-from .kinsta import KinstaScraper
-from .cloudways import CloudwaysScraper
-from .tmdhosting import TMDHostingScraper
-from .namehero import NameHeroScraper
-from .verpex import VerpexScraper
+"""Hosting scrapers — hand-written modules go here; every other provider in
+data/verified_data.json is served by the generic registry scraper"""
+import importlib
 
-__all__ = [
-    'BluehostScraper', 'HostGatorScraper', 'SiteGroundScraper',
-    'InMotionHostingScraper', 'GreenGeeksScraper', 'HostingerScraper',
-    'GoDaddyScraper', 'DreamHostScraper', 'NamecheapScraper',
-    'BanaHostingScraper', 'A2HostingScraper', 'HostArmadaScraper',
-    'FastCometScraper', 'ScalaHostingScraper', 'InterServerScraper',
-    'HostPapaScraper', 'IONOSScraper', 'HostwindsScraper',
-    'ChemiCloudScraper', 'WPEngineScraper', 'KinstaScraper',
-    'CloudwaysScraper', 'TMDHostingScraper', 'NameHeroScraper',
-    'VerpexScraper'
-]
+# Class name -> module of hand-written scrapers, imported on first access (PEP 562)
+_MODULES = {}
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(f'.{_MODULES[name]}', __name__), name)
+    if name.endswith('Scraper') and not name.startswith('_'):
+        from ...registry_scraper import scraper_class
+        try:
+            return scraper_class('hosting', name)
+        except KeyError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODULES))
@@ -0,0 +1,207 @@
+"""
+Local Provider Store
+--------------------
+SQLite write-through cache in front of Supabase (DATABASE_PATH).
+Handles:
+1. Accepting every pipeline write locally first (WAL mode, one small transaction per row)
+2. Dirty tracking: a row is dirty until the content hash last replicated matches its current hash,
+   and again when rewritten more than LOCAL_STORE_REFRESH_HOURS after its last replication
+   (the hash leaves out last_updated, which must still reach Supabase now and then)
+3. Bulk replication of dirty rows through a BatchWriter; failed rows stay dirty for the next run
+4. Local reads and lookups indexed on provider_name / plan_name (no network round trip)
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import DATABASE_PATH, LOCAL_STORE_REFRESH_HOURS
+from .sync_manifest import content_hash, row_key
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    table_name    TEXT NOT NULL,
+    row_key       TEXT NOT NULL,
+    on_conflict   TEXT NOT NULL,
+    provider_name TEXT,
+    plan_name     TEXT,
+    label         TEXT,
+    payload       TEXT NOT NULL,
+    content_hash  TEXT NOT NULL,
+    synced_hash   TEXT,
+    synced_at     REAL,
+    updated_at    REAL NOT NULL,
+    PRIMARY KEY (table_name, row_key)
+);
+CREATE INDEX IF NOT EXISTS rows_provider ON rows (table_name, provider_name, plan_name);
+CREATE INDEX IF NOT EXISTS rows_dirty ON rows (table_name) WHERE synced_hash IS NOT content_hash;
+"""
+
+# (table, row key, content hash) of a row handed to the writer
+Queued = Tuple[str, str, str]
+
+
+class LocalStore:
+    """Rows of every Supabase table the pipeline writes, plus their replication state"""
+
+    def __init__(self, path: Path, refresh_after: float = LOCAL_STORE_REFRESH_HOURS * 3600):
+        """
+        Args:
+            path: SQLite database file (':memory:' for a throwaway store)
+            refresh_after: Seconds after which an unchanged row is replicated again when rewritten
+        """
+        self.path = Path(path)
+        self.refresh_after = refresh_after
+        if str(path) != ':memory:':
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        # Databases created before synced_at existed
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(rows)")}
+        if 'synced_at' not in columns:
+            self._conn.execute("ALTER TABLE rows ADD COLUMN synced_at REAL")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def put(self, table: str, payload: Dict[str, Any], on_conflict: str, label: Optional[str] = None) -> bool:
+        """
+        Upsert a row locally
+
+        An unchanged row replicated more than refresh_after seconds ago is
+        made dirty again, so its new last_updated is written too.
+
+        Returns:
+            True if the row is new or its content changed
+        """
+        key = row_key(payload, on_conflict)
+        digest = content_hash(payload)
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT content_hash FROM rows WHERE table_name = ? AND row_key = ?", (table, key)
+            ).fetchone()
+            self._conn.execute(
+                """INSERT INTO rows (table_name, row_key, on_conflict, provider_name, plan_name, label,
+                                     payload, content_hash, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (table_name, row_key) DO UPDATE SET
+                       on_conflict = excluded.on_conflict, label = excluded.label,
+                       payload = excluded.payload, content_hash = excluded.content_hash,
+                       updated_at = excluded.updated_at,
+                       synced_hash = CASE WHEN rows.synced_at IS NULL OR rows.synced_at < ?
+                                          THEN NULL ELSE rows.synced_hash END""",
+                (table, key, on_conflict, payload.get('provider_name'), payload.get('plan_name'),
+                 label, json.dumps(payload, default=str), digest, now, now - self.refresh_after),
+            )
+        return previous is None or previous[0] != digest
+
+    def get(self, table: str, provider_name: str, plan_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """One row by provider (and plan for hosting_providers)"""
+        query = "SELECT payload FROM rows WHERE table_name = ? AND provider_name = ?"
+        params: Tuple[Any, ...] = (table, provider_name)
+        if plan_name is not None:
+            query += " AND plan_name = ?"
+            params += (plan_name,)
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            result = self._conn.execute(
+                "SELECT payload FROM rows WHERE table_name = ? ORDER BY provider_name, plan_name", (table,)
+            ).fetchall()
+        return [json.loads(payload) for payload, in result]
+
+    def delete(self, table: str, provider_name: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM rows WHERE table_name = ? AND provider_name = ?", (table, provider_name)
+            ).rowcount
+
+    def dirty_count(self, tables: Optional[Iterable[str]] = None) -> int:
+        query, params = self._dirty_query("SELECT COUNT(*)", tables)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def _dirty_query(self, select: str, tables: Optional[Iterable[str]]) -> Tuple[str, tuple]:
+        query = f"{select} FROM rows WHERE synced_hash IS NOT content_hash"
+        params: tuple = ()
+        if tables is not None:
+            tables = tuple(tables)
+            query += f" AND table_name IN ({','.join('?' * len(tables))})"
+            params = tables
+        return query, params
+
+    def queue_dirty(self, writer, tables: Optional[Iterable[str]] = None) -> List[Queued]:
+        """
+        Hand every dirty row to a BatchWriter (call writer.flush() afterwards)
+
+        Returns:
+            What was queued, for mark_synced()
+        """
+        query, params = self._dirty_query(
+            "SELECT table_name, row_key, on_conflict, label, payload, content_hash", tables
+        )
+        with self._lock:
+            dirty = self._conn.execute(query + " ORDER BY table_name, row_key", params).fetchall()
+        queued = []
+        for table, key, on_conflict, label, payload, digest in dirty:
+            writer.add(table, json.loads(payload), on_conflict=on_conflict, label=label)
+            queued.append((table, key, digest))
+        return queued
+
+    def mark_synced(self, queued: List[Queued], failures: Iterable[Any] = ()):
+        """
+        Record queued rows as replicated, except the ones the database rejected
+
+        Args:
+            queued: From queue_dirty()
+            failures: BatchWriter RowErrors (table + payload)
+        """
+        with self._lock:
+            conflicts = dict(self._conn.execute("SELECT DISTINCT table_name, on_conflict FROM rows").fetchall())
+        failed = {
+            (f.table, row_key(f.payload, conflicts[f.table]))
+            for f in failures if f.table in conflicts
+        }
+        now = time.time()
+        synced = [(digest, now, table, key) for table, key, digest in queued if (table, key) not in failed]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE rows SET synced_hash = ?, synced_at = ? WHERE table_name = ? AND row_key = ?", synced
+            )
+            self._conn.execute("COMMIT")
+
+    def report(self) -> str:
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+        return f"Local store: {total} rows, {self.dirty_count()} awaiting replication ({self.path})"
+
+
+_store: Optional[LocalStore] = None
+_store_lock = threading.Lock()
+
+
+def get_local_store() -> LocalStore:
+    """Process-wide store at DATABASE_PATH (relative paths are under the project root)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = Path(DATABASE_PATH)
+                if not path.is_absolute():
+                    path = Path(__file__).parent.parent / path
+                _store = LocalStore(path)
+    return _store
@@ -0,0 +1,227 @@
+"""
+Scraper Run Metrics
+-------------------
+Lightweight timing spans and counters for the pipeline.
+Handles:
+1. Context-manager spans per phase (jitter, rate_limit, network, parse, ...)
+2. Per-scraper breakdowns: each phase gets its self time (nested spans are
+   subtracted), so a breakdown adds up to the scraper's wall time
+3. Process-wide histograms and counters, written as Prometheus text or JSON
+4. Carrying the current scraper across to the shared HTTP event loop (bind)
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Awaitable, Dict, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Histogram bucket upper bounds (seconds)
+BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class RunMetrics:
+    """Phase self-times and counters of one scraper run"""
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, phase: str, seconds: float):
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def breakdown(self) -> Dict[str, object]:
+        """JSON-friendly summary, e.g. {'network': 1.2, 'parse': 0.3, 'counters': {...}}"""
+        with self._lock:
+            summary: Dict[str, object] = {k: round(v, 3) for k, v in sorted(self.phases.items(), key=lambda kv: -kv[1])}
+            if self.counters:
+                summary['counters'] = dict(self.counters)
+            return summary
+
+
+class _Span:
+    __slots__ = ('phase', 'children')
+
+    def __init__(self, phase: str):
+        self.phase = phase
+        self.children = 0.0  # seconds spent in nested spans
+
+
+_current_run: ContextVar[Optional[RunMetrics]] = ContextVar('scraper_run', default=None)
+_current_span: ContextVar[Optional[_Span]] = ContextVar('scraper_span', default=None)
+
+
+class MetricsRegistry:
+    """Process-wide phase histograms and counters"""
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # phase -> [count per bucket..., +Inf count], sum, count
+        self._histograms: Dict[str, Dict[str, object]] = {}
+        self.counters: Dict[str, int] = {}
+
+    def observe(self, phase: str, seconds: float):
+        with self._lock:
+            hist = self._histograms.setdefault(
+                phase, {'buckets': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            )
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    hist['buckets'][i] += 1
+                    break
+            else:
+                hist['buckets'][-1] += 1
+            hist['sum'] += seconds
+            hist['count'] += 1
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.counters.clear()
+
+    def to_json(self) -> Dict[str, object]:
+        with self._lock:
+            phases = {}
+            for phase, hist in sorted(self._histograms.items()):
+                cumulative, total = {}, 0
+                for bound, n in zip([*map(str, self.buckets), '+Inf'], hist['buckets']):
+                    total += n
+                    cumulative[bound] = total
+                phases[phase] = {'count': hist['count'], 'sum': round(hist['sum'], 6), 'buckets': cumulative}
+            return {'phases': phases, 'counters': dict(sorted(self.counters.items()))}
+
+    def to_prometheus(self) -> str:
+        data = self.to_json()
+        lines = [
+            '# HELP scraper_phase_seconds Time spent per scraper phase',
+            '# TYPE scraper_phase_seconds histogram',
+        ]
+        for phase, hist in data['phases'].items():
+            for bound, n in hist['buckets'].items():
+                lines.append(f'scraper_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {n}')
+            lines.append(f'scraper_phase_seconds_sum{{phase="{phase}"}} {hist["sum"]}')
+            lines.append(f'scraper_phase_seconds_count{{phase="{phase}"}} {hist["count"]}')
+        lines += ['# HELP scraper_events_total Pipeline event counters', '# TYPE scraper_events_total counter']
+        for name, value in data['counters'].items():
+            lines.append(f'scraper_events_total{{event="{name}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: Path):
+        """Write to `path`: JSON for *.json, Prometheus text format otherwise"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp, 'w') as f:
+            if path.suffix == '.json':
+                json.dump(self.to_json(), f, indent=1)
+            else:
+                f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+    def report(self) -> str:
+        data = self.to_json()['phases']
+        top = sorted(data.items(), key=lambda kv: -kv[1]['sum'])[:5]
+        return "Phases: " + ", ".join(f"{phase} {h['sum']:.1f}s/{h['count']}" for phase, h in top) if top else "Phases: none"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    return _registry
+
+
+@contextmanager
+def span(phase: str) -> Iterator[None]:
+    """
+    Time a block as `phase`
+
+    The full duration goes into the process histogram; the current scraper's
+    breakdown gets the self time (minus nested spans).
+    """
+    parent = _current_span.get()
+    node = _Span(phase)
+    token = _current_span.set(node)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _current_span.reset(token)
+        if parent is not None:
+            parent.children += elapsed
+        _registry.observe(phase, elapsed)
+        run = _current_run.get()
+        if run is not None:
+            run.add(phase, max(0.0, elapsed - node.children))
+
+
+def record(phase: str, seconds: float):
+    """
+    Account work timed elsewhere (e.g. in a worker process) as `phase`
+
+    Nested like a span: the enclosing span's self time excludes it.
+    """
+    parent = _current_span.get()
+    if parent is not None:
+        parent.children += seconds
+    _registry.observe(phase, seconds)
+    run = _current_run.get()
+    if run is not None:
+        run.add(phase, seconds)
+
+
+def incr(name: str, amount: int = 1):
+    """Bump a counter for the process and the current scraper"""
+    _registry.incr(name, amount)
+    run = _current_run.get()
+    if run is not None:
+        run.incr(name, amount)
+
+
+@contextmanager
+def scraper_run(provider: str) -> Iterator[RunMetrics]:
+    """Attribute every span/counter inside the block (and bound coroutines) to `provider`"""
+    run = RunMetrics(provider)
+    run_token = _current_run.set(run)
+    span_token = _current_span.set(None)
+    try:
+        yield run
+    finally:
+        _current_span.reset(span_token)
+        _current_run.reset(run_token)
+
+
+def bind(coro: Awaitable[T]) -> Awaitable[T]:
+    """Wrap a coroutine so it runs under the caller's scraper and span on another loop/thread"""
+    run = _current_run.get()
+    parent = _current_span.get()
+    if run is None and parent is None:
+        return coro
+
+    async def bound():
+        run_token = _current_run.set(run)
+        span_token = _current_span.set(parent)
+        try:
+            return await coro
+        finally:
+            _current_span.reset(span_token)
+            _current_run.reset(run_token)
+
+    return bound()
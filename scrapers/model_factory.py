@@ -0,0 +1,86 @@
+"""
+Model Factory
+-------------
+Bulk construction of provider models from already-assembled row dicts.
+Handles:
+1. One TypeAdapter(List[Model]) call per scraper instead of one model __init__ per plan
+2. Verified specs checked field by field once (cached by content)
+3. Merging specs into the rows before construction (only values the model
+   rejects are still set afterwards, as before)
+
+model_construct() is deliberately not used: on these ~120-field models it fills
+defaults in Python and is slower than validating (see scripts/benchmark_models.py).
+"""
+import json
+import logging
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar('M', bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[M]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=None)
+def field_adapter(model: Type[BaseModel], name: str) -> TypeAdapter:
+    """Validator for one field, constraints (ge/le) included"""
+    field = model.model_fields[name]
+    return TypeAdapter(Annotated[field.annotation, field])
+
+
+@lru_cache(maxsize=256)
+def _split_specs(model: Type[BaseModel], encoded: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    specs = json.loads(encoded)
+    valid, unvalidated = {}, {}
+    for key, value in specs.items():
+        # Same rule as the old setattr pass: known fields with a truthy value only
+        if key not in model.model_fields or not value:
+            continue
+        try:
+            valid[key] = field_adapter(model, key).validate_python(value)
+        except ValidationError as e:
+            # Logged once per distinct specs dict (this function is cached)
+            logger.warning(f"Verified spec {key}={value!r} does not match the model, set as-is: {e.errors()[0]['msg']}")
+            unvalidated[key] = value
+    return valid, unvalidated
+
+
+def split_specs(model: Type[BaseModel], specs: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    (valid, unvalidated) spec values for `model`, checked once per distinct specs dict
+
+    Unvalidated values (e.g. web_server='Nginx + Apache') are still written, as
+    they always were: the registry is the truth source for these fields.
+    """
+    if not specs:
+        return {}, {}
+    valid, unvalidated = _split_specs(model, json.dumps(specs, sort_keys=True, default=str))
+    return dict(valid), dict(unvalidated)
+
+
+def build_models(model: Type[M], rows: List[Dict[str, Any]], specs: Optional[Dict[str, Any]] = None) -> List[M]:
+    """
+    Validate and construct every row in one call
+
+    Args:
+        rows: Field dicts, one per model
+        specs: Verified values that override the rows
+
+    Raises:
+        ValidationError: If any row is invalid (as model __init__ would)
+    """
+    valid, unvalidated = split_specs(model, specs)
+    if valid:
+        rows = [{**row, **valid} for row in rows]
+    models = list_adapter(model).validate_python(rows)
+    for instance in models:
+        for key, value in unvalidated.items():
+            setattr(instance, key, value)
+    return models
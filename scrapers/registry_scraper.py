@@ -0,0 +1,323 @@
+"""
+Registry Scraper
+----------------
+One data-driven scraper for every provider in data/verified_data.json that has
+no hand-written module.
+Handles:
+1. Plan rows / provider fields built from the provider's registry record
+   (the live price comes from selector_registry as for every adaptive scraper)
+2. Per-provider overrides, only where the old generated modules really differed
+3. One named scraper class per provider, created on first use, so the manifest,
+   status rows and per-host limits see the same scrapers as before
+4. A batched pass that builds every provider of a category in one validation call
+
+A hand-written module (e.g. scrapers/vpn/nordvpn.py) always wins: registry
+providers whose normalized name matches a scraper module file are skipped.
+
+Run the batched pass for one category:
+    python -m scrapers.registry_scraper hosting [--offline]
+"""
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set, Union
+
+from pydantic import ValidationError
+
+from . import metrics
+from .hosting.base_scraper import BaseHostingScraper
+from .model_factory import build_models
+from .models import HostingProvider, VPNProvider
+from .scraper_manifest import SCRAPER_PACKAGES
+from .verified_registry import get_registry, normalize_name, record_name
+from .vpn.base_scraper import BaseVPNScraper
+
+logger = logging.getLogger(__name__)
+
+# Registry name -> what this provider does differently from its category's default template
+OVERRIDES: Dict[str, Dict[str, Dict[str, str]]] = {
+    'hosting': {
+        # Scaffolded with the first template: fixed bandwidth and free domain
+        name: {'template': 'classic'}
+        for name in ('Bluehost', 'DreamHost', 'GoDaddy', 'GreenGeeks', 'HostGator',
+                     'Hostinger', 'InMotion Hosting', 'Namecheap', 'SiteGround')
+    },
+    'vpn': {
+        'ExpressVPN': {'template': 'adaptive'},
+        'Surfshark': {'template': 'adaptive'},
+        'CyberGhost': {'template': 'adaptive'},
+        'ProtonVPN': {'template': 'adaptive'},
+        'Private Internet Access': {'template': 'adaptive', 'provider_name': 'PIA', 'class_name': 'PIAScraper'},
+        'Hide.me': {'class_name': 'HideMeScraper'},
+    },
+}
+
+# 'flexible' / 'static' unless overridden
+DEFAULT_TEMPLATES = {'hosting': 'flexible', 'vpn': 'static'}
+
+# Feature sheet of the 'static' VPN template
+STATIC_VPN_FEATURES = {
+    'protocols': ['WireGuard', 'OpenVPN'],
+    'encryption': 'AES-256-GCM',
+    'has_kill_switch': True,
+    'has_split_tunneling': True,
+    'supports_streaming': True,
+    'supports_torrenting': True,
+    'no_logs_verified': True,
+    'warrant_canary': False,
+    'open_source_apps': False,
+    'simultaneous_connections': 10,
+}
+
+
+@dataclass(frozen=True)
+class RegistryProfile:
+    """Everything the generic scraper needs to know about one provider"""
+    provider_type: str  # 'hosting' or 'vpn'
+    record_name: str  # name in verified_data.json
+    provider_name: str  # name the scraper reports (models, status rows)
+    class_name: str  # e.g. 'BluehostScraper'
+    url: str
+    template: str
+
+
+def _dedicated(provider_type: str) -> Set[str]:
+    """Normalized stems of the hand-written scraper modules of a category"""
+    stems = set()
+    for ptype, _, directory in SCRAPER_PACKAGES:
+        if ptype != provider_type:
+            continue
+        for entry in os.scandir(directory):
+            if entry.name.endswith('.py') and entry.name != '__init__.py' and 'base_scraper' not in entry.name:
+                stems.add(normalize_name(entry.name[:-3]))
+    return stems
+
+
+def profiles(provider_type: str) -> List[RegistryProfile]:
+    """Registry providers of a category that the generic scraper serves, in registry order"""
+    dedicated = _dedicated(provider_type)
+    overrides = OVERRIDES.get(provider_type, {})
+    result = []
+    for record in get_registry().records(provider_type):
+        name = record_name(record)
+        override = overrides.get(name, {})
+        provider_name = override.get('provider_name', name)
+        if not name or {normalize_name(name), normalize_name(provider_name)} & dedicated:
+            continue
+        result.append(RegistryProfile(
+            provider_type=provider_type,
+            record_name=name,
+            provider_name=provider_name,
+            class_name=override.get('class_name', ''.join(c for c in name if c.isalnum()) + 'Scraper'),
+            url=record.get('url', ''),
+            template=override.get('template', DEFAULT_TEMPLATES[provider_type]),
+        ))
+    return result
+
+
+def storage_gb(storage: Any) -> int:
+    """'100 GB NVMe' -> 100; no number in the first word ('Unlimited SSD') -> 999"""
+    first = (str(storage).split() or ['0'])[0]
+    digits = ''.join(filter(str.isdigit, first)) or '0'
+    return int(digits) if digits != '0' else 999
+
+
+def hosting_rows(profile: RegistryProfile, plans: List[Dict[str, Any]]) -> List[dict]:
+    """HostingProvider fields per registry plan"""
+    classic = profile.template == 'classic'
+    now = datetime.now()
+    return [
+        dict(
+            provider_name=profile.provider_name,
+            provider_type='shared',
+            plan_name=p['name'],
+            website_url=profile.url,
+            pricing_monthly=p['price'],
+            renewal_price=p['renewal'],
+            storage_gb=storage_gb(p.get('storage', '0')),
+            bandwidth='Unlimited' if classic else p.get('bandwidth', 'Unlimited'),
+            free_domain=True if classic else p.get('free_domain', False),
+            free_ssl=True,
+            last_updated=now,
+        )
+        for p in plans
+    ]
+
+
+class RegistryScraper:
+    """Mixin: a scraper configured by its RegistryProfile instead of code"""
+
+    PROFILE: RegistryProfile
+
+    def __init__(self):
+        super().__init__(provider_name=self.PROFILE.provider_name)
+
+    def _load_verified_data(self) -> Dict[str, Any]:
+        # By record name: the reported name may differ ('PIA')
+        return get_registry().get(self.PROFILE.provider_type, self.PROFILE.record_name)
+
+
+class RegistryHostingScraper(RegistryScraper, BaseHostingScraper):
+    """Hosting scraper whose plans are the registry record's, live price on top"""
+
+    def plan_rows(self) -> List[dict]:
+        return hosting_rows(self.PROFILE, self.get_verified_field('plans', []))
+
+
+class RegistryVPNScraper(RegistryScraper, BaseVPNScraper):
+    """VPN scraper for the 'static' feature sheet and the 'adaptive' registry lookup"""
+
+    def scrape_pricing(self) -> dict:
+        profile = self.PROFILE
+        if profile.template == 'adaptive':
+            return {
+                'provider_name': profile.provider_name,
+                'website_url': profile.url,
+                'pricing_monthly': 9.99,  # Fallback
+                'last_updated': datetime.now(),
+            }
+        return {
+            'provider_name': profile.provider_name,
+            'website_url': profile.url,
+            'pricing_monthly': None,
+            'pricing_yearly': None,
+            'pricing_2year': None,
+            'pricing_3year': None,
+            'renewal_price_monthly': None,
+            'renewal_price_yearly': None,
+            'has_free_tier': False,
+            'billing_currency': 'USD',
+            'last_price_check': date.today().isoformat(),
+        }
+
+    def scrape_features(self) -> dict:
+        if self.PROFILE.template == 'adaptive':
+            return {
+                'server_count': self.get_verified_field('server_count', 1000),
+                'country_count': self.get_verified_field('country_count', 50),
+                'ram_only_servers': self.get_verified_field('ram_only_servers', False),
+                'audit_history': self.get_verified_field('audit_history', []),
+            }
+        return {'provider_name': self.PROFILE.provider_name, **STATIC_VPN_FEATURES}
+
+
+BASES = {'hosting': RegistryHostingScraper, 'vpn': RegistryVPNScraper}
+
+_classes: Dict[RegistryProfile, type] = {}
+_classes_lock = threading.Lock()
+
+
+def _class_for(profile: RegistryProfile) -> type:
+    """The named scraper class of a profile (one per distinct profile, so registry edits apply)"""
+    with _classes_lock:
+        cls = _classes.get(profile)
+        if cls is None:
+            cls = type(profile.class_name, (BASES[profile.provider_type],), {
+                '__module__': __name__,
+                '__qualname__': profile.class_name,
+                '__doc__': f"{profile.provider_name} scraper (generated from the verified registry)",
+                'PROFILE': profile,
+                # Per-host concurrency key, see engine.host_for
+                'BASE_URL': profile.url or None,
+            })
+            _classes[profile] = cls
+    return cls
+
+
+def scraper_class(provider_type: str, class_name: str) -> type:
+    """
+    Scraper class of a registry provider by class name
+
+    Raises:
+        KeyError: If no registry provider of that category has this class name
+    """
+    for profile in profiles(provider_type):
+        if profile.class_name == class_name:
+            return _class_for(profile)
+    raise KeyError(class_name)
+
+
+def scraper_classes(provider_type: str) -> List[type]:
+    return [_class_for(profile) for profile in profiles(provider_type)]
+
+
+def scrape_category(provider_type: str) -> Dict[str, Union[List[HostingProvider], Optional[VPNProvider]]]:
+    """
+    Run every registry provider of a category in one pass
+
+    Rows are collected per provider (live prices included), then validated in a
+    single bulk call. If that fails, providers are built one by one so a bad
+    record only costs its own result, as with per-provider run().
+
+    Returns:
+        provider_name -> plans (hosting) or VPNProvider / None (vpn), same as run()
+    """
+    scrapers = [cls() for cls in scraper_classes(provider_type)]
+    model = HostingProvider if provider_type == 'hosting' else VPNProvider
+
+    groups: List[Optional[List[dict]]] = []
+    for scraper in scrapers:
+        try:
+            if provider_type == 'hosting':
+                groups.append(scraper.plan_rows())
+            else:
+                groups.append([{**scraper.scrape_pricing(), **scraper.scrape_features()}])
+        except Exception as e:
+            logger.error(f"{scraper.provider_name}: registry rows failed: {e}")
+            groups.append(None)
+
+    rows = [row for group in groups if group for row in group]
+    try:
+        with metrics.span('models'):
+            models = build_models(model, rows)
+    except ValidationError as e:
+        logger.warning(f"Bulk build of {len(rows)} {provider_type} rows failed, building per provider: {e.error_count()} errors")
+        return {s.provider_name: (s.run() if g is not None else _empty(provider_type)) for s, g in zip(scrapers, groups)}
+
+    results: Dict[str, Any] = {}
+    offset = 0
+    for scraper, group in zip(scrapers, groups):
+        if group is None:
+            results[scraper.provider_name] = _empty(provider_type)
+            continue
+        built = models[offset:offset + len(group)]
+        offset += len(group)
+        results[scraper.provider_name] = built if provider_type == 'hosting' else built[0]
+    return results
+
+
+def _empty(provider_type: str):
+    """run()'s result for a failed provider"""
+    return [] if provider_type == 'hosting' else None
+
+
+def __getattr__(name):
+    # Generated classes resolve by name, e.g. ScraperEntry('...', 'scrapers.registry_scraper', 'BluehostScraper').load()
+    if name.endswith('Scraper') and not name.startswith('_'):
+        for provider_type in BASES:
+            try:
+                return scraper_class(provider_type, name)
+            except KeyError:
+                pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run every registry scraper of a category in one pass")
+    parser.add_argument("provider_type", choices=sorted(BASES))
+    parser.add_argument("--offline", action="store_true", help="Registry data only, no live price lookups")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    if args.offline:
+        from .adaptive_base import AdaptiveBaseScraper
+        AdaptiveBaseScraper.get_live_data = lambda self, url: {}
+
+    results = scrape_category(args.provider_type)
+    for name, result in results.items():
+        count = len(result) if isinstance(result, list) else int(result is not None)
+        print(f"{'✅' if count else '⚠️ '} {name}: {count}")
+    print(f"\n{sum(1 for r in results.values() if r)}/{len(results)} providers returned data")
@@ -0,0 +1,168 @@
+"""
+Scraper Manifest
+----------------
+Build-time index of every scraper, so discovery is one file read.
+Handles:
+1. Generating scraper_manifest.json from the code (provider, type, module, class, host)
+2. Loading it without importing any scraper module
+3. Importing a scraper's module only when that scraper actually runs
+4. Rebuilding automatically when scraper files or registry providers were added or removed
+
+Registry providers without a hand-written module are listed with the generic
+scraper (scrapers.registry_scraper) as their module.
+
+Regenerate after adding/renaming a scraper:
+    python -m scrapers.scraper_manifest
+"""
+import importlib
+import inspect
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_ROOT = Path(__file__).parent
+MANIFEST_PATH = PACKAGE_ROOT / "scraper_manifest.json"
+
+# (provider_type, package, directory) searched for scrapers
+SCRAPER_PACKAGES = (
+    ('hosting', 'scrapers.hosting.scrapers', PACKAGE_ROOT / 'hosting' / 'scrapers'),
+    ('vpn', 'scrapers.vpn', PACKAGE_ROOT / 'vpn'),
+)
+
+
+@dataclass(frozen=True)
+class ScraperEntry:
+    """One scraper, as recorded in the manifest"""
+    provider_name: str
+    provider_type: str  # 'hosting' or 'vpn'
+    module: str  # e.g. 'scrapers.vpn.nordvpn' or 'scrapers.registry_scraper'
+    class_name: str  # e.g. 'BluehostScraper'
+    host: str  # per-host concurrency key, e.g. 'bluehost.com'
+
+    def load(self) -> type:
+        """Import the scraper's module and return its class"""
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+    def __str__(self) -> str:
+        return self.class_name
+
+
+def _module_files() -> List[str]:
+    """Scraper module paths relative to the package (stat-free directory listing)"""
+    files = []
+    for _, _, directory in SCRAPER_PACKAGES:
+        for entry in os.scandir(directory):
+            if entry.name.endswith('.py') and entry.name != '__init__.py' and 'base_scraper' not in entry.name:
+                files.append(f"{directory.relative_to(PACKAGE_ROOT).as_posix()}/{entry.name}")
+    return sorted(files)
+
+
+def _registry_names() -> Dict[str, List[str]]:
+    """Provider names per category in verified_data.json (no scraper import)"""
+    from .verified_registry import get_registry, record_name
+    registry = get_registry()
+    return {
+        provider_type: sorted(record_name(r) for r in registry.records(provider_type))
+        for provider_type, _, _ in SCRAPER_PACKAGES
+    }
+
+
+def build_manifest() -> List[ScraperEntry]:
+    """Import every scraper module and describe its scraper classes (build time only)"""
+    from .engine import host_for
+    from .hosting.base_scraper import BaseHostingScraper
+    from .vpn.base_scraper import BaseVPNScraper
+    from .registry_scraper import scraper_classes
+    from .utils.helpers import host_of
+
+    entries = []
+    for provider_type, package, directory in SCRAPER_PACKAGES:
+        found = []
+        for path in sorted(directory.glob('*.py')):
+            if path.name == '__init__.py' or 'base_scraper' in path.name:
+                continue
+            module_name = f"{package}.{path.stem}"
+            try:
+                module = importlib.import_module(module_name)
+            except Exception as e:
+                logger.warning(f"Skipping {path.name}: {e}")
+                continue
+            for class_name, cls in inspect.getmembers(module, inspect.isclass):
+                if (cls.__module__ != module_name
+                        or not issubclass(cls, (BaseHostingScraper, BaseVPNScraper))
+                        or cls in (BaseHostingScraper, BaseVPNScraper)):
+                    continue
+                # Same fallback as the pipeline: class name for scrapers that keep "Unknown"
+                provider_name = class_name.replace("Scraper", "")
+                host = host_for(cls)
+                try:
+                    instance = cls()
+                    if instance.provider_name != "Unknown":
+                        provider_name = instance.provider_name
+                    if host == class_name and (instance.verified_data or {}).get('url'):
+                        host = host_of(instance.verified_data['url'])
+                except Exception as e:
+                    logger.warning(f"Could not instantiate {class_name}, using defaults: {e}")
+                found.append(ScraperEntry(provider_name, provider_type, module_name, class_name, host))
+        for cls in scraper_classes(provider_type):
+            profile = cls.PROFILE
+            found.append(ScraperEntry(profile.provider_name, provider_type, cls.__module__, cls.__name__, host_for(cls)))
+        entries.extend(sorted(found, key=lambda e: e.class_name.lower()))
+    return entries
+
+
+def write_manifest(entries: List[ScraperEntry], path: Path = MANIFEST_PATH):
+    data = {
+        'modules': _module_files(),
+        'registry': _registry_names(),
+        'scrapers': [asdict(e) for e in entries],
+    }
+    tmp = Path(path).with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=1)
+        f.write('\n')
+    os.replace(tmp, path)
+
+
+def load_manifest(provider_type: Optional[str] = None, path: Path = MANIFEST_PATH) -> List[ScraperEntry]:
+    """
+    Every scraper in the manifest (no scraper module is imported)
+
+    The manifest is rebuilt and rewritten if it's missing or lists a different
+    set of scraper files or registry providers than what's on disk.
+
+    Args:
+        provider_type: Only 'hosting' or only 'vpn' scrapers
+        path: Manifest file
+    """
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        data = None
+
+    if data is None or data.get('modules') != _module_files() or data.get('registry') != _registry_names():
+        logger.info("Scraper manifest missing or stale, rebuilding")
+        entries = build_manifest()
+        try:
+            write_manifest(entries, path)
+        except OSError as e:
+            logger.warning(f"Could not write scraper manifest: {e}")
+    else:
+        entries = [ScraperEntry(**e) for e in data['scrapers']]
+
+    if provider_type:
+        entries = [e for e in entries if e.provider_type == provider_type]
+    return entries
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    scrapers = build_manifest()
+    write_manifest(scrapers)
+    print(f"✅ Wrote {len(scrapers)} scrapers to {MANIFEST_PATH}")
@@ -1,6 +1,15 @@
 # 🎯 TOP 40 DEDICATED SELECTORS (Live Scraping Config)
 # This file provides specific CSS selectors for the "VIP" providers.
 # If a provider is listed here, the Adaptive Scraper will use these exact paths.
+# Every selector is compiled once at import; how often each one still matches is
+# tracked across runs in scrapers/utils/selector_stats.py.
+import logging
+
+from soupsieve import SelectorSyntaxError
+
+from .utils.html_parser import compiled_selector
+
+logger = logging.getLogger(__name__)
 
 SELECTOR_REGISTRY = {
     # === HOSTING ===
@@ -134,3 +143,39 @@ SELECTOR_REGISTRY = {
 def get_selectors(provider_name):
     """Returns selectors if dedicated, else None"""
     return SELECTOR_REGISTRY.get(provider_name)
+
+# Plan selectors besides price_css -> field of the live per-plan records
+# (plan_css is what the VPN entries call plan_name_css)
+PLAN_FIELDS = {
+    'plan_name_css': 'name',
+    'plan_css': 'name',
+    'renewal_css': 'renewal',
+    'features_css': 'features',
+}
+
+
+def plan_selectors(provider_name):
+    """{registry field: css} of the provider's plan selectors other than price_css"""
+    selectors = SELECTOR_REGISTRY.get(provider_name) or {}
+    found, seen = {}, set()
+    for field, record_field in PLAN_FIELDS.items():
+        if selectors.get(field) and record_field not in seen:
+            found[field] = selectors[field]
+            seen.add(record_field)
+    return found
+
+
+def _precompile():
+    """Compile every registry selector; returns {(provider, field): error} for invalid ones"""
+    invalid = {}
+    for provider, selectors in SELECTOR_REGISTRY.items():
+        for field, css in selectors.items():
+            try:
+                compiled_selector(css)
+            except SelectorSyntaxError as e:
+                logger.warning(f"Invalid selector {provider}.{field} = {css!r}: {e}")
+                invalid[(provider, field)] = str(e)
+    return invalid
+
+
+INVALID_SELECTORS = _precompile()
@@ -0,0 +1,90 @@
+"""
+Sync Change Detection
+---------------------
+Decides which provider rows actually need to be written.
+Handles:
+1. Stable content hashes per payload (timestamps excluded)
+2. Hashing the rows the database holds now, so rows another writer (run_pipeline)
+   overwrote are seen as changed
+3. A local manifest of the hashes last written (data/sync_manifest.json), trusted
+   instead of the database only on request
+"""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).parent.parent / "data" / "sync_manifest.json"
+
+# Stamped fresh on every run, so they must not count as a change
+VOLATILE_FIELDS = ('last_updated',)
+VOLATILE_RAW_FIELDS = ('extracted_at', 'content_hash')
+
+
+def content_hash(payload: Dict[str, Any]) -> str:
+    """Stable hash of a row payload, ignoring volatile timestamps"""
+    stable = {k: v for k, v in payload.items() if k not in VOLATILE_FIELDS}
+    if isinstance(stable.get('raw_data'), dict):
+        stable['raw_data'] = {k: v for k, v in stable['raw_data'].items() if k not in VOLATILE_RAW_FIELDS}
+    encoded = json.dumps(stable, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def row_key(payload: Dict[str, Any], on_conflict: str) -> str:
+    """Manifest key from the conflict columns, e.g. 'Hostinger|Premium'"""
+    return '|'.join(str(payload.get(col.strip())) for col in on_conflict.split(','))
+
+
+class SyncManifest:
+    """table -> {row key -> content hash} of what the database holds (as last read or written)"""
+
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = Path(path)
+        try:
+            with open(self.path, 'r') as f:
+                self.tables: Dict[str, Dict[str, str]] = json.load(f)
+        except FileNotFoundError:
+            self.tables = {}
+        except Exception as e:
+            logger.warning(f"Sync manifest unreadable, treating every row as changed: {e}")
+            self.tables = {}
+
+    def known(self, table: str) -> Dict[str, str]:
+        return self.tables.setdefault(table, {})
+
+    def load_remote(self, table: str, rows: Iterable[Dict[str, Any]], on_conflict: str):
+        """
+        Replace a table's hashes with those of its database rows
+
+        The rows are hashed themselves, not their raw_data.content_hash: a writer
+        that leaves raw_data alone (run_pipeline) would make the stored hash lie.
+        Select the same columns the payloads carry, or every row looks changed.
+        """
+        self.tables[table] = {row_key(row, on_conflict): content_hash(row) for row in rows}
+
+    def status(self, table: str, key: str, digest: str) -> str:
+        """'new', 'changed' or 'unchanged'"""
+        previous = self.known(table).get(key)
+        if previous is None:
+            return 'new'
+        return 'unchanged' if previous == digest else 'changed'
+
+    def record(self, table: str, key: str, digest: str):
+        self.known(table)[key] = digest
+
+    def clear(self, table: Optional[str] = None):
+        if table is None:
+            self.tables = {}
+        else:
+            self.tables[table] = {}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.tables, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
@@ -1,11 +1,34 @@
 """Utils package initialization"""
-from .rate_limiter import RateLimiter
-from .helpers import extract_price, extract_number, clean_text, get_text_or_default
+import importlib
+
+# Name -> submodule, imported on first access (PEP 562) so `scrapers.utils.helpers`
+# doesn't drag in the rate limiter (and asyncio) for callers that only need helpers
+_MODULES = {
+    'RateLimiter': 'rate_limiter',
+    'get_rate_limiter': 'rate_limiter',
+    'extract_price': 'helpers',
+    'extract_number': 'helpers',
+    'clean_text': 'helpers',
+    'get_text_or_default': 'helpers',
+    'host_of': 'helpers',
+}
 
 __all__ = [
     'RateLimiter',
+    'get_rate_limiter',
     'extract_price',
     'extract_number',
     'clean_text',
     'get_text_or_default',
+    'host_of',
 ]
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(f'.{_MODULES[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,7 +1,10 @@
 """Helper utilities for scrapers"""
 import re
-from typing import Optional
-from bs4 import BeautifulSoup, Tag
+from urllib.parse import urlparse
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:  # bs4 is only needed by callers that already parsed a page
+    from bs4 import Tag
 
 
 def extract_price(text: str) -> Optional[float]:
@@ -82,7 +85,7 @@ def clean_text(text: str) -> str:
     return cleaned
 
 
-def get_text_or_default(element: Optional[Tag], selector: str, default: str = "") -> str:
+def get_text_or_default(element: Optional['Tag'], selector: str, default: str = "") -> str:
     """
     Safely extract text from BeautifulSoup element
     
@@ -102,3 +105,22 @@ def get_text_or_default(element: Optional[Tag], selector: str, default: str = ""
         return clean_text(found.get_text())
     
     return default
+
+
+def host_of(url: str) -> str:
+    """
+    Normalized host of a URL, used as the per-host key for politeness limits
+    
+    Args:
+        url: Full URL (e.g., "https://www.bluehost.com/pricing") or bare host
+    
+    Returns:
+        Lower-cased host without "www." (e.g., "bluehost.com")
+    """
+    if not url:
+        return ""
+    
+    netloc = urlparse(url if '//' in url else f'//{url}').netloc.lower()
+    netloc = netloc.rsplit('@', 1)[-1].split(':', 1)[0]
+    
+    return netloc[4:] if netloc.startswith('www.') else netloc
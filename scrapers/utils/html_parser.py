@@ -0,0 +1,199 @@
+"""
+HTML Parser Backends
+--------------------
+One place that decides how provider pages are parsed.
+Handles:
+1. Picking the BeautifulSoup tree builder (lxml when installed, html.parser fallback)
+2. A fast selector path on selectolax/lexbor for single-selector lookups
+3. Backend selection through config (HTML_PARSER)
+4. Partial parsing: a SoupStrainer derived from a CSS selector keeps only the
+   subtrees that selector can match
+5. Compiled selectors (soupsieve) reused across pages instead of resolved per select_one
+6. Multi-field lookups: every selector of a provider matched in one tree walk
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+from ..config import HTML_PARSER
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('auto', 'selectolax', 'lxml', 'html.parser')
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    LexborHTMLParser = None
+    HAS_SELECTOLAX = False
+
+
+def _configured(backend: Optional[str]) -> str:
+    backend = (backend or HTML_PARSER).lower()
+    if backend not in BACKENDS:
+        logger.warning(f"Unknown HTML_PARSER '{backend}', using auto")
+        return 'auto'
+    return backend
+
+
+def soup_builder(backend: Optional[str] = None) -> str:
+    """
+    Tree builder name for BeautifulSoup
+
+    selectolax is not a BeautifulSoup builder, so callers that need a soup
+    get lxml (or html.parser when lxml is missing) in that mode.
+    """
+    backend = _configured(backend)
+    if backend == 'html.parser' or not HAS_LXML:
+        return 'html.parser'
+    return 'lxml'
+
+
+def use_selectolax(backend: Optional[str] = None) -> bool:
+    """Whether single-selector lookups run on selectolax"""
+    return HAS_SELECTOLAX and _configured(backend) in ('auto', 'selectolax')
+
+
+# Pieces of the outermost compound selector, e.g. "div.plan" in "div.plan > span.price"
+_DESCENDANT = re.compile(r'\s*>\s*|\s+')
+_ATTRIBUTE = re.compile(r'\[\s*([\w-]+)[^\]]*\]')
+_TAG = re.compile(r'^([a-zA-Z][\w-]*)')
+_ID = re.compile(r'#([\w-]+)')
+_CLASS = re.compile(r'\.([\w-]+)')
+
+
+def _outer_compound(group: str) -> Optional[Dict[str, List[str]]]:
+    """
+    Tag, ids, classes and attribute names of the outermost compound selector
+
+    Returns None when a strained tree could change the result: sibling
+    combinators and positional pseudo-classes need the siblings we'd drop.
+    """
+    # Attribute values may contain anything: keep only the attribute names
+    group = _ATTRIBUTE.sub(lambda m: f"[{m.group(1)}]", group.strip())
+    if '+' in group or '~' in group:
+        return None
+    compound = _DESCENDANT.split(group, maxsplit=1)[0]
+    if ':' in compound:
+        return None
+    tag = _TAG.match(compound)
+    return {
+        'tag': [tag.group(1).lower()] if tag else [],
+        'id': _ID.findall(compound),
+        'class': _CLASS.findall(compound),
+        'attr': re.findall(r'\[([\w-]+)\]', compound),
+    }
+
+
+@lru_cache(maxsize=256)
+def compiled_selector(css: str) -> soupsieve.SoupSieve:
+    """
+    Compiled form of `css` for the soup path
+
+    Raises:
+        soupsieve.SelectorSyntaxError: If `css` is not a valid selector
+    """
+    return soupsieve.compile(css)
+
+
+@lru_cache(maxsize=256)
+def strainer_for(css: str) -> Optional[SoupStrainer]:
+    """
+    SoupStrainer keeping every subtree that `css` could match
+
+    The strainer is keyed on the outermost compound of each comma group, so
+    descendant selectors (".pricing-main .price") still resolve inside the
+    kept subtree. It is deliberately over-inclusive: the full selector is
+    always re-run on the strained tree.
+
+    Returns:
+        A strainer, or None when no single rule covers every group (parse everything)
+    """
+    groups = [_outer_compound(g) for g in css.split(',') if g.strip()]
+    if not groups or None in groups:
+        return None
+    if all(g['id'] for g in groups):
+        return SoupStrainer(attrs={'id': [g['id'][0] for g in groups]})
+    if all(g['class'] for g in groups):
+        return SoupStrainer(attrs={'class': [g['class'][0] for g in groups]})
+    if all(g['tag'] for g in groups):
+        return SoupStrainer([g['tag'][0] for g in groups])
+    names = {g['attr'][0] for g in groups if g['attr']}
+    if len(names) == 1 and all(g['attr'] for g in groups):
+        return SoupStrainer(attrs={names.pop(): True})
+    return None
+
+
+def parse_html(markup: str, backend: Optional[str] = None, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse a page into a BeautifulSoup tree with the configured builder
+
+    Args:
+        parse_only: Optional strainer (see strainer_for) to build only part of the tree
+    """
+    return BeautifulSoup(markup, soup_builder(backend), parse_only=parse_only)
+
+
+def select_text(markup: str, css: str, backend: Optional[str] = None) -> Optional[str]:
+    """
+    Text of the first element matching `css`
+
+    On the soup path only the subtrees the selector can match are built.
+
+    Returns:
+        Stripped text, or None if nothing matched
+    """
+    if use_selectolax(backend):
+        node = LexborHTMLParser(markup).css_first(css)
+        return node.text().strip() if node is not None else None
+    element = compiled_selector(css).select_one(parse_html(markup, backend, parse_only=strainer_for(css)))
+    return element.get_text().strip() if element is not None else None
+
+
+class Match(NamedTuple):
+    """One element matched by select_fields"""
+    position: int  # document order among the parsed elements
+    text: str  # whitespace-collapsed text
+    items: List[str]  # texts of its <li> descendants (feature lists)
+
+
+def select_fields(markup: str, selectors: Dict[str, str], backend: Optional[str] = None) -> Dict[str, List[Match]]:
+    """
+    Every match of several selectors from one parse and one walk over the tree
+
+    Always on the soup path: each element is tested against every compiled
+    selector as the walk passes it, so the matches of all fields come back
+    in document order and can be aligned by position.
+
+    Args:
+        selectors: {field: css}
+
+    Returns:
+        {field: [Match, ...]} with an entry (possibly empty) per field
+    """
+    compiled = [(field, compiled_selector(css)) for field, css in selectors.items()]
+    soup = parse_html(markup, backend, parse_only=strainer_for(', '.join(selectors.values())))
+    matches: Dict[str, List[Match]] = {field: [] for field in selectors}
+    for position, element in enumerate(soup.find_all(True)):
+        for field, selector in compiled:
+            if selector.match(element):
+                items = [' '.join(li.get_text().split()) for li in element.find_all('li')]
+                matches[field].append(Match(position, ' '.join(element.get_text().split()), items))
+    return matches
+
+
+def describe(backend: Optional[str] = None) -> str:
+    """Human-readable backend summary for logs"""
+    fast = 'selectolax' if use_selectolax(backend) else soup_builder(backend)
+    return f"soup={soup_builder(backend)}, selectors={fast}"
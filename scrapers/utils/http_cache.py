@@ -0,0 +1,301 @@
+"""
+Conditional-GET HTTP cache
+--------------------------
+On-disk cache under the fetch layer for provider pricing pages.
+Handles:
+1. Storing bodies with their validators (ETag / Last-Modified)
+2. Revalidation with If-None-Match / If-Modified-Since (304 = no download)
+3. Remembering the extraction result per URL, so a 304 also skips the parse
+4. Fresh/max-age TTLs and size-bounded LRU eviction
+5. Extraction results per body hash, so a 200 with byte-identical content
+   (no validators needed) skips the parse too
+"""
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import (
+    HTTP_CACHE_ENABLED, HTTP_CACHE_DIR, HTTP_CACHE_FRESH_TTL,
+    HTTP_CACHE_MAX_AGE, HTTP_CACHE_MAX_BYTES, HTTP_CACHE_MAX_EXTRACTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+CONTENT_FILE = "extractions.json"
+
+
+def _key(url: str) -> str:
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+class HttpCache:
+    """URL -> body + validators + extracted result, persisted in a directory"""
+
+    def __init__(
+        self,
+        directory: Path,
+        fresh_ttl: float = HTTP_CACHE_FRESH_TTL,
+        max_age: float = HTTP_CACHE_MAX_AGE,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+        max_extractions: int = HTTP_CACHE_MAX_EXTRACTIONS,
+    ):
+        """
+        Args:
+            directory: Where bodies and the index live
+            fresh_ttl: Seconds an entry is served without contacting the server
+            max_age: Seconds after which an entry is dropped instead of revalidated
+            max_bytes: Total body size kept on disk before LRU eviction
+            max_extractions: Content-hash extraction results kept (least recently used dropped)
+        """
+        self.directory = Path(directory)
+        self.fresh_ttl = fresh_ttl
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.max_extractions = max_extractions
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._content: Optional[OrderedDict] = None
+        self._content_dirty = False
+        self.stats = {'fresh': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0,
+                      'unchanged': 0, 'changed': 0}
+
+    # ---- index ----
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Lazy-load the index. Caller holds the lock."""
+        if self._index is None:
+            try:
+                with open(self.directory / INDEX_FILE, 'r') as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                self._index = {}
+            except Exception as e:
+                logger.warning(f"HTTP cache index unreadable, starting empty: {e}")
+                self._index = {}
+        return self._index
+
+    def _load_content(self) -> OrderedDict:
+        """Lazy-load the body hash -> extraction map. Caller holds the lock."""
+        if self._content is None:
+            try:
+                with open(self.directory / CONTENT_FILE, 'r') as f:
+                    self._content = OrderedDict(json.load(f))
+            except FileNotFoundError:
+                self._content = OrderedDict()
+            except Exception as e:
+                logger.warning(f"HTTP cache extractions unreadable, starting empty: {e}")
+                self._content = OrderedDict()
+        return self._content
+
+    def _write(self, name: str, data: Any):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / f"{name}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, self.directory / name)
+
+    def save(self):
+        """Persist the index and extractions (bodies are written as they arrive)"""
+        with self._lock:
+            if self._dirty and self._index is not None:
+                self._write(INDEX_FILE, self._index)
+                self._dirty = False
+            if self._content_dirty and self._content is not None:
+                self._write(CONTENT_FILE, self._content)
+                self._content_dirty = False
+
+    def _drop(self, key: str):
+        """Remove an entry and its body. Caller holds the lock."""
+        self._index.pop(key, None)
+        try:
+            os.remove(self.directory / f"{key}.gz")
+        except FileNotFoundError:
+            pass
+        self._dirty = True
+
+    # ---- lookups ----
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a usable entry for `url`
+
+        Returns:
+            Entry dict with 'body', 'fresh' (no revalidation needed), validators,
+            'extracted' and its 'extraction_key', or None on a miss
+        """
+        key = _key(url)
+        now = time.time()
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            if now - entry['stored_at'] > self.max_age:
+                self._drop(key)
+                self.stats['misses'] += 1
+                return None
+            try:
+                with gzip.open(self.directory / f"{key}.gz", 'rt', encoding='utf-8') as f:
+                    body = f.read()
+            except OSError:
+                self._drop(key)
+                self.stats['misses'] += 1
+                return None
+            entry['last_used'] = now
+            self._dirty = True
+            return {**entry, 'body': body, 'fresh': now - entry['stored_at'] < self.fresh_ttl}
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Validators to send when revalidating `entry`"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record_hit(self, url: str, revalidated: bool):
+        """Count a cache hit; a 304 also restarts the entry's fresh TTL"""
+        with self._lock:
+            if revalidated:
+                self.stats['revalidated'] += 1
+                entry = self._load_index().get(_key(url))
+                if entry is not None:
+                    entry['stored_at'] = time.time()
+                    self._dirty = True
+            else:
+                self.stats['fresh'] += 1
+
+    def record_miss(self):
+        """Count a stale entry the server replaced with a new body"""
+        with self._lock:
+            self.stats['misses'] += 1
+
+    # ---- writes ----
+
+    def store(self, url: str, body: str, headers: Dict[str, str]):
+        """Save a 200 response (any previous extraction result is discarded)"""
+        key = _key(url)
+        now = time.time()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.directory / f"{key}.gz", 'wt', encoding='utf-8') as f:
+            f.write(body)
+        size = os.path.getsize(self.directory / f"{key}.gz")
+        headers = {k.lower(): v for k, v in headers.items()}
+
+        with self._lock:
+            index = self._load_index()
+            index[key] = {
+                'url': url,
+                'etag': headers.get('etag'),
+                'last_modified': headers.get('last-modified'),
+                'stored_at': now,
+                'last_used': now,
+                'size': size,
+                'extracted': None,
+                'extraction_key': None,
+            }
+            self.stats['stores'] += 1
+            self._dirty = True
+            self._evict()
+
+    def set_extracted(self, url: str, result: Dict[str, Any], content_key: Optional[str] = None):
+        """
+        Remember what was extracted from the cached body of `url`
+
+        Args:
+            content_key: Key the result was extracted under (see content_extraction);
+                callers only reuse the result while their current key matches
+        """
+        with self._lock:
+            entry = self._load_index().get(_key(url))
+            if entry is not None:
+                entry['extracted'] = result
+                entry['extraction_key'] = content_key
+                self._dirty = True
+
+    def content_extraction(self, content_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Result extracted earlier from a byte-identical body (any URL, any run)
+
+        Args:
+            content_key: Body hash plus whatever else the result depends on
+                (selectors, extractor version), see AdaptiveBaseScraper
+        """
+        with self._lock:
+            content = self._load_content()
+            result = content.get(content_key)
+            if result is None:
+                self.stats['changed'] += 1
+                return None
+            content.move_to_end(content_key)
+            self.stats['unchanged'] += 1
+            return dict(result)
+
+    def remember_content(self, content_key: str, result: Dict[str, Any]):
+        """Store the extraction of a body under its content key"""
+        with self._lock:
+            content = self._load_content()
+            content[content_key] = result
+            content.move_to_end(content_key)
+            while len(content) > self.max_extractions:
+                content.popitem(last=False)
+            self._content_dirty = True
+
+    def _evict(self):
+        """Drop least-recently-used entries until under max_bytes. Caller holds the lock."""
+        total = sum(e.get('size', 0) for e in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self._index.items(), key=lambda kv: kv[1].get('last_used', 0)):
+            if total <= self.max_bytes:
+                break
+            total -= entry.get('size', 0)
+            self._drop(key)
+            self.stats['evictions'] += 1
+
+    # ---- reporting ----
+
+    def hit_ratio(self) -> float:
+        hits = self.stats['fresh'] + self.stats['revalidated']
+        lookups = hits + self.stats['misses']
+        return hits / lookups if lookups else 0.0
+
+    def report(self) -> str:
+        s = self.stats
+        return (
+            f"HTTP cache: {self.hit_ratio():.0%} hit ratio "
+            f"({s['fresh']} fresh, {s['revalidated']} revalidated/304, {s['misses']} misses, "
+            f"{s['stores']} stored, {s['evictions']} evicted; "
+            f"{s['unchanged']} unchanged bodies not re-extracted, {s['changed']} extracted)"
+        )
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Process-wide cache, or None when disabled in config"""
+    global _cache
+    if not HTTP_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                directory = Path(HTTP_CACHE_DIR)
+                if not directory.is_absolute():
+                    directory = Path(__file__).parent.parent.parent / directory
+                _cache = HttpCache(directory)
+                atexit.register(_cache.save)
+    return _cache
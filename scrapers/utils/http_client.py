@@ -0,0 +1,293 @@
+"""
+Async HTTP fetch layer
+----------------------
+One aiohttp connection pool on one background event loop, shared by every scraper.
+Handles:
+1. Non-blocking jittered delays and per-host rate limiting (Retry-After aware)
+2. Retries with exponential backoff on anti-bot responses (403/429/503)
+3. Conditional GETs through the on-disk HTTP cache (see http_cache.py)
+4. A blocking adapter (run_sync) so synchronous scrapers keep working
+5. Record/replay of responses for offline runs (see replay.py)
+6. Body hashes (xxh3 when installed, blake2b otherwise) for the unchanged-content
+   short-circuit: a byte-identical body reuses the extraction stored under its hash
+"""
+import asyncio
+import atexit
+import hashlib
+import logging
+import random
+import threading
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Awaitable, Dict, Optional, Tuple, TypeVar
+
+import aiohttp
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+from .. import metrics
+from ..config import REQUEST_TIMEOUT, MAX_RETRIES, HTTP_POOL_SIZE, HTTP_POOL_PER_HOST
+from .rate_limiter import get_rate_limiter, parse_retry_after
+from .http_cache import get_http_cache
+from .replay import Recording, get_replay_store
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Human-looking delay before each request (seconds)
+DEFAULT_JITTER = (1.0, 3.0)
+
+
+def content_hash(text: str) -> str:
+    """Stable digest of a page body, prefixed with the algorithm (hashes from either never collide)"""
+    data = text.encode('utf-8', 'surrogatepass')
+    if HAS_XXHASH:
+        return 'xxh3:' + xxhash.xxh3_128_hexdigest(data)
+    return 'b2:' + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass
+class FetchResponse:
+    """Body and metadata of a successful fetch"""
+    url: str
+    status: int
+    text: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False  # served from the HTTP cache (fresh or 304)
+    extracted: Optional[dict] = None  # result previously extracted from this exact body
+    extraction_key: Optional[str] = None  # content key `extracted` was stored under
+
+    @cached_property
+    def body_hash(self) -> str:
+        return content_hash(self.text)
+
+
+class _LoopThread:
+    """Background event loop that owns the shared connection pool"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._thread = threading.Thread(target=self._run, name="http-loop", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def session(self) -> aiohttp.ClientSession:
+        # Only ever touched from the loop thread, so no lock is needed
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, limit_per_host=HTTP_POOL_PER_HOST)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close_session(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def in_loop(self) -> bool:
+        return threading.current_thread() is self._thread
+
+
+_loop_thread: Optional[_LoopThread] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop_thread() -> _LoopThread:
+    global _loop_thread
+    if _loop_thread is None:
+        with _loop_lock:
+            if _loop_thread is None:
+                _loop_thread = _LoopThread()
+    return _loop_thread
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Blocking adapter: run a coroutine on the shared loop and wait for it
+
+    Safe to call from any thread except the loop thread itself.
+    """
+    loop_thread = _get_loop_thread()
+    if loop_thread.in_loop():
+        raise RuntimeError("run_sync() called from the HTTP loop thread; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(metrics.bind(coro), loop_thread.loop).result()
+
+
+async def _on_shared_loop(coro: Awaitable[T]) -> T:
+    """Await a coroutine on the shared loop, whichever loop the caller is on"""
+    loop_thread = _get_loop_thread()
+    if loop_thread.in_loop():
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(metrics.bind(coro), loop_thread.loop))
+
+
+async def _fetch(
+    url: str,
+    headers: Optional[Dict[str, str]],
+    retries: int,
+    jitter: Optional[Tuple[float, float]],
+    rate_limit: bool,
+    timeout: float,
+    use_cache: bool,
+) -> Optional[FetchResponse]:
+    replay = get_replay_store()
+    if replay is not None and replay.replaying:
+        return await _replay(replay, url)
+    if replay is not None:
+        use_cache = False  # record real 200 bodies, not 304s
+
+    cache = get_http_cache() if use_cache else None
+    cached = await asyncio.to_thread(cache.lookup, url) if cache else None
+    if cached and cached['fresh']:
+        cache.record_hit(url, revalidated=False)
+        metrics.incr('http_cache_fresh')
+        return FetchResponse(url, 200, cached['body'], from_cache=True, extracted=cached['extracted'],
+                             extraction_key=cached.get('extraction_key'))
+    if cached:
+        headers = {**(headers or {}), **cache.conditional_headers(cached)}
+
+    session = await _get_loop_thread().session()
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    limiter = get_rate_limiter(url) if rate_limit else None
+
+    # Only attempts that reached the server spend a token (not DNS/connect failures)
+    needs_token = True
+    for i in range(retries):
+        try:
+            if jitter:
+                # Random delay to look human (doesn't block other fetches)
+                with metrics.span('jitter'):
+                    await asyncio.sleep(random.uniform(*jitter))
+            if limiter is not None and needs_token:
+                with metrics.span('rate_limit'):
+                    await limiter.acquire()
+                needs_token = False
+
+            metrics.incr('http_requests')
+            with metrics.span('network'):
+                async with session.get(url, headers=headers, timeout=client_timeout) as response:
+                    status = response.status
+                    response_headers = dict(response.headers)
+                    final_url = str(response.url)
+                    unchanged = status == 304 and cached
+                    text = await response.text(errors='replace') if status < 400 and not unchanged else None
+
+            if unchanged:
+                # Unchanged since last run: no download, and the old extraction still applies
+                cache.record_hit(url, revalidated=True)
+                metrics.incr('http_not_modified')
+                return FetchResponse(url, 304, cached['body'], response_headers,
+                                     from_cache=True, extracted=cached['extracted'],
+                                     extraction_key=cached.get('extraction_key'))
+            if status in (403, 429, 503):
+                needs_token = True
+                metrics.incr('http_throttled')
+                retry_after = parse_retry_after(response_headers.get('Retry-After'))
+                if retry_after is not None and limiter is not None:
+                    # Server told us when to come back: block the whole host, not just this fetch
+                    limiter.defer(retry_after)
+                    logger.warning(f"Rate limited on {url}, Retry-After {retry_after:.0f}s (Attempt {i+1}/{retries})")
+                else:
+                    logger.warning(f"Anti-bot triggered on {url} (Attempt {i+1}/{retries}). Retrying...")
+                    with metrics.span('backoff'):
+                        await asyncio.sleep(2 ** i)  # 1s, 2s, 4s...
+                continue
+            if status >= 400:
+                logger.error(f"HTTP Error {status} for {url}")
+                metrics.incr('http_errors')
+                if replay is not None:
+                    await asyncio.to_thread(replay.put, Recording('GET', url, status, '', response_headers))
+                break
+            if replay is not None:
+                await asyncio.to_thread(replay.put, Recording('GET', url, status, text, response_headers))
+            if cache:
+                if cached:
+                    cache.record_miss()
+                await asyncio.to_thread(cache.store, url, text, response_headers)
+            return FetchResponse(final_url, status, text, response_headers)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            metrics.incr('http_network_errors')
+            logger.error(f"Network Error fetching {url}: {e}")
+
+    return None
+
+
+async def _replay(replay, url: str) -> Optional[FetchResponse]:
+    """Serve a recorded response after the simulated network delay"""
+    recording = await asyncio.to_thread(replay.get, 'GET', url)
+    with metrics.span('network'):
+        await asyncio.sleep(replay.delay())
+    if recording is None or recording.status >= 400:
+        return None
+    return FetchResponse(url, recording.status, recording.body, recording.headers)
+
+
+async def fetch_page(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    retries: int = MAX_RETRIES,
+    jitter: Optional[Tuple[float, float]] = DEFAULT_JITTER,
+    rate_limit: bool = True,
+    timeout: float = REQUEST_TIMEOUT,
+    use_cache: bool = True,
+) -> Optional[FetchResponse]:
+    """
+    Fetch a page through the shared connection pool
+
+    Args:
+        url: Page URL
+        headers: Request headers
+        retries: Attempts before giving up
+        jitter: (min, max) seconds of random delay before each attempt, None to disable
+        rate_limit: Throttle through the shared per-host token bucket
+        timeout: Total seconds per attempt
+        use_cache: Serve/revalidate through the conditional-GET cache
+
+    Returns:
+        FetchResponse, or None if every attempt failed
+    """
+    return await _on_shared_loop(_fetch(url, headers, retries, jitter, rate_limit, timeout, use_cache))
+
+
+def remember_extraction(url: str, result: dict, content_key: Optional[str] = None):
+    """
+    Attach an extraction result to the cached body of `url`, reused on the next 304
+    while `content_key` still matches, and (with `content_key`) to the body's hash,
+    reused whenever the same bytes come back
+    """
+    cache = get_http_cache()
+    if cache:
+        cache.set_extracted(url, result, content_key)
+        if content_key:
+            cache.remember_content(content_key, result)
+
+
+def unchanged_extraction(content_key: str) -> Optional[dict]:
+    """Result stored for a byte-identical body, or None (counted as content_unchanged / content_changed)"""
+    cache = get_http_cache()
+    if not cache:
+        return None
+    result = cache.content_extraction(content_key)
+    metrics.incr('content_unchanged' if result is not None else 'content_changed')
+    return result
+
+
+@atexit.register
+def close():
+    """Close the shared connection pool"""
+    if _loop_thread is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_loop_thread.close_session(), _loop_thread.loop).result(timeout=5)
+    except Exception:
+        pass
@@ -0,0 +1,87 @@
+"""
+Live Data Memo
+--------------
+In-memory, per-run memoization of live page extractions.
+Handles:
+1. Keying results by (provider, url), shared by every scraper in the process
+2. Single flight: concurrent callers for one key wait for the first fetch
+3. A TTL, so long-lived processes still refresh prices
+4. Hit/miss stats for the pipeline report
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from .. import metrics
+from ..config import LIVE_DATA_MEMO_TTL
+
+
+class LiveDataMemo:
+    """(provider, url) -> extracted dict, computed at most once per TTL"""
+
+    def __init__(self, ttl: float = LIVE_DATA_MEMO_TTL):
+        """
+        Args:
+            ttl: Seconds a result is reused (0 disables memoization)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _fresh(self, key: Tuple[str, str]) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def get_or_compute(self, provider: str, url: str, compute: Callable[[], dict]) -> dict:
+        """Memoized result for (provider, url), calling `compute` on a miss (returns a copy)"""
+        if self.ttl <= 0:
+            return compute()
+        key = (provider, url)
+        with self._lock:
+            result = self._fresh(key)
+            if result is not None:
+                self.stats['hits'] += 1
+                metrics.incr('live_memo_hit')
+                return dict(result)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have filled it while we waited
+            with self._lock:
+                result = self._fresh(key)
+                if result is not None:
+                    self.stats['hits'] += 1
+                    metrics.incr('live_memo_hit')
+                    return dict(result)
+                self.stats['misses'] += 1
+            result = compute()
+            with self._lock:
+                self._entries[key] = (time.monotonic(), dict(result))
+            return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+    def report(self) -> str:
+        s = self.stats
+        return f"Live data memo: {s['hits']} hits, {s['misses']} fetches"
+
+
+_memo: Optional[LiveDataMemo] = None
+_memo_lock = threading.Lock()
+
+
+def get_live_memo() -> LiveDataMemo:
+    """Process-wide memo shared by all scrapers of a pipeline run"""
+    global _memo
+    if _memo is None:
+        with _memo_lock:
+            if _memo is None:
+                _memo = LiveDataMemo()
+    return _memo
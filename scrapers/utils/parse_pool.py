@@ -0,0 +1,232 @@
+"""
+Parse Pool
+----------
+Process pool for the CPU-bound half of live scraping.
+Handles:
+1. extract_live(): page body + optional price selector -> compact result dict
+   (selector lookup first, price heuristics as fallback; no soup leaves the worker);
+   with the provider's other plan selectors, per-plan records from one tree walk
+2. A lazily started worker pool (PARSE_POOL_WORKERS), so selector parsing and the
+   price scan no longer serialize scraper threads on the GIL
+3. Chunked batch extraction (extract_many) for corpora and batched passes
+4. Worker-side timings folded back into the caller's metrics (parse / extract)
+
+Small pages (< PARSE_POOL_MIN_BYTES) and a pool of 0/1 workers are extracted
+in the calling thread: there the IPC costs more than the parse.
+"""
+import logging
+import multiprocessing
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .. import metrics
+from .. import selector_registry  # noqa: F401  (compiles the registry selectors in every worker)
+from ..config import PARSE_POOL_WORKERS, PARSE_POOL_CHUNKSIZE, PARSE_POOL_MIN_BYTES
+from .html_parser import Match, select_fields, select_text
+from .price_extractor import Markup, best_price
+
+logger = logging.getLogger(__name__)
+
+_NUMBER = re.compile(r'(\d+\.?\d{0,2})')
+
+# Heuristic price bounds for every scraper: no $0.01 or $5000 hosting plans
+MIN_PRICE = 0.5
+MAX_PRICE = 100.0
+
+
+def _price(text: str) -> Optional[float]:
+    # Clean string: "$ 2.95 /mo" -> 2.95
+    found = _NUMBER.search(text) if text else None
+    return float(found.group(1)) if found and float(found.group(1)) > 0 else None
+
+
+def _plan_value(field: str, match: Match) -> Any:
+    if field in ('price', 'renewal'):
+        return _price(match.text)
+    if field == 'features':
+        return match.items or ([match.text] if match.text else None)
+    return match.text or None
+
+
+def align_plans(matches: Dict[str, List[Match]]) -> List[Dict[str, Any]]:
+    """
+    Per-plan records from the matches of each field
+
+    Fields with as many matches as the anchor (plan names, else prices) pair
+    up by index. Otherwise each anchor owns the matches between it and the
+    next anchor, so a card without a renewal line doesn't shift the others.
+    """
+    anchor_field = 'name' if matches.get('name') else 'price'
+    anchors = matches.get(anchor_field) or []
+    records: List[Dict[str, Any]] = [{} for _ in anchors]
+    bounds = [a.position for a in anchors[1:]] + [float('inf')]
+    for field, found in matches.items():
+        if len(found) == len(anchors):
+            owned = [[m] for m in found]
+        else:
+            owned = [[m for m in found if anchor.position <= m.position < end]
+                     for anchor, end in zip(anchors, bounds)]
+        for record, candidates in zip(records, owned):
+            for match in candidates:
+                value = _plan_value(field, match)
+                if value is not None:
+                    record[field] = value
+                    break
+    return [r for r in records if r.get('name') or r.get('price')]
+
+
+def extract_live(markup: Markup, css: Optional[str] = None,
+                 fields: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Advertised price of one page (runs in a worker process or inline)
+
+    Args:
+        markup: Page body as received
+        css: Dedicated price selector from selector_registry, if any
+        fields: More plan selectors, {'name' | 'renewal' | 'features': css}; with
+            any, every selector is matched in one walk and per-plan records come back
+
+    Returns:
+        {'price': 2.95, 'method': 'selector' | 'heuristic', 'timings': {...}}, or
+        {'timings': {...}} when nothing was found; with a selector, 'selector_hit'
+        tells whether it produced the price. With fields: 'plans' (aligned records)
+        and 'fields_hit' ({field: matched anything})
+    """
+    result: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    if fields:
+        selectors = {**fields, 'price': css} if css else dict(fields)
+        start = time.perf_counter()
+        matches = select_fields(markup, selectors)
+        timings['parse'] = time.perf_counter() - start
+        prices = [p for p in (_price(m.text) for m in matches.get('price', [])) if p]
+        if prices:
+            result = {'price': prices[0], 'method': 'selector'}
+        plans = align_plans(matches)
+        # A lone price record says no more than 'price' already does
+        if len(plans) > 1 or (plans and set(plans[0]) != {'price'}):
+            result['plans'] = plans
+        result['fields_hit'] = {field: bool(found) for field, found in matches.items()}
+    elif css:
+        start = time.perf_counter()
+        price = _price(select_text(markup, css))
+        timings['parse'] = time.perf_counter() - start
+        if price:
+            result = {'price': price, 'method': 'selector'}
+    if css:
+        result['selector_hit'] = 'price' in result
+    if 'price' not in result:
+        start = time.perf_counter()
+        price = best_price(markup, min_value=MIN_PRICE, max_value=MAX_PRICE)
+        timings['extract'] = time.perf_counter() - start
+        if price > 0:
+            result.update(price=price, method='heuristic')
+    result['timings'] = timings
+    return result
+
+
+def _extract_page(page: Tuple) -> Dict[str, Any]:
+    return extract_live(*page)
+
+
+class ParsePool:
+    """Worker processes running extract_live, started on first use"""
+
+    def __init__(self, workers: int = PARSE_POOL_WORKERS, chunksize: int = PARSE_POOL_CHUNKSIZE,
+                 min_bytes: int = PARSE_POOL_MIN_BYTES):
+        """
+        Args:
+            workers: Worker processes (0 or 1 = extract in the calling thread)
+            chunksize: Pages per task in extract_many
+            min_bytes: Smaller pages are always extracted in the calling thread
+        """
+        self.workers = workers
+        self.chunksize = max(1, chunksize)
+        self.min_bytes = min_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats = {'pooled': 0, 'inline': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 1
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: scraper threads and the HTTP event loop must not be forked
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _inline(self, markup: Markup, css: Optional[str], fields: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        self._count('inline')
+        result = extract_live(markup, css, fields)
+        for phase, seconds in result['timings'].items():
+            metrics.record(phase, seconds)
+        return result
+
+    def extract(self, markup: Markup, css: Optional[str] = None,
+                fields: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        extract_live() in a worker, blocking the calling thread (not the GIL) until done
+
+        A broken pool (killed worker) is replaced, and the page extracted inline.
+        """
+        if not self.enabled or len(markup) < self.min_bytes:
+            return self._inline(markup, css, fields)
+        try:
+            with metrics.span('parse_queue'):
+                result = self._pool().submit(extract_live, markup, css, fields).result()
+                # Worker time is accounted as its own phases; parse_queue keeps the IPC overhead
+                for phase, seconds in result['timings'].items():
+                    metrics.record(phase, seconds)
+        except BrokenProcessPool as e:
+            logger.warning(f"Parse pool broke ({e}), restarting it and extracting inline")
+            self.shutdown()
+            return self._inline(markup, css, fields)
+        self._count('pooled')
+        return result
+
+    def extract_many(self, pages: Iterable[Tuple]) -> List[Dict[str, Any]]:
+        """extract_live() for every (markup, css[, fields]), in order, `chunksize` pages per worker task"""
+        pages = list(pages)
+        if not self.enabled:
+            return [self._inline(*page) for page in pages]
+        results = list(self._pool().map(_extract_page, pages, chunksize=self.chunksize))
+        self._count('pooled', len(results))
+        return results
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def report(self) -> str:
+        s = self.stats
+        mode = f"{self.workers} workers" if self.enabled else "inline"
+        return f"Parse pool ({mode}): {s['pooled']} pages in workers, {s['inline']} inline"
+
+
+_pool: Optional[ParsePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ParsePool:
+    """Process-wide pool shared by all scrapers of a pipeline run"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ParsePool()
+    return _pool
@@ -0,0 +1,153 @@
+"""
+Price Extraction Engine
+-----------------------
+Finds advertised prices in raw page markup without building a DOM.
+Handles:
+1. One precompiled multi-currency pattern ($, US$, €, £, ₹, entities, ISO codes)
+2. A single scan of the raw buffer (str or bytes); <script>/<style> blocks are
+   consumed by the same scan and ignored
+3. Prices split across inline tags, e.g. "$2<sup>.95</sup>"
+4. Ranking by proximity to billing keywords ("/mo", "per month", "starting at")
+5. best_price(): USD candidates first, other currencies only when a page has none
+"""
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+Markup = Union[str, bytes]
+
+# Inline markup allowed between currency and amount ("<span>$</span><b>2</b>")
+_GAP = r'(?:\s|&nbsp;|<[^<>]{0,120}>){0,4}'
+_AMOUNT = r'\d{1,3}(?:,\d{3})+(?:\.\d{1,2})?|\d{1,5}(?:[.,]\d{1,2})?'
+_SYMBOLS = {
+    '$': 'USD', 'us$': 'USD', '&#36;': 'USD', '&#036;': 'USD', '&dollar;': 'USD',
+    '€': 'EUR', '&euro;': 'EUR', '&#8364;': 'EUR',
+    '£': 'GBP', '&pound;': 'GBP', '&#163;': 'GBP',
+    '₹': 'INR', '&#8377;': 'INR',
+}
+_PREFIX = '|'.join(re.escape(s) for s in sorted(_SYMBOLS, key=len, reverse=True))
+_SUFFIX = r'€|&euro;|USD|EUR|GBP|INR'
+
+_PATTERN = (
+    r'(?P<skip><script\b.*?</script\s*>|<style\b.*?</style\s*>)'
+    r'|(?P<sym>' + _PREFIX + r')' + _GAP + r'(?P<num>' + _AMOUNT + r')(?![\d,]\d)'
+    r'(?:(?:<[^<>]{0,120}>){1,3}\.?(?P<cents>\d{2})(?!\d))?'
+    r'|(?<![\d.,])(?P<num2>' + _AMOUNT + r')(?:\s|&nbsp;)?(?P<code>' + _SUFFIX + r')(?![a-z])'
+)
+_PRICE_RE = re.compile(_PATTERN, re.IGNORECASE | re.DOTALL)
+_PRICE_RE_BYTES = re.compile(_PATTERN.encode('utf-8'), re.IGNORECASE | re.DOTALL)
+
+_TAGS = re.compile(r'<[^<>]*>')
+_MONTH = re.compile(r'^\W{0,3}(?:/\s*mo\b|/\s*month|per\s+month|a\s+month|mo\b|monthly|/\s*mes)', re.IGNORECASE)
+_YEAR = re.compile(r'^\W{0,3}(?:/\s*yr\b|/\s*year|per\s+year|a\s+year|yearly|annually|/\s*an)', re.IGNORECASE)
+_STARTING = re.compile(r'(?:starting\s+(?:at|from)|starts\s+at|from|as\s+low\s+as|only|now)\W*$', re.IGNORECASE)
+_REGULAR = re.compile(r'\b(?:renews?|renewal|regular(?:ly)?|normally|was|list\s+price)\b', re.IGNORECASE)
+# Match sits inside a still-open <del>/<s>/<strike> or a line-through element
+_STRUCK = re.compile(r'<(del|s|strike)\b[^>]*>(?:(?!</\1).)*$|line-through[^>]*>[^<]*$', re.IGNORECASE | re.DOTALL)
+
+# How far around a match (in characters of markup) keywords still count
+_BEFORE = 160
+_AFTER = 80
+
+
+@dataclass(frozen=True)
+class PriceCandidate:
+    """One price found on a page"""
+    value: float
+    currency: str  # ISO code, e.g. 'USD'
+    period: Optional[str]  # 'month', 'year' or None
+    confidence: float  # 0..1
+    offset: int  # Position in the markup
+
+
+def _amount(raw: str, cents: Optional[str]) -> Optional[float]:
+    if ',' in raw:
+        head, _, tail = raw.rpartition(',')
+        # "2,99" is a decimal comma, "1,299" a thousands separator
+        raw = f"{head.replace(',', '')}.{tail}" if len(tail) <= 2 and '.' not in raw else raw.replace(',', '')
+    if cents and '.' not in raw:
+        raw = f"{raw}.{cents}"
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def _context(markup: Markup, start: int, end: int) -> str:
+    """Slice of the markup as str"""
+    window = markup[start:end]
+    return window.decode('utf-8', 'ignore') if isinstance(window, bytes) else window
+
+
+def _score(markup: Markup, start: int, end: int):
+    """(period, confidence) from the keywords around one match"""
+    after = _TAGS.sub(' ', _context(markup, end, end + _AFTER))
+    before_raw = _context(markup, max(0, start - _BEFORE), start)
+    before = _TAGS.sub(' ', before_raw)
+
+    confidence = 0.3
+    period = None
+    if _MONTH.match(after):
+        period, confidence = 'month', confidence + 0.4
+    elif _YEAR.match(after):
+        period, confidence = 'year', confidence + 0.15
+    if _STARTING.search(before):
+        confidence += 0.2
+    if _REGULAR.search(before[-40:]) or _STRUCK.search(before_raw):
+        confidence -= 0.25
+    return period, round(min(1.0, max(0.0, confidence)), 2)
+
+
+def extract_prices(markup: Markup, min_value: float = 0.5, max_value: float = 100.0) -> List[PriceCandidate]:
+    """
+    All plausible prices on a page, best first
+
+    Args:
+        markup: Raw page (str or undecoded bytes)
+        min_value: Ignore prices at or below this (e.g. "$0.01 domain" promos)
+        max_value: Ignore prices at or above this
+
+    Returns:
+        Candidates sorted by confidence (desc), then value (asc)
+    """
+    pattern = _PRICE_RE_BYTES if isinstance(markup, bytes) else _PRICE_RE
+    candidates = []
+    for m in pattern.finditer(markup):
+        if m.group('skip') is not None:
+            continue
+        if m.group('num') is not None:
+            symbol = m.group('sym')
+            symbol = (symbol.decode('utf-8') if isinstance(symbol, bytes) else symbol).lower()
+            currency = _SYMBOLS[symbol]
+            raw, cents = m.group('num'), m.group('cents')
+        else:
+            code = m.group('code')
+            code = (code.decode('utf-8') if isinstance(code, bytes) else code).upper()
+            currency = 'EUR' if code in ('€', '&EURO;') else code
+            raw, cents = m.group('num2'), None
+        if isinstance(raw, bytes):
+            raw = raw.decode('ascii')
+            cents = cents.decode('ascii') if cents else None
+
+        value = _amount(raw, cents)
+        if value is None or not (min_value < value < max_value):
+            continue
+        period, confidence = _score(markup, m.start(), m.end())
+        candidates.append(PriceCandidate(value, currency, period, confidence, m.start()))
+
+    candidates.sort(key=lambda c: (-c.confidence, c.value))
+    return candidates
+
+
+def best_price(markup: Markup, min_value: float = 0.5, max_value: float = 100.0, currency: str = 'USD') -> float:
+    """
+    Most likely advertised (starting) price, or 0.0 if none
+
+    Only `currency` candidates are ranked when the page has any: a euro or
+    rupee amount elsewhere on a USD page must not be read as the USD price.
+    Other currencies are the fallback for pages that show no `currency` price.
+    """
+    candidates = extract_prices(markup, min_value, max_value)
+    preferred = [c for c in candidates if c.currency == currency]
+    candidates = preferred or candidates
+    return candidates[0].value if candidates else 0.0
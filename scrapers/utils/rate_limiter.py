@@ -1,30 +1,173 @@
 """Rate limiter utility for respectful web scraping"""
+import asyncio
 import time
+from email.utils import parsedate_to_datetime
 from threading import Lock
+from typing import Dict, Mapping, Optional, Tuple
+
+from .helpers import host_of
+from ..config import RATE_LIMIT_DELAY, RATE_LIMIT_BURST, RATE_LIMIT_HOSTS, MAX_RETRY_AFTER
 
 
 class RateLimiter:
-    """Simple rate limiter to ensure we don't overwhelm servers"""
-    
-    def __init__(self, requests_per_second: float = 0.5):
+    """Token bucket: sustained `requests_per_second` with bursts up to `burst`"""
+
+    def __init__(self, requests_per_second: float = 0.5, burst: int = 1):
         """
         Initialize rate limiter
-        
+
         Args:
-            requests_per_second: Number of requests allowed per second (default: 0.5 = 1 request per 2 seconds)
+            requests_per_second: Sustained request rate (default: 0.5 = 1 request per 2 seconds)
+            burst: Bucket capacity, i.e. requests allowed back-to-back after idling
         """
-        self.delay = 1.0 / requests_per_second
-        self.last_request_time = 0
+        self.rate = requests_per_second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
         self.lock = Lock()
-    
+
+    def _refill(self, now: float):
+        """Add tokens earned since the last update. Caller holds the lock."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _reserve(self) -> float:
+        """Take a token (possibly on credit) and return how long to wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            deficit_wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(deficit_wait, self.blocked_until - now)
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now (never waits)"""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.blocked_until or self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
     def wait(self):
         """Wait if necessary to respect rate limit"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire(self):
+        """Non-blocking variant of wait() for the async fetch layer"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def defer(self, seconds: float):
+        """Honor a server's Retry-After: hand out no tokens for `seconds`"""
         with self.lock:
-            current_time = time.time()
-            time_since_last_request = current_time - self.last_request_time
-            
-            if time_since_last_request < self.delay:
-                sleep_time = self.delay - time_since_last_request
-                time.sleep(sleep_time)
-            
-            self.last_request_time = time.time()
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + min(seconds, MAX_RETRY_AFTER))
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimitRegistry:
+    """Process-wide RateLimiter per host, shared by every scraper instance"""
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int,
+        overrides: Optional[Dict[str, Tuple[float, int]]] = None,
+    ):
+        """
+        Args:
+            requests_per_second: Default sustained rate per host
+            burst: Default bucket capacity per host
+            overrides: {host: (requests_per_second, burst)} for hosts that need other limits
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.overrides = {host_of(h): v for h, v in (overrides or {}).items()}
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = Lock()
+
+    def get(self, url: str) -> RateLimiter:
+        """Limiter for the host of `url` (a bare host works too)"""
+        host = host_of(url)
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(host)
+                if limiter is None:
+                    rps, burst = self.overrides.get(host, (self.requests_per_second, self.burst))
+                    limiter = RateLimiter(requests_per_second=rps, burst=burst)
+                    self._limiters[host] = limiter
+        return limiter
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Either delay-seconds ("120") or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if missing/invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def parse_rate_limit_reset(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Seconds until an exhausted API quota refills, from RateLimit-* headers
+
+    Args:
+        headers: Response headers; RateLimit-Remaining/-Reset and the
+            X-RateLimit-* variants are read (reset as epoch seconds or a delay)
+
+    Returns:
+        Seconds to wait if no requests remain in the window, else None
+    """
+    lowered = {k.lower(): v for k, v in headers.items()}
+    for prefix in ('ratelimit-', 'x-ratelimit-'):
+        remaining = lowered.get(prefix + 'remaining')
+        if remaining is None:
+            continue
+        try:
+            if int(float(remaining)) > 0:
+                return None
+            reset = float(lowered.get(prefix + 'reset', '1'))
+        except ValueError:
+            return None
+        # Large values are a Unix timestamp (DigitalOcean, Linode), small ones a delay
+        return max(0.0, reset - time.time()) if reset > 1e9 else reset
+    return None
+
+
+_registry: Optional[RateLimitRegistry] = None
+_registry_lock = Lock()
+
+
+def get_rate_limiter(url: str) -> RateLimiter:
+    """Shared limiter for the host of `url`, configured from scrapers/config.py"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RateLimitRegistry(
+                    requests_per_second=1.0 / max(RATE_LIMIT_DELAY, 0.001),
+                    burst=RATE_LIMIT_BURST,
+                    overrides=RATE_LIMIT_HOSTS,
+                )
+    return _registry.get(url)
@@ -0,0 +1,128 @@
+"""
+Record/Replay Transport
+-----------------------
+Captures HTTP responses into a compressed local corpus and serves them back
+offline, so scraper runs can be benchmarked repeatably.
+Handles:
+1. Recording responses that cross fetch_page and BaseAPIClient.make_request
+2. Deterministic replay with no network (an unrecorded request fails like a dead host)
+3. Simulated latency (fixed + random jitter) so replayed runs keep I/O-shaped timing
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import HTTP_REPLAY_MODE, HTTP_REPLAY_DIR, HTTP_REPLAY_LATENCY, HTTP_REPLAY_JITTER
+
+logger = logging.getLogger(__name__)
+
+MODES = ('off', 'record', 'replay')
+
+
+@dataclass
+class Recording:
+    """One captured response"""
+    method: str
+    url: str
+    status: int
+    body: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def request_key(method: str, url: str, params: Any = None, body: Any = None) -> str:
+    """Corpus key for a request (method, URL, query params and JSON/form body)"""
+    material = json.dumps([method.upper(), url, params, body], sort_keys=True, default=str)
+    return hashlib.sha1(material.encode('utf-8')).hexdigest()
+
+
+class ReplayStore:
+    """Directory of gzip'd JSON recordings, one file per request"""
+
+    def __init__(self, directory: Path, mode: str = 'replay', latency: float = 0.0, jitter: float = 0.0):
+        """
+        Args:
+            directory: Corpus location
+            mode: 'record' (network + capture) or 'replay' (corpus only)
+            latency: Seconds added to every replayed response
+            jitter: Extra random 0..jitter seconds per replayed response
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"ReplayStore mode must be 'record' or 'replay', not {mode!r}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency = latency
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self.stats = {'recorded': 0, 'replayed': 0, 'misses': 0}
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    def delay(self) -> float:
+        """Simulated network time for one replayed response"""
+        return self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def get(self, method: str, url: str, params: Any = None, body: Any = None) -> Optional[Recording]:
+        """Recorded response for a request, or None if it was never captured"""
+        path = self.directory / f"{request_key(method, url, params, body)}.json.gz"
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                recording = Recording(**json.load(f))
+        except FileNotFoundError:
+            with self._lock:
+                self.stats['misses'] += 1
+            logger.warning(f"Replay miss: {method} {url} was not recorded")
+            return None
+        with self._lock:
+            self.stats['replayed'] += 1
+        return recording
+
+    def put(self, recording: Recording, params: Any = None, body: Any = None):
+        """Capture a response (overwrites an earlier recording of the same request)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        key = request_key(recording.method, recording.url, params, body)
+        tmp = self.directory / f"{key}.tmp"
+        with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+            json.dump(asdict(recording), f)
+        os.replace(tmp, self.directory / f"{key}.json.gz")
+        with self._lock:
+            self.stats['recorded'] += 1
+
+    def report(self) -> str:
+        s = self.stats
+        return f"Replay ({self.mode}): {s['recorded']} recorded, {s['replayed']} replayed, {s['misses']} misses"
+
+
+_store: Optional[ReplayStore] = None
+_store_lock = threading.Lock()
+
+
+def get_replay_store() -> Optional[ReplayStore]:
+    """Process-wide store, or None when HTTP_REPLAY_MODE is 'off'"""
+    global _store
+    if _store is None:
+        mode = HTTP_REPLAY_MODE.lower()
+        if mode not in MODES:
+            logger.warning(f"Unknown HTTP_REPLAY_MODE '{HTTP_REPLAY_MODE}', replay disabled")
+            return None
+        if mode == 'off':
+            return None
+        with _store_lock:
+            if _store is None:
+                directory = Path(HTTP_REPLAY_DIR)
+                if not directory.is_absolute():
+                    directory = Path(__file__).parent.parent.parent / directory
+                _store = ReplayStore(directory, mode, HTTP_REPLAY_LATENCY, HTTP_REPLAY_JITTER)
+    return _store
@@ -0,0 +1,159 @@
+"""
+Selector Stats
+--------------
+Per-selector match telemetry for selector_registry, persisted across runs.
+Handles:
+1. Counting checks / hits and selector latency per (provider, field)
+2. Charging the heuristic fallback a miss caused to the selector that missed
+3. Dead selectors: checked at least SELECTOR_DEAD_AFTER times without a hit
+4. Resetting a selector's counters when its CSS is edited in the registry
+
+Review the counters (dead selectors first):
+    python -m scrapers.utils.selector_stats [--dead]
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .. import metrics
+from ..config import SELECTOR_STATS_PATH, SELECTOR_DEAD_AFTER
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorStats:
+    """{provider: {field: counters}} persisted as one JSON file"""
+
+    def __init__(self, path: Path, dead_after: int = SELECTOR_DEAD_AFTER):
+        """
+        Args:
+            path: JSON file holding the counters of previous runs
+            dead_after: Checks without a single hit before a selector counts as dead
+        """
+        self.path = Path(path)
+        self.dead_after = dead_after
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+        self._dirty = False
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Lazy-load the counters. Caller holds the lock."""
+        if self._data is None:
+            try:
+                with open(self.path, 'r') as f:
+                    self._data = json.load(f)
+            except FileNotFoundError:
+                self._data = {}
+            except Exception as e:
+                logger.warning(f"Selector stats unreadable, starting empty: {e}")
+                self._data = {}
+        return self._data
+
+    def record(self, provider: str, field: str, css: str, hit: bool, seconds: float,
+               fallback_seconds: float = 0.0):
+        """
+        Count one lookup of a registry selector
+
+        Args:
+            hit: Whether the selector matched a usable value
+            seconds: Time spent on the selector lookup (parse included)
+            fallback_seconds: Heuristic extraction run because the selector missed
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            fields = self._load().setdefault(provider, {})
+            entry = fields.get(field)
+            if entry is None or entry.get('css') != css:
+                # New or edited selector: its old record says nothing about this one
+                entry = fields[field] = {'css': css, 'checks': 0, 'hits': 0, 'seconds': 0.0,
+                                         'fallback_seconds': 0.0, 'last_hit': None}
+            entry['checks'] += 1
+            entry['seconds'] += seconds
+            entry['fallback_seconds'] += fallback_seconds
+            entry['last_checked'] = now
+            if hit:
+                entry['hits'] += 1
+                entry['last_hit'] = now
+            self.stats['hits' if hit else 'misses'] += 1
+            self._dirty = True
+        metrics.incr('selector_hit' if hit else 'selector_miss')
+
+    def get(self, provider: str, field: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._load().get(provider, {}).get(field)
+            return dict(entry) if entry else None
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """One row per selector, lowest hit rate first"""
+        with self._lock:
+            rows = [
+                {'provider': provider, 'field': field, **entry,
+                 'hit_rate': entry['hits'] / entry['checks'] if entry['checks'] else 0.0}
+                for provider, fields in self._load().items() for field, entry in fields.items()
+            ]
+        return sorted(rows, key=lambda r: (r['hit_rate'], -r['checks'], r['provider']))
+
+    def dead(self) -> List[Dict[str, Any]]:
+        """Selectors that never matched in `dead_after` or more checks"""
+        return [r for r in self.rows() if r['hits'] == 0 and r['checks'] >= self.dead_after]
+
+    def save(self):
+        with self._lock:
+            if not self._dirty or self._data is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self._data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+    def report(self) -> str:
+        s = self.stats
+        checks = s['hits'] + s['misses']
+        dead = self.dead()
+        summary = f"Selectors: {s['hits']}/{checks} matched this run"
+        if dead:
+            names = ", ".join(f"{r['provider']}.{r['field']}" for r in dead[:5])
+            summary += f", {len(dead)} dead ({names}{', ...' if len(dead) > 5 else ''})"
+        return summary
+
+
+_stats: Optional[SelectorStats] = None
+_stats_lock = threading.Lock()
+
+
+def get_selector_stats() -> SelectorStats:
+    """Process-wide counters, saved at exit and by the pipeline"""
+    global _stats
+    if _stats is None:
+        with _stats_lock:
+            if _stats is None:
+                path = Path(SELECTOR_STATS_PATH)
+                if not path.is_absolute():
+                    path = Path(__file__).parent.parent.parent / path
+                _stats = SelectorStats(path)
+                atexit.register(_stats.save)
+    return _stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Registry selector hit rates across runs")
+    parser.add_argument("--dead", action="store_true", help=f"Only selectors with no hit in {SELECTOR_DEAD_AFTER}+ checks")
+    args = parser.parse_args()
+
+    stats = get_selector_stats()
+    rows = stats.dead() if args.dead else stats.rows()
+    for r in rows:
+        avg_ms = 1000 * r['seconds'] / r['checks'] if r['checks'] else 0.0
+        print(f"{r['hit_rate']:>5.0%} {r['hits']:>4}/{r['checks']:<4} {avg_ms:>7.1f}ms "
+              f"fallback {r['fallback_seconds']:>6.2f}s  {r['provider']}.{r['field']}  {r['css']}")
+    print(f"\n{len(rows)} selectors ({len(stats.dead())} dead) in {stats.path}")
@@ -0,0 +1,134 @@
+"""
+Verified Data Registry
+----------------------
+Process-wide, read-only view of data/verified_data.json.
+Handles:
+1. Loading the file once per process (not once per scraper)
+2. O(1) provider lookups through a normalized name index per category
+3. Transparent reload when the file's mtime changes
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+VERIFIED_DATA_PATH = Path(__file__).parent.parent / "data" / "verified_data.json"
+
+# How often (seconds) to stat the file for changes; lookups in between do no I/O
+MTIME_CHECK_INTERVAL = 5.0
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+
+def normalize_name(name: str) -> str:
+    """'Hide.me' -> 'hideme', 'WP Engine' -> 'wpengine'"""
+    return _NON_ALNUM.sub('', (name or '').lower())
+
+
+def record_name(record: Dict[str, Any]) -> str:
+    """Hosting records use 'name', VPN records use 'provider_name'"""
+    return record.get('name') or record.get('provider_name') or ''
+
+
+class VerifiedRegistry:
+    """Loads verified_data.json once and serves indexed lookups"""
+
+    def __init__(self, path: Path = VERIFIED_DATA_PATH, check_interval: float = MTIME_CHECK_INTERVAL):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._data: Dict[str, List[Dict[str, Any]]] = {}
+        self._index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._mtime: Optional[float] = None
+        self._last_check = 0.0
+
+    def _load(self, mtime: Optional[float]):
+        """(Re)build data and indexes. Caller holds the lock."""
+        data: Dict[str, Any] = {}
+        if mtime is not None:
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load verified data registry: {e}")
+                data = {}
+
+        index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for category, records in data.items():
+            if not isinstance(records, list):
+                continue
+            index[category] = {normalize_name(record_name(r)): r for r in records}
+
+        self._data = data
+        self._index = index
+        self._mtime = mtime
+        logger.info(
+            f"Loaded {len(data.get('hosting', []))} hosting + {len(data.get('vpn', []))} VPN providers from {self.path}"
+        )
+
+    def _current_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        if self._last_check and now - self._last_check < self.check_interval:
+            return
+        with self._lock:
+            if self._last_check and now - self._last_check < self.check_interval:
+                return
+            mtime = self._current_mtime()
+            if not self._last_check or mtime != self._mtime:
+                self._load(mtime)
+            self._last_check = now
+
+    def get(self, category: str, name: str) -> Dict[str, Any]:
+        """
+        Find a provider record
+
+        Args:
+            category: 'hosting' or 'vpn'
+            name: Provider name (case and punctuation insensitive)
+
+        Returns:
+            The shared record (treat as read-only), or {} if not found
+        """
+        self._ensure_fresh()
+        return self._index.get(category, {}).get(normalize_name(name), {})
+
+    def records(self, category: str) -> List[Dict[str, Any]]:
+        """All records of a category, in file order"""
+        self._ensure_fresh()
+        return self._data.get(category, [])
+
+    def data(self) -> Dict[str, Any]:
+        """The whole registry document"""
+        self._ensure_fresh()
+        return self._data
+
+    def invalidate(self):
+        """Force a reload on next access"""
+        with self._lock:
+            self._last_check = 0.0
+
+
+_registry: Optional[VerifiedRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> VerifiedRegistry:
+    """Process-wide registry singleton"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = VerifiedRegistry()
+    return _registry
@@ -1,38 +1,24 @@
-"""VPN scrapers — 25 verified providers with real data"""
-from .nordvpn import NordVPNScraper
-from .expressvpn import ExpressVPNScraper
-from .surfshark import SurfsharkScraper
-from .cyberghost import CyberGhostScraper
-from .protonvpn import ProtonVPNScraper
-from .pia import PIAScraper
-from .ipvanish import IPVanishScraper
-from .mullvad import MullvadScraper
-from .windscribe import WindscribeScraper
-from .tunnelbear import TunnelBearScraper
-from .vyprvpn import VyprVPNScraper
-from .purevpn import PureVPNScraper
-from .hotspotshield import HotspotShieldScraper
-from .hideme import HideMeScraper
-from .privatevpn import PrivateVPNScraper
-from .ivacy import IvacyScraper
-from .torguard import TorGuardScraper
-from .strongvpn import StrongVPNScraper
-from .mozillavpn import MozillaVPNScraper
-from .astrill import AstrillScraper
-from .airvpn import AirVPNScraper
-from .ovpn import OVPNScraper
-from .zenmate import ZenMateScraper
-from .kasperskyvpn import KasperskyVPNScraper
-from .nortonvpn import NortonVPNScraper
+"""VPN scrapers — hand-written modules go here; every other provider in
+data/verified_data.json is served by the generic registry scraper"""
+import importlib
 
-__all__ = [
-    'NordVPNScraper', 'ExpressVPNScraper', 'SurfsharkScraper',
-    'CyberGhostScraper', 'ProtonVPNScraper', 'PIAScraper',
-    'IPVanishScraper', 'MullvadScraper', 'WindscribeScraper',
-    'TunnelBearScraper', 'VyprVPNScraper', 'PureVPNScraper',
-    'HotspotShieldScraper', 'HideMeScraper', 'PrivateVPNScraper',
-    'IvacyScraper', 'TorGuardScraper', 'StrongVPNScraper',
-    'MozillaVPNScraper', 'AstrillScraper', 'AirVPNScraper',
-    'OVPNScraper', 'ZenMateScraper', 'KasperskyVPNScraper',
-    'NortonVPNScraper'
-]
+# Class name -> module of hand-written scrapers, imported on first access (PEP 562)
+_MODULES = {
+    'NordVPNScraper': 'nordvpn',
+}
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(f'.{_MODULES[name]}', __name__), name)
+    if name.endswith('Scraper') and not name.startswith('_'):
+        from ..registry_scraper import scraper_class
+        try:
+            return scraper_class('vpn', name)
+        except KeyError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODULES))
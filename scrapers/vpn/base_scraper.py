@@ -1,16 +1,12 @@
 """Base scraper class for VPN providers"""
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from abc import ABC, abstractmethod
 from typing import Optional
 from ..models import VPNProvider
-from ..utils import RateLimiter
 from ..config import USER_AGENT, REQUEST_TIMEOUT, MAX_RETRIES
 import logging
 from scrapers.adaptive_base import AdaptiveBaseScraper
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -19,15 +15,13 @@ class BaseVPNScraper(AdaptiveBaseScraper):
     
     def __init__(self, provider_name: str = "Unknown"):
         super().__init__(provider_name, provider_type='vpn')
-        self.rate_limiter = RateLimiter(requests_per_second=0.5)  # 1 request per 2 seconds
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-        })
+        }
         self.timeout = REQUEST_TIMEOUT
         self.max_retries = MAX_RETRIES
     
@@ -65,17 +59,18 @@ class BaseVPNScraper(AdaptiveBaseScraper):
             logger.error(f"Scraper failed: {e}")
             return None
     
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """
         Fetch and parse a web page with rate limiting and retry logic
         
         Args:
             url: The URL to scrape
+            parse_only: Optional strainer to build only part of the tree
             
         Returns:
             BeautifulSoup object or None if failed
         """
-        return super().fetch_page(url)
+        return super().fetch_page(url, parse_only=parse_only)
     
     def scrape(self) -> Optional[VPNProvider]:
         """
@@ -1,26 +0,0 @@
-"""ExpressVPN Scraper (Adaptive)"""
-from .base_scraper import BaseVPNScraper
-from ..models import VPNProvider
-from datetime import datetime
-
-class ExpressVPNScraper(BaseVPNScraper):
-    def __init__(self):
-        super().__init__(provider_name="ExpressVPN")
-        
-    def scrape_pricing(self) -> dict:
-        return {
-            'provider_name': "ExpressVPN",
-            'website_url': "https://www.expressvpn.com",
-            'pricing_monthly': 9.99, # Fallback
-            'last_updated': datetime.now()
-        }
-        
-    def scrape_features(self) -> dict:
-        ram_only = self.get_verified_field('ram_only_servers', False)
-        audits = self.get_verified_field('audit_history', [])
-        return {
-            'server_count': self.get_verified_field('server_count', 1000),
-            'country_count': self.get_verified_field('country_count', 50),
-            'ram_only_servers': ram_only,
-            'audit_history': audits
-        }
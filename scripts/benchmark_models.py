@@ -0,0 +1,97 @@
+"""
+Model construction micro-benchmark — per-plan HostingProvider(...) + setattr specs
+vs the bulk TypeAdapter path used by BaseHostingScraper.scrape_plans.
+
+Uses every hosting scraper's real plan rows and verified specs (no network:
+live price lookups are disabled). Also checks both paths build identical models.
+
+Usage: python scripts/benchmark_models.py [--repeat N]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.adaptive_base import AdaptiveBaseScraper
+from scrapers.model_factory import build_models, split_specs
+from scrapers.models import HostingProvider
+from scrapers.scraper_manifest import load_manifest
+
+
+def legacy_build(rows, specs):
+    """The previous path: validate each plan, then setattr every truthy known spec"""
+    plans = [HostingProvider(**row) for row in rows]
+    for plan in plans:
+        for key, value in (specs or {}).items():
+            if hasattr(plan, key) and value:
+                setattr(plan, key, value)
+    return plans
+
+
+def construct_build(rows, specs):
+    """model_construct with pre-checked specs, for reference"""
+    valid, unvalidated = split_specs(HostingProvider, specs)
+    return [HostingProvider.model_construct(**{**row, **valid, **unvalidated}) for row in rows]
+
+
+def timed(fn, rows, specs, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(rows, specs)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def comparable(plan):
+    return plan.model_dump(mode='json', exclude={'last_updated'})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark provider model construction")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed runs per scraper")
+    args = parser.parse_args(argv)
+
+    AdaptiveBaseScraper.get_live_data = lambda self, url: {}  # registry data only
+
+    paths = {
+        'per-plan + setattr': legacy_build,
+        'model_construct': construct_build,
+        'bulk TypeAdapter': lambda rows, specs: build_models(HostingProvider, rows, specs),
+    }
+    totals = dict.fromkeys(paths, 0.0)
+    plan_count = 0
+    mismatches = []
+    for entry in load_manifest(provider_type='hosting'):
+        scraper = entry.load()()
+        try:
+            rows = scraper.plan_rows()
+        except Exception as e:
+            print(f"⏭️  {entry.class_name}: plan rows failed ({e})")
+            continue
+        specs = scraper.get_verified_field('specs', {})
+        plan_count += len(rows) * args.repeat
+        results = {}
+        for label, fn in paths.items():
+            seconds, results[label] = timed(fn, rows, specs, args.repeat)
+            totals[label] += seconds * args.repeat
+        if [comparable(p) for p in results['per-plan + setattr']] != [comparable(p) for p in results['bulk TypeAdapter']]:
+            mismatches.append(entry.class_name)
+
+    print(f"{'path':<22} {'per plan':>10} {'speedup':>8}")
+    for label, seconds in totals.items():
+        per_plan = seconds / plan_count * 1e6 if plan_count else 0
+        speedup = totals['per-plan + setattr'] / seconds if seconds else 0
+        print(f"{label:<22} {per_plan:>8.1f}µs {speedup:>7.2f}x")
+    if mismatches:
+        print(f"\n⚠️  Bulk path differs from the legacy path for: {', '.join(mismatches)}")
+        return 1
+    print(f"\n✅ Identical models for all scrapers ({plan_count // args.repeat} plans)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Parse pool scaling benchmark — live price extraction (selector + heuristics)
+over a page corpus, inline vs 2..N worker processes.
+
+Reads the same corpora as benchmark_parsers.py (HTTP cache directory, replay
+corpus or a folder of *.html / *.html.gz files). Pages whose host has a
+dedicated selector in selector_registry are extracted with it, as
+get_live_data does. Without a corpus, --synthetic N generates pricing pages.
+
+Usage: python scripts/benchmark_parse_pool.py [--corpus DIR | --synthetic N] [--repeat N] [--chunksize N]
+
+Near-linear scaling needs as many idle cores as workers: results on a
+loaded or single-core machine are capped accordingly.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.config import HTTP_CACHE_DIR, PARSE_POOL_CHUNKSIZE
+from scrapers.selector_registry import get_selectors
+from scrapers.utils.helpers import host_of
+from scrapers.utils.parse_pool import ParsePool
+from scrapers.verified_registry import get_registry, record_name
+from scripts.benchmark_parsers import load_corpus
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def selector_index():
+    """host -> dedicated price selector, for registry providers that have one"""
+    index = {}
+    for category in ('hosting', 'vpn'):
+        for record in get_registry().records(category):
+            css = (get_selectors(record_name(record)) or {}).get('price_css')
+            if css and record.get('url'):
+                index[host_of(record['url'])] = css
+    return index
+
+
+def synthetic_pages(count):
+    """Pricing-page-like documents (~40KB: navigation, inline script, plan cards)"""
+    nav = ''.join(f'<li><a href="/p{i}">Product {i}</a></li>' for i in range(200))
+    script = '<script>var plans = ' + ','.join(f'{{"id":{i},"price":"${i}.99"}}' for i in range(400)) + ';</script>'
+    pages = []
+    for n in range(count):
+        cards = ''.join(
+            f'<div class="plan"><h3>Plan {i}</h3><del>$19.99</del>'
+            f'<span class="price">${1 + (n + i) % 9}.{(n * 7 + i) % 100:02d}</span><span>/mo</span>'
+            + '<ul>' + '<li>Unmetered bandwidth, free SSL, daily backups</li>' * 30 + '</ul></div>'
+            for i in range(12)
+        )
+        html = f'<html><head>{script}</head><body><nav><ul>{nav}</ul></nav><main>{cards}</main></body></html>'
+        pages.append((f'synthetic-{n}.html', html, '.plan .price' if n % 2 else None))
+    return pages
+
+
+def run(pool, pages, repeat):
+    """(seconds, results) for extracting every page `repeat` times"""
+    batch = [(html, css) for _, html, css in pages] * repeat
+    start = time.perf_counter()
+    results = pool.extract_many(batch)
+    return time.perf_counter() - start, results[:len(pages)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure parse pool scaling on recorded pages")
+    parser.add_argument("--corpus", type=Path, default=PROJECT_ROOT / HTTP_CACHE_DIR,
+                        help="HTTP cache directory, replay corpus or folder of .html/.html.gz files")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="Generate N pricing pages instead")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the corpus per measurement")
+    parser.add_argument("--chunksize", type=int, default=PARSE_POOL_CHUNKSIZE, help="Pages per worker task")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        pages = synthetic_pages(args.synthetic)
+    else:
+        if not args.corpus.is_dir():
+            print(f"❌ Corpus not found: {args.corpus} (run the pipeline first, pass --corpus or --synthetic N)")
+            return 1
+        selectors = selector_index()
+        pages = [(name, html, selectors.get(host_of(name))) for name, html in load_corpus(args.corpus)]
+        if not pages:
+            print(f"❌ No pages in {args.corpus}")
+            return 1
+
+    size = sum(len(html) for _, html, _ in pages) / len(pages) / 1024
+    print(f"📄 {len(pages)} pages (avg {size:.0f}KB, {sum(1 for p in pages if p[2])} with selectors), "
+          f"{os.cpu_count()} CPUs, chunksize {args.chunksize}\n")
+
+    counts = [1] + [w for w in (2, 4, 8, 16, 32, 64) if w <= args.max_workers]
+    if args.max_workers > 1 and args.max_workers not in counts:
+        counts.append(args.max_workers)
+    baseline, reference = None, None
+    print(f"{'workers':>8} {'pages/s':>9} {'speedup':>8} {'efficiency':>11}")
+    for workers in counts:
+        pool = ParsePool(workers=workers if workers > 1 else 0, chunksize=args.chunksize, min_bytes=0)
+        try:
+            run(pool, pages[:workers * args.chunksize], 1)  # start the workers outside the timing
+            seconds, results = run(pool, pages, args.repeat)
+        finally:
+            pool.shutdown()
+        prices = [r.get('price') for r in results]
+        if reference is None:
+            baseline, reference = seconds, prices
+        elif prices != reference:
+            print(f"⚠️  {workers} workers extracted different prices than inline")
+            return 1
+        speedup = baseline / seconds
+        label = f"{workers}" if workers > 1 else "inline"
+        print(f"{label:>8} {len(pages) * args.repeat / seconds:>9.1f} {speedup:>7.2f}x {speedup / workers:>10.0%}")
+    print(f"\n✅ Identical prices for every worker count ({sum(1 for p in reference if p)} pages priced)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+HTML parser benchmark — parse time and peak memory per provider page.
+
+Reads a recorded corpus (by default the pages kept in the HTTP cache after a
+pipeline run, or a directory of *.html / *.html.gz files) and parses every
+page with each available backend.
+
+Usage: python scripts/benchmark_parsers.py [--corpus DIR] [--repeat N] [--selector CSS]
+
+With --selector the lookup is included, plus a partial parse restricted to
+the subtrees that selector can match (SoupStrainer, as get_live_data does).
+
+Peak memory is measured with tracemalloc, which only sees the Python heap:
+BeautifulSoup trees live there, selectolax keeps its tree in C, so its number
+is a lower bound.
+"""
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from scrapers.config import HTTP_CACHE_DIR
+from scrapers.utils.html_parser import HAS_LXML, HAS_SELECTOLAX, LexborHTMLParser, strainer_for
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_corpus(directory: Path):
+    """[(name, html)] from an HTTP cache directory, a replay corpus or a folder of saved pages"""
+    pages = []
+    index_file = directory / "index.json"
+    if index_file.exists():
+        with open(index_file, "r") as f:
+            index = json.load(f)
+        for key, entry in index.items():
+            body = directory / f"{key}.gz"
+            if body.exists():
+                with gzip.open(body, "rt", encoding="utf-8") as f:
+                    pages.append((entry.get("url", key), f.read()))
+        return pages
+
+    for path in sorted(directory.iterdir()):
+        if path.name.endswith(".json.gz"):
+            # Replay recording (HTTP_REPLAY_MODE=record): pages only, not API responses
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                recording = json.load(f)
+            headers = {k.lower(): v for k, v in recording.get("headers", {}).items()}
+            if "html" in headers.get("content-type", "text/html"):
+                pages.append((recording["url"], recording["body"]))
+        elif path.name.endswith(".html.gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                pages.append((path.name, f.read()))
+        elif path.suffix == ".html":
+            pages.append((path.name, path.read_text(encoding="utf-8", errors="replace")))
+    return pages
+
+
+def backends(selector):
+    """name -> callable(html) for every installed backend"""
+    found = {"html.parser": lambda html: BeautifulSoup(html, "html.parser")}
+    if HAS_LXML:
+        found["lxml"] = lambda html: BeautifulSoup(html, "lxml")
+    if HAS_SELECTOLAX:
+        found["selectolax"] = lambda html: LexborHTMLParser(html)
+    if selector:
+        # Include the lookup itself, which is what get_live_data actually pays for
+        for name, parse in list(found.items()):
+            if name == "selectolax":
+                found[name] = lambda html, parse=parse: parse(html).css_first(selector)
+            else:
+                found[name] = lambda html, parse=parse: parse(html).select_one(selector)
+        strainer = strainer_for(selector)
+        if strainer is not None:
+            builder = "lxml" if HAS_LXML else "html.parser"
+            found[f"{builder}+strain"] = lambda html: BeautifulSoup(html, builder, parse_only=strainer).select_one(selector)
+    return found
+
+
+def measure(parse, html, repeat):
+    """(median seconds, peak bytes)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(timings), peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare HTML parser backends on recorded pages")
+    parser.add_argument("--corpus", type=Path, default=PROJECT_ROOT / HTTP_CACHE_DIR,
+                        help="HTTP cache directory or folder of .html/.html.gz files")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed parses per page and backend")
+    parser.add_argument("--selector", help="Also run this CSS selector after parsing")
+    args = parser.parse_args(argv)
+
+    if not args.corpus.is_dir():
+        print(f"❌ Corpus not found: {args.corpus} (run the pipeline first or pass --corpus)")
+        return 1
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"❌ No pages in {args.corpus}")
+        return 1
+
+    candidates = backends(args.selector)
+    totals = {name: [0.0, 0] for name in candidates}
+    print(f"📄 {len(pages)} pages, backends: {', '.join(candidates)}\n")
+    print(f"{'page':<50} {'KB':>7} " + " ".join(f"{name:>22}" for name in candidates))
+
+    for name, html in pages:
+        cells = []
+        for backend, parse in candidates.items():
+            seconds, peak = measure(parse, html, args.repeat)
+            totals[backend][0] += seconds
+            totals[backend][1] = max(totals[backend][1], peak)
+            cells.append(f"{seconds * 1000:>8.1f}ms {peak / 1024 / 1024:>8.1f}MB")
+        print(f"{name[-50:]:<50} {len(html) / 1024:>7.0f} " + " ".join(f"{c:>22}" for c in cells))
+
+    print("\n📊 Totals (sum of medians, max peak):")
+    baseline = totals["html.parser"][0]
+    for backend, (seconds, peak) in totals.items():
+        speedup = baseline / seconds if seconds else 0
+        print(f"   {backend:<12} {seconds * 1000:>9.1f}ms  {peak / 1024 / 1024:>7.1f}MB peak  {speedup:>5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
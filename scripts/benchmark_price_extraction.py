@@ -0,0 +1,94 @@
+"""
+Price extraction micro-benchmark — legacy soup heuristic vs the single-pass engine.
+
+Runs over the same recorded corpus as benchmark_parsers.py (HTTP cache
+directory or a folder of *.html / *.html.gz files).
+
+Usage: python scripts/benchmark_price_extraction.py [--corpus DIR] [--repeat N]
+"""
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from scrapers.config import HTTP_CACHE_DIR
+from scrapers.utils.price_extractor import best_price, extract_prices
+from scripts.benchmark_parsers import load_corpus
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def legacy_smart_extract(html):
+    """The previous AdaptiveBaseScraper._smart_extract_price, kept for comparison"""
+    text = BeautifulSoup(html, 'html.parser').get_text()
+    valid = []
+    for m in re.compile(r'\$\s?(\d+\.?\d{0,2})').findall(text):
+        try:
+            val = float(m)
+            if 0.5 < val < 100:
+                valid.append(val)
+        except ValueError:
+            pass
+    return min(valid) if valid else 0.0
+
+
+def single_pass(html):
+    return best_price(html)
+
+
+def timed(fn, arg, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(arg)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark price extraction on recorded pages")
+    parser.add_argument("--corpus", type=Path, default=PROJECT_ROOT / HTTP_CACHE_DIR,
+                        help="HTTP cache directory or folder of .html/.html.gz files")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per page")
+    args = parser.parse_args(argv)
+
+    if not args.corpus.is_dir():
+        print(f"❌ Corpus not found: {args.corpus} (run the pipeline first or pass --corpus)")
+        return 1
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"❌ No pages in {args.corpus}")
+        return 1
+
+    totals = {'legacy': 0.0, 'str': 0.0, 'bytes': 0.0}
+    print(f"{'page':<50} {'legacy':>16} {'single-pass':>16} {'bytes':>10}  top candidate")
+    for name, html in pages:
+        raw = html.encode('utf-8')
+        legacy_s, legacy_price = timed(legacy_smart_extract, html, args.repeat)
+        new_s, new_price = timed(single_pass, html, args.repeat)
+        bytes_s, _ = timed(single_pass, raw, args.repeat)
+        totals['legacy'] += legacy_s
+        totals['str'] += new_s
+        totals['bytes'] += bytes_s
+        top = extract_prices(html)[:1]
+        detail = f"{top[0].currency} {top[0].value} /{top[0].period or '?'} ({top[0].confidence})" if top else "-"
+        print(
+            f"{name[-50:]:<50} {legacy_s * 1000:>7.1f}ms ${legacy_price:<6} "
+            f"{new_s * 1000:>7.1f}ms ${new_price:<6} {bytes_s * 1000:>8.1f}ms  {detail}"
+        )
+
+    print("\n📊 Totals (sum of medians):")
+    for label, seconds in totals.items():
+        speedup = totals['legacy'] / seconds if seconds else 0
+        print(f"   {label:<8} {seconds * 1000:>9.1f}ms  {speedup:>5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
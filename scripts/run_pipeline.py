@@ -1,163 +1,270 @@
 import sys
-import os
-import glob
-import importlib
-import inspect
+import argparse
+import threading
 import time
 from pathlib import Path
-from dotenv import load_dotenv
-from supabase import create_client, Client
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
-# Load Env Vars
-load_dotenv(PROJECT_ROOT / ".env")
-load_dotenv(PROJECT_ROOT / "frontend" / ".env.local")
+# Only cheap modules at import time: the Supabase client, the engine and the
+# pydantic models are loaded when the pipeline actually runs, so --help is instant
+from scrapers import metrics
+from scrapers.bootstrap import get_supabase, get_writer, load_env, setup_logging, supabase_error
+from scrapers.local_store import get_local_store
+from scrapers.config import (
+    PIPELINE_WORKERS, PIPELINE_PER_HOST_LIMIT, SCRAPER_TIMEOUT, METRICS_PATH, SCRAPER_STATUS_TIMINGS,
+    EXPORT_FORMATS,
+)
 
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+# Serializes scraper_status writes so concurrent scrapers (and timeouts) can't interleave
+_status_lock = threading.Lock()
+# manifest entry -> provider_name it reported, so timeouts land on the same status row
+_provider_names = {}
+# manifest entry -> its RunMetrics, so a timeout can still report where the time went
+_run_metrics = {}
 
-if not SUPABASE_URL or not SUPABASE_KEY:
-    print("⚠️  Warning: SUPABASE_URL or SUPABASE_KEY not found in .env")
-    # We continue, but sync will fail
+def discover_scrapers(provider_type=None):
+    """Scrapers listed in the build-time manifest; a module is only imported when its scraper runs"""
+    from scrapers.scraper_manifest import load_manifest
+    return load_manifest(provider_type=provider_type)
 
-try:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-except Exception as e:
-    print(f"⚠️  Failed to init Supabase client: {e}")
-    supabase = None
+def discover_api_clients():
+    """API clients with credentials in scrapers/config.py; a client module is only imported when it runs"""
+    from scrapers.hosting.api import configured_clients
+    return configured_clients()
 
-from scrapers.hosting.base_scraper import BaseHostingScraper
-from scrapers.vpn.base_scraper import BaseVPNScraper
-from scrapers.models import HostingProvider, VPNProvider
+def log_scraper_status(provider_name, provider_type, status, duration, error=None, items=0, cancel_event=None, timings=None):
+    with _status_lock:
+        # A timed-out job was already recorded by the engine; drop its late result
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        _write_scraper_status(provider_name, provider_type, status, duration, error, items, timings)
 
-def discover_scrapers(directory):
-    """Dynamically find scraper classes in a directory"""
-    scrapers = []
-    search_path = PROJECT_ROOT / directory
+def _write_scraper_status(provider_name, provider_type, status, duration, error, items, timings=None):
+    data = {
+        "provider_name": provider_name,
+        "provider_type": provider_type,
+        "status": status,
+        "duration_seconds": round(duration, 2),
+        "error_message": str(error) if error else None,
+        "items_synced": items,
+        "last_run": "now()"
+    }
+    if SCRAPER_STATUS_TIMINGS:
+        # Per-phase breakdown, e.g. {"network": 1.2, "parse": 0.3, "models": 0.01}
+        data["phase_timings"] = timings or {}
+    get_local_store().put("scraper_status", data, on_conflict="provider_name", label=provider_name)
+
+def flush_writes():
+    """
+    Replicate dirty rows from the local store to Supabase: provider rows first,
+    then statuses (downgraded for providers whose rows failed)
+    """
+    store = get_local_store()
+    writer = get_writer()
+    if not writer:
+        print(f"🗄️  {store.report()} (no Supabase client, replicating next run)")
+        return
+    with metrics.span('supabase_flush'):
+        queued = store.queue_dirty(writer, tables=["hosting_providers", "vpn_providers"])
+        writer.flush(tables=["hosting_providers", "vpn_providers"])
+    # writer.failures also holds rows that failed in earlier auto-flushes.
+    # Grouped by label, the job that wrote the row: a failed "DreamHost API" row
+    # downgrades that job's status, not the DreamHost scraper's
+    failed_by_provider = {}
+    for failure in writer.failures:
+        if failure.table != "scraper_status":
+            failed_by_provider.setdefault(failure.label, []).append(failure)
     
-    # Walk through files
-    for filepath in search_path.rglob("*.py"):
-        if filepath.name == "__init__.py" or "base_scraper" in filepath.name:
-            continue
-            
-        module_name = f"scrapers.{directory.replace('/', '.')}.{filepath.stem}"
+    for provider_name, errors in failed_by_provider.items():
+        print(f"❌ {provider_name}: {len(errors)} rows failed to sync ({errors[0].error})")
+        with _status_lock:
+            status = store.get("scraper_status", provider_name)
+            if status:
+                status["status"] = "error"
+                status["error_message"] = f"{len(errors)} rows failed to sync: {errors[0].error}"
+                status["items_synced"] = max(0, status["items_synced"] - len(errors))
+                store.put("scraper_status", status, on_conflict="provider_name", label=provider_name)
+    
+    with metrics.span('supabase_flush'):
+        queued += store.queue_dirty(writer, tables=["scraper_status"])
+        status_failures = writer.flush()
+    # Older databases lack the phase_timings column: write those statuses without it
+    missing_column = [f for f in status_failures if "phase_timings" in f.error]
+    if missing_column:
+        print("ℹ️  scraper_status has no phase_timings (jsonb) column, logging statuses without timings")
+        writer.failures = [f for f in writer.failures if f not in missing_column]
+        for failure in missing_column:
+            failure.payload.pop("phase_timings", None)
+            writer.add("scraper_status", failure.payload, on_conflict="provider_name", label=failure.label)
+        status_failures = [f for f in status_failures if f not in missing_column] + writer.flush()
+    for failure in status_failures:
+        print(f"⚠️  Failed to log status for {failure.label}: {failure.error}")
+    # Rejected rows stay dirty and are retried on the next run
+    store.mark_synced(queued, writer.failures)
+    print(f"🗄️  {writer.report()}")
+    print(f"🗄️  {store.report()}")
+
+def run_scraper(entry, cancel_event=None):
+    from scrapers.models import HostingProvider
+    start_time = time.time()
+    scraper_name = entry.class_name
+    # Manifest name until the scraper reports its own (also used if instantiation fails)
+    guessed_name = entry.provider_name
+    provider_name = guessed_name
+    
+    with metrics.scraper_run(guessed_name) as run_metrics:
+        _run_metrics[entry] = run_metrics
         try:
-            # Import module dynamically (e.g. scrapers.hosting.scrapers.bluehost)
-            # We need to handle the relative path conversion better
-            # If directory is 'scrapers/hosting/scrapers', module is scrapers.hosting.scrapers.bluehost
+            with metrics.span('import'):
+                scraper_class = entry.load()
+            with metrics.span('construct'):
+                scraper = scraper_class()
+            provider_name = scraper.provider_name
             
-            rel_path = filepath.relative_to(PROJECT_ROOT)
-            module_import = str(rel_path).replace(os.sep, ".").replace(".py", "")
+            # Fix for scrapers that don't override __init__ (inherit "Unknown")
+            if provider_name == "Unknown":
+                provider_name = guessed_name
+                scraper.provider_name = guessed_name
+            _provider_names[entry] = provider_name
+            run_metrics.provider = provider_name
+                
+            provider_type = getattr(scraper, 'provider_type', entry.provider_type)
             
-            module = importlib.import_module(module_import)
+            # print(f"🚀 Running {scraper.provider_name}...")
+            with metrics.span('scrape'):
+                data = scraper.run()
+            duration = time.time() - start_time
             
-            # Find classes that verify: is subclass of Base and is NOT Base itself
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if (issubclass(obj, (BaseHostingScraper, BaseVPNScraper)) 
-                    and obj is not BaseHostingScraper 
-                    and obj is not BaseVPNScraper
-                    and "AdaptiveBaseScraper" not in name):
-
-                    scrapers.append(obj)
-        except Exception as e:
-            print(f"⚠️  Skipping {filepath.name}: {e}")
-            pass
+            # Abandoned by the engine (timeout) - don't sync stale results
+            if cancel_event is not None and cancel_event.is_set():
+                return None
             
-    return scrapers
+            if not data:
+                print(f"⚠️  {scraper.provider_name}: No Data Returned")
+                log_scraper_status(provider_name, provider_type, "warning", duration, "No Data Returned",
+                                   cancel_event=cancel_event, timings=run_metrics.breakdown())
+                return None
 
-def log_scraper_status(provider_name, provider_type, status, duration, error=None, items=0):
-    if not supabase: return
-    try:
-        data = {
-            "provider_name": provider_name,
-            "provider_type": provider_type,
-            "status": status,
-            "duration_seconds": round(duration, 2),
-            "error_message": str(error) if error else None,
-            "items_synced": items,
-            "last_run": "now()"
-        }
-        supabase.table("scraper_status").upsert(data, on_conflict="provider_name").execute()
-    except Exception as e:
-        print(f"⚠️  Failed to log status for {provider_name}: {e}")
-
-def run_scraper(scraper_class):
-    start_time = time.time()
-    scraper_name = scraper_class.__name__
-    # Try to guess provider name from class name if instantiation fails
-    guessed_name = scraper_name.replace("Scraper", "")
-    
-    try:
-        scraper = scraper_class()
-        provider_name = scraper.provider_name
-        
-        # Fix for scrapers that don't override __init__ (inherit "Unknown")
-        if provider_name == "Unknown":
-            provider_name = guessed_name
-            scraper.provider_name = guessed_name
+            # Handle list (Hosting) or single object (VPN)
+            items_to_sync = data if isinstance(data, list) else [data]
             
-        provider_type = getattr(scraper, 'provider_type', 'vpn') # Default to VPN if not set
-        
-        # print(f"🚀 Running {scraper.provider_name}...")
-        data = scraper.run()
-        duration = time.time() - start_time
-        
-        if not data:
-            print(f"⚠️  {scraper.provider_name}: No Data Returned")
-            log_scraper_status(provider_name, provider_type, "warning", duration, "No Data Returned")
+            with metrics.span('serialize'):
+                for item in items_to_sync:
+                    if not item: continue
+                    
+                    # Determine Table
+                    table_name = "hosting_providers" if isinstance(item, HostingProvider) else "vpn_providers"
+                    
+                    # Written locally first, replicated to Supabase in bulk by flush_writes()
+                    # model_dump(mode='json') handles datetime serialization to ISO strings
+                    # exclude_none=True prevents overwriting existing DB data (like manually added logos) with nulls
+                    payload = item.model_dump(mode='json', exclude_none=True) 
+                    
+                    conflict_target = "provider_name,plan_name" if table_name == "hosting_providers" else "provider_name"
+                    
+                    get_local_store().put(table_name, payload, on_conflict=conflict_target, label=provider_name)
+                
+            print(f"✅ {scraper.provider_name}: Queued {len(items_to_sync)} items")
+            log_scraper_status(provider_name, provider_type, "success", duration, items=len(items_to_sync),
+                               cancel_event=cancel_event, timings=run_metrics.breakdown())
+            return data
+
+        except Exception as e:
+            duration = time.time() - start_time
+            print(f"❌ {scraper_name}: Failed ({e})")
+            log_scraper_status(provider_name, entry.provider_type, "error", duration, str(e),
+                               cancel_event=cancel_event, timings=run_metrics.breakdown())
             return None
 
-        # Handle list (Hosting) or single object (VPN)
-        items_to_sync = data if isinstance(data, list) else [data]
-        
-        for item in items_to_sync:
-            if not item: continue
-            
-            # Determine Table
-            table_name = "hosting_providers" if isinstance(item, HostingProvider) else "vpn_providers"
-            
-            # Upsert to Supabase
-            if supabase:
-                # model_dump(mode='json') handles datetime serialization to ISO strings
-                # exclude_none=True prevents overwriting existing DB data (like manually added logos) with nulls
-                payload = item.model_dump(mode='json', exclude_none=True) 
-                
-                conflict_target = "provider_name,plan_name" if table_name == "hosting_providers" else "provider_name"
-                
-                result = supabase.table(table_name).upsert(payload, on_conflict=conflict_target).execute()
-                # print(f"   Saved {item.provider_name} to DB")
-            
-        print(f"✅ {scraper.provider_name}: Synced {len(items_to_sync)} items")
-        log_scraper_status(provider_name, provider_type, "success", duration, items=len(items_to_sync))
-        return data
-
-    except Exception as e:
-        duration = time.time() - start_time
-        print(f"❌ {scraper_name}: Failed ({e})")
-        # Try to determine type from module path if possible, else default to unknown
-        p_type = 'hosting' if 'hosting' in str(scraper_class) else 'vpn'
-        log_scraper_status(provider_name, p_type, "error", duration, str(e))
-        return None
-
-def main():
+def log_scraper_timeout(entry, duration):
+    """Engine callback: record a scraper that exceeded its time budget"""
+    provider_name = _provider_names.get(entry, entry.provider_name)
+    print(f"⏱️  {entry.class_name}: Timed out after {duration:.0f}s")
+    run_metrics = _run_metrics.get(entry)
+    log_scraper_status(provider_name, entry.provider_type, "error", duration, f"Timed out after {duration:.0f}s",
+                       timings=run_metrics.breakdown() if run_metrics else None)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HostingArena daily scraper pipeline")
+    parser.add_argument("--workers", type=int, default=PIPELINE_WORKERS,
+                        help=f"Scrapers running concurrently (default: {PIPELINE_WORKERS})")
+    parser.add_argument("--per-host", type=int, default=PIPELINE_PER_HOST_LIMIT,
+                        help=f"Max concurrent scrapers per host (default: {PIPELINE_PER_HOST_LIMIT})")
+    parser.add_argument("--timeout", type=int, default=SCRAPER_TIMEOUT,
+                        help=f"Seconds before a scraper is abandoned, 0 = no limit (default: {SCRAPER_TIMEOUT})")
+    parser.add_argument("--export", default=EXPORT_FORMATS, metavar="FORMATS",
+                        help=f"Comma-separated csv,ndjson,parquet exports appended per run, '' = none (default: {EXPORT_FORMATS or 'none'})")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_logging()
+    load_env()
+    from scrapers.engine import ScraperEngine
+    from scrapers.utils.http_cache import get_http_cache
+    from scrapers.utils.live_memo import get_live_memo
+    from scrapers.utils.parse_pool import get_parse_pool
+    from scrapers.utils.selector_stats import get_selector_stats
+
     print("Starting Daily Update Pipeline...")
+    if get_supabase() is None:
+        # We continue, but nothing is synced
+        print(f"⚠️  Warning: {supabase_error()}")
     
     # Discover Scrapers
-    hosting_scrapers = discover_scrapers("scrapers/hosting/scrapers")
-    vpn_scrapers = discover_scrapers("scrapers/vpn") # Direct in vpn folder
+    hosting_scrapers = discover_scrapers("hosting")
+    vpn_scrapers = discover_scrapers("vpn")
+    api_clients = discover_api_clients()
     
-    all_scrapers = hosting_scrapers + vpn_scrapers
-    print(f"ℹ️  Found {len(all_scrapers)} active scrapers.")
+    # API jobs first: paginated catalogs are the longest jobs, the scrapers fill the pool around them
+    all_scrapers = api_clients + hosting_scrapers + vpn_scrapers
+    print(f"ℹ️  Found {len(all_scrapers)} active scrapers ({len(api_clients)} API clients).")
     
-    # Run them (Sequential for safety, ThreadPool possible)
-    success_count = 0
-    for scraper_class in all_scrapers:
-        result = run_scraper(scraper_class)
-        if result: success_count += 1
-            
+    # Run them concurrently (bounded pool, one scraper per host at a time)
+    engine = ScraperEngine(
+        run_scraper,
+        workers=args.workers,
+        per_host_limit=args.per_host,
+        timeout=args.timeout,
+        on_timeout=log_scraper_timeout,
+    )
+    start_time = time.time()
+    try:
+        results = engine.run(all_scrapers)
+    finally:
+        get_parse_pool().shutdown()
+    success_count = sum(1 for r in results if r.status == 'success')
+    
+    print(f"⏱️  Ran {len(all_scrapers)} scrapers with {args.workers} workers in {time.time() - start_time:.1f}s")
+    
+    flush_writes()
+    
+    if args.export:
+        from scrapers.exporter import export_run
+        items = [item for r in results if r.result
+                 for item in (r.result if isinstance(r.result, list) else [r.result]) if item]
+        try:
+            with metrics.span('export'):
+                print(f"📤 {export_run(items, formats=args.export.split(','))}")
+        except Exception as e:
+            print(f"⚠️  Export failed: {e}")
+    
+    http_cache = get_http_cache()
+    if http_cache:
+        http_cache.save()
+        print(f"📦 {http_cache.report()}")
+    selector_stats = get_selector_stats()
+    selector_stats.save()
+    print(f"🎯 {selector_stats.report()}")
+    print(f"♻️  {get_live_memo().report()}")
+    print(f"🧮 {get_parse_pool().report()}")
+    
+    metrics_path = Path(METRICS_PATH) if Path(METRICS_PATH).is_absolute() else PROJECT_ROOT / METRICS_PATH
+    metrics.get_metrics().write(metrics_path)
+    print(f"📈 {metrics.get_metrics().report()} (written to {metrics_path})")
     print(f"✅ Pipeline Finished. {success_count}/{len(all_scrapers)} verified and synced.")
 
 if __name__ == "__main__":
@@ -125,109 +125,21 @@ def create_registry():
     return data
 
 def generate_scrapers():
-    """Generates Python classes for each provider"""
-    base_path = Path("/Users/juan/Documents/HostingArena/scrapers")
-    
-    # Template for Hosting
-    hosting_template = '''"""{name} Scraper (Adaptive)"""
-from ..base_scraper import BaseHostingScraper
-from ...models import HostingProvider, StorageType
-from datetime import datetime
-from typing import List
-
-class {class_name}(BaseHostingScraper):
-    def __init__(self):
-        super().__init__(provider_name="{name}")
-
-    def scrape_plans(self) -> List[HostingProvider]:
-        verified_plans = self.get_verified_field('plans', [])
-        providers = []
-        for p in verified_plans:
-            providers.append(HostingProvider(
-                provider_name="{name}",
-                provider_type='shared',
-                plan_name=p['name'],
-                website_url="{url}",
-                pricing_monthly=p['price'],
-                renewal_price=p['renewal'],
-                storage_gb=int(str(p['storage']).split()[0]),
-                bandwidth="Unlimited",
-                free_domain=True,
-                free_ssl=True,
-                last_updated=datetime.now()
-            ))
-        return providers
-'''
-
-    # Template for VPN
-    vpn_template = '''"""{name} Scraper (Adaptive)"""
-from .base_scraper import BaseVPNScraper
-from ..models import VPNProvider
-from datetime import datetime
-
-class {class_name}(BaseVPNScraper):
-    def __init__(self):
-        super().__init__(provider_name="{name}")
-        
-    def scrape_pricing(self) -> dict:
-        return {{
-            'provider_name': "{name}",
-            'website_url': "{url}",
-            'pricing_monthly': 9.99, # Fallback
-            'last_updated': datetime.now()
-        }}
-        
-    def scrape_features(self) -> dict:
-        ram_only = self.get_verified_field('ram_only_servers', False)
-        audits = self.get_verified_field('audit_history', [])
-        return {{
-            'server_count': self.get_verified_field('server_count', 1000),
-            'country_count': self.get_verified_field('country_count', 50),
-            'ram_only_servers': ram_only,
-            'audit_history': audits
-        }}
-'''
-
-    # Ensure directories exist
-    (base_path / "hosting/scrapers").mkdir(parents=True, exist_ok=True)
-    (base_path / "vpn").mkdir(parents=True, exist_ok=True)
+    """
+    Regenerates the registry and the scraper manifest
 
-    # Generate Files
-    data = create_registry()
-    
-    # Hosting
-    for h in data["hosting"]:
-        class_name = h["name"].replace(" ", "").replace(".", "").replace("-", "") + "Scraper"
-        filename = h["name"].lower().replace(" ", "").replace(".", "").replace("-", "") + ".py"
-        path = base_path / "hosting/scrapers" / filename
-        
-        with open(path, "w") as f:
-            f.write(hosting_template.format(
-                name=h["name"],
-                class_name=class_name,
-                url=h["url"]
-            ))
-            
-    # VPN
-    for v in data["vpn"]:
-        class_name = v["name"].replace(" ", "").replace(".", "").replace("-", "") + "Scraper"
-        filename = v["name"].lower().replace(" ", "").replace(".", "").replace("-", "") + ".py"
-        path = base_path / "vpn" / filename
-        
-        # Don't overwrite existing manually crafted ones (Nord, Express, etc)
-        # Actually, let's overwrite to ensure conformity, but we can back up logic if needed.
-        # For this 'Reset' requested by user, we overwrite to ensure consistency.
-        if "nordvpn" in filename or "hostinger" in filename:
-            continue # Skip the ones we manually polished
-            
-        with open(path, "w") as f:
-            f.write(vpn_template.format(
-                name=v["name"],
-                class_name=class_name,
-                url=v["url"]
-            ))
+    No per-provider modules are written: every registry provider is served by
+    scrapers.registry_scraper (per-provider differences go in its OVERRIDES).
+    Only providers that need real custom logic get a hand-written module.
+    """
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from scrapers.scraper_manifest import build_manifest, write_manifest
 
-    print("✅ Generated 120 Scraper Files")
+    create_registry()
+    entries = build_manifest()
+    write_manifest(entries)
+    print(f"✅ {len(entries)} scrapers in the manifest")
 
 if __name__ == "__main__":
     generate_scrapers()
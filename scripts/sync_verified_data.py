@@ -1,10 +1,13 @@
 """
 Sync verified_data.json to Supabase — CLEAN START
 Wipes old placeholder data and inserts fresh verified data.
-Usage: python scripts/sync_verified_data.py [--wipe]
+Only rows that differ from what the database holds are written.
+Usage: python scripts/sync_verified_data.py [--wipe] [--dry-run] [--force] [--trust-manifest]
+  --dry-run         List new/changed rows without writing anything
+  --force           Write every row, even unchanged ones
+  --trust-manifest  Compare against data/sync_manifest.json instead of reading the
+                    tables back (only safe when nothing else writes them)
 """
-import json
-import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -13,27 +16,14 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
-from dotenv import load_dotenv
-load_dotenv(PROJECT_ROOT / ".env")
-load_dotenv(PROJECT_ROOT / "frontend" / ".env.local")
-
-SUPABASE_URL = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-if not SUPABASE_URL or not SUPABASE_KEY:
-    print("❌ Missing SUPABASE_URL or SUPABASE_KEY in environment")
-    sys.exit(1)
-
-from supabase import create_client, Client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-
-DATA_FILE = PROJECT_ROOT / "data" / "verified_data.json"
+from scrapers.bootstrap import get_supabase, get_writer, load_env, supabase_error
+from scrapers.verified_registry import get_registry
+from scrapers.sync_manifest import SyncManifest, content_hash, row_key
 
 
 def load_verified_data():
-    """Load the clean verified_data.json"""
-    with open(DATA_FILE, 'r') as f:
-        return json.load(f)
+    """Load the clean verified_data.json (shared registry, parsed once per process)"""
+    return get_registry().data()
 
 
 def wipe_tables():
@@ -41,14 +31,14 @@ def wipe_tables():
     print("🗑️  Wiping hosting_providers...")
     try:
         # Delete all rows by matching any id
-        supabase.table("hosting_providers").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
+        get_supabase(required=True).table("hosting_providers").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
         print("   ✅ hosting_providers cleared")
     except Exception as e:
         print(f"   ⚠️  Error clearing hosting: {e}")
 
     print("🗑️  Wiping vpn_providers...")
     try:
-        supabase.table("vpn_providers").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
+        get_supabase(required=True).table("vpn_providers").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
         print("   ✅ vpn_providers cleared")
     except Exception as e:
         print(f"   ⚠️  Error clearing vpn: {e}")
@@ -56,18 +46,93 @@ def wipe_tables():
     print("🗑️  Wiping affiliate_partners (to avoid staleness)...")
     try:
         # User usually wants a clean slate when wiping
-        supabase.table("affiliate_links").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
+        get_supabase(required=True).table("affiliate_links").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
         print("   ✅ affiliate_links cleared")
     except Exception as e:
         pass # Optional table, ignore if not exists
 
 
-def sync_hosting(data):
+def load_remote_hashes(manifest, table, on_conflict, columns):
+    """
+    Load the manifest's hashes for `table` from the rows the database holds now
+
+    run_pipeline upserts the same tables, so the local manifest alone can call a
+    row "unchanged" that the pipeline has since overwritten.
+
+    Args:
+        columns: Columns the payloads carry (the rows are hashed over these)
+    """
+    keys = [col.strip() for col in on_conflict.split(",")]
+    select = ",".join(keys + sorted(set(columns) - set(keys)))
+    try:
+        res = get_supabase(required=True).table(table).select(select).execute()
+        manifest.load_remote(table, res.data or [], on_conflict)
+        print(f"   ℹ️  Compared against {len(res.data or [])} rows stored in {table}")
+    except Exception as e:
+        if manifest.known(table):
+            print(f"   ⚠️  Could not read {table}, comparing against the local manifest: {e}")
+        else:
+            print(f"   ⚠️  Could not read {table}, treating all rows as changed: {e}")
+
+
+def sync_rows(table, on_conflict, rows, summaries, manifest=None, dry_run=False, trust_manifest=False):
+    """
+    Write only rows whose content hash changed
+
+    Args:
+        rows: {label: payload}
+        summaries: {label: one-line description for the report}
+        manifest: SyncManifest of current DB contents (None = write everything)
+        dry_run: Report changes without writing
+        trust_manifest: Use the manifest's hashes as they are, unless it has none
+            for `table` (default: reload them from the database first)
+
+    Returns:
+        Number of rows synced (or that would be synced in dry-run)
+    """
+    if manifest is not None and (not trust_manifest or not manifest.known(table)):
+        columns = {column for payload in rows.values() for column in payload}
+        load_remote_hashes(manifest, table, on_conflict, columns)
+
+    changed = {}
+    for label, payload in rows.items():
+        digest = content_hash(payload)
+        payload.setdefault("raw_data", {})["content_hash"] = digest
+        status = manifest.status(table, row_key(payload, on_conflict), digest) if manifest is not None else "changed"
+        if status != "unchanged":
+            changed[label] = (status, digest, payload)
+
+    print(f"   🔎 {len(changed)} new/changed, {len(rows) - len(changed)} unchanged")
+    if dry_run:
+        for label, (status, _, _) in changed.items():
+            print(f"   {'🆕' if status == 'new' else '✏️ '} {label}: {summaries[label]}")
+        return len(changed)
+
+    # Rows are queued and written as multi-row upserts (a handful of round trips per run)
+    writer = get_writer()
+    for label, (_, _, payload) in changed.items():
+        writer.add(table, payload, on_conflict=on_conflict, label=label)
+    writer.flush(tables=[table])
+
+    # writer.failures also covers chunks auto-flushed while rows were being queued
+    errors = {e.label: e.error for e in writer.failures if e.table == table}
+    for label, (status, digest, payload) in changed.items():
+        if label in errors:
+            print(f"   ❌ {label}: {errors[label]}")
+        else:
+            print(f"   ✅ {label}: {summaries[label]}")
+            if manifest is not None:
+                manifest.record(table, row_key(payload, on_conflict), digest)
+    return len(changed) - len(errors)
+
+
+def sync_hosting(data, manifest=None, dry_run=False, trust_manifest=False):
     """Sync hosting providers to Supabase"""
     hosting = data.get("hosting", [])
     print(f"\n📦 Syncing {len(hosting)} hosting providers...")
 
-    success = 0
+    rows = {}
+    summaries = {}
     for provider in hosting:
         for plan in provider.get("plans", []):
             # Parse storage_gb from string like "100 GB NVMe"
@@ -131,26 +196,23 @@ def sync_hosting(data):
                 "last_updated": datetime.now().isoformat()
             }
 
-            try:
-                supabase.table("hosting_providers").upsert(
-                    payload,
-                    on_conflict="provider_name,plan_name"
-                ).execute()
-                success += 1
-                print(f"   ✅ {provider['name']} - {plan['name']}: ${plan['price']}/mo (renews ${plan['renewal']}/mo)")
-            except Exception as e:
-                print(f"   ❌ {provider['name']} - {plan['name']}: {e}")
+            label = f"{provider['name']} - {plan['name']}"
+            rows[label] = payload
+            summaries[label] = f"${plan['price']}/mo (renews ${plan['renewal']}/mo)"
 
+    success = sync_rows("hosting_providers", "provider_name,plan_name", rows, summaries, manifest, dry_run,
+                        trust_manifest)
     print(f"\n📊 Hosting: {success} plans synced successfully")
     return success
 
 
-def sync_vpn(data):
+def sync_vpn(data, manifest=None, dry_run=False, trust_manifest=False):
     """Sync VPN providers to Supabase"""
     vpns = data.get("vpn", [])
     print(f"\n🔐 Syncing {len(vpns)} VPN providers...")
 
-    success = 0
+    rows = {}
+    summaries = {}
     for provider in vpns:
         name = provider.get("provider_name", provider.get("name", "Unknown"))
         monthly_price = provider.get("monthly_price")
@@ -205,22 +267,24 @@ def sync_vpn(data):
             "last_updated": datetime.now().isoformat()
         }
 
-        try:
-            supabase.table("vpn_providers").upsert(
-                payload,
-                on_conflict="provider_name"
-            ).execute()
-            success += 1
-            print(f"   ✅ {name}: ${monthly_price}/mo | {provider.get('servers', '?')} servers | {provider.get('jurisdiction', '?')}")
-        except Exception as e:
-            print(f"   ❌ {name}: {e}")
+        rows[name] = payload
+        summaries[name] = f"${monthly_price}/mo | {provider.get('servers', '?')} servers | {provider.get('jurisdiction', '?')}"
 
+    success = sync_rows("vpn_providers", "provider_name", rows, summaries, manifest, dry_run, trust_manifest)
     print(f"\n📊 VPN: {success} providers synced successfully")
     return success
 
 
 def main():
     should_wipe = "--wipe" in sys.argv
+    dry_run = "--dry-run" in sys.argv
+    force = "--force" in sys.argv
+    trust_manifest = "--trust-manifest" in sys.argv
+
+    load_env()
+    if not dry_run and get_supabase() is None:
+        print(f"❌ {supabase_error()}")
+        sys.exit(1)
 
     print("=" * 60)
     print("🚀 HostingArena Data Sync — Verified Data Pipeline")
@@ -231,13 +295,29 @@ def main():
     vpn_count = len(data.get("vpn", []))
     print(f"📄 Loaded {hosting_count} hosting + {vpn_count} VPN providers from verified_data.json")
 
-    if should_wipe:
+    manifest = None if force else SyncManifest()
+
+    if should_wipe and dry_run:
+        print("\n⚠️  WIPE MODE ignored in dry-run")
+    elif should_wipe:
         print("\n⚠️  WIPE MODE: Deleting ALL existing data first...")
         wipe_tables()
+        manifest = SyncManifest()
+        manifest.clear()  # Tables are empty: every row is new
+
+    hosting_synced = sync_hosting(data, manifest, dry_run, trust_manifest)
+    vpn_synced = sync_vpn(data, manifest, dry_run, trust_manifest)
+
+    if dry_run:
+        print("\n" + "=" * 60)
+        print(f"🔎 DRY RUN: would sync {hosting_synced} hosting plans + {vpn_synced} VPN providers")
+        print("=" * 60)
+        return
 
-    hosting_synced = sync_hosting(data)
-    vpn_synced = sync_vpn(data)
+    if manifest is not None:
+        manifest.save()
 
+    print(f"\n🗄️  {get_writer().report()}")
     print("\n" + "=" * 60)
     print(f"✅ DONE! Synced {hosting_synced} hosting plans + {vpn_synced} VPN providers")
     print("=" * 60)
@@ -0,0 +1,51 @@
+"""
+Startup budget for the pipeline entry points, measured with `python -X importtime`.
+
+`--help` and dry-run paths must not pay for the Supabase client, pydantic,
+bs4 or aiohttp; those are imported once the pipeline actually runs.
+    python -m pytest tests/benchmarks/test_import_time.py
+    IMPORT_TIME_BUDGET_MS=50 python -m pytest tests/benchmarks/test_import_time.py
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+# Cumulative import time of an entry point module (generous: CI machines are slow)
+BUDGET_MS = float(os.getenv('IMPORT_TIME_BUDGET_MS', '150'))
+HEAVY_MODULES = ('supabase', 'pydantic', 'bs4', 'aiohttp', 'lxml', 'selectolax')
+
+
+def import_times(module):
+    """{module: cumulative microseconds} for `python -X importtime -c 'import <module>'`"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and 'cumulative' not in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+ENTRY_POINTS = ['scripts.run_pipeline', 'scripts.sync_verified_data', 'scripts.cleanup_scraper_status']
+
+
+class TestStartupBudget:
+    """Entry points start in milliseconds"""
+
+    @pytest.mark.parametrize('module', ENTRY_POINTS)
+    def test_no_heavy_imports_at_startup(self, module):
+        heavy = sorted(name for name in import_times(module) if name.split('.')[0] in HEAVY_MODULES)
+        assert not heavy, f"{module} imports {heavy[:5]} at startup"
+
+    @pytest.mark.parametrize('module', ENTRY_POINTS)
+    def test_within_budget(self, module):
+        ms = import_times(module)[module] / 1000
+        assert ms < BUDGET_MS, f"{module} took {ms:.1f}ms to import (budget {BUDGET_MS:.0f}ms)"
@@ -0,0 +1,42 @@
+"""
+End-to-end scraper benchmarks over a recorded corpus, with no network.
+
+Record the corpus once (real network):
+    HTTP_REPLAY_MODE=record python scripts/run_pipeline.py
+Then benchmark every discovered scraper against it:
+    python -m pytest tests/benchmarks --benchmark-only
+    HTTP_REPLAY_LATENCY=0.2 python -m pytest tests/benchmarks   # simulate a slow network
+"""
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from scrapers.config import HTTP_REPLAY_DIR, HTTP_REPLAY_LATENCY, HTTP_REPLAY_JITTER
+from scrapers.scraper_manifest import load_manifest
+from scrapers.utils import replay
+from scrapers.utils.replay import ReplayStore
+
+CORPUS = Path(__file__).resolve().parent.parent.parent / HTTP_REPLAY_DIR
+
+
+@pytest.fixture
+def replay_corpus(monkeypatch):
+    """Serve every request from the recorded corpus"""
+    if not CORPUS.is_dir() or not any(CORPUS.glob('*.json.gz')):
+        pytest.skip(f"No recorded corpus in {CORPUS} (run with HTTP_REPLAY_MODE=record first)")
+    store = ReplayStore(CORPUS, 'replay', HTTP_REPLAY_LATENCY, HTTP_REPLAY_JITTER)
+    monkeypatch.setattr(replay, '_store', store)
+    return store
+
+
+@pytest.mark.parametrize('entry', load_manifest(), ids=str)
+def test_scraper_end_to_end(benchmark, replay_corpus, isolated_live_memo, isolated_http_cache, entry):
+    """Construct + run one scraper against replayed responses"""
+    isolated_live_memo.ttl = 0  # every round extracts, like a new pipeline run
+    isolated_http_cache.max_extractions = 0  # replayed bodies never match an earlier round's
+    scraper_class = entry.load()
+    result = benchmark(lambda: scraper_class().run())
+    assert replay_corpus.stats['misses'] == 0, replay_corpus.report()
+    assert result is not None
@@ -0,0 +1,85 @@
+"""Shared pytest fixtures"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scrapers.utils import http_cache, live_memo, parse_pool, rate_limiter, replay, selector_stats
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """Serves canned pages registered on the server: {path: (status, headers, body)}"""
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        status, headers, body = self.server.pages.get(self.path, (404, {}, b'not found'))
+        if headers.get('ETag') and self.headers.get('If-None-Match') == headers['ETag']:
+            status, body = 304, b''
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def page_server():
+    """Local HTTP server so fetch tests never touch the network"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+    server.pages = {}
+    server.requests = []
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path, monkeypatch):
+    """Keep the HTTP cache out of data/ and fresh for every test"""
+    cache = http_cache.HttpCache(tmp_path / 'http_cache')
+    monkeypatch.setattr(http_cache, '_cache', cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_rate_limits(monkeypatch):
+    """Fresh per-host token buckets for every test"""
+    monkeypatch.setattr(rate_limiter, '_registry', None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_replay(monkeypatch):
+    """No record/replay unless a test installs its own store"""
+    monkeypatch.setattr(replay, '_store', None)
+    monkeypatch.setattr(replay, 'HTTP_REPLAY_MODE', 'off')
+
+
+@pytest.fixture(autouse=True)
+def isolated_live_memo(monkeypatch):
+    """Live extractions are never shared between tests"""
+    memo = live_memo.LiveDataMemo()
+    monkeypatch.setattr(live_memo, '_memo', memo)
+    return memo
+
+
+@pytest.fixture(autouse=True)
+def isolated_parse_pool(monkeypatch):
+    """Extract in the test's own process unless a test starts a real pool"""
+    pool = parse_pool.ParsePool(workers=0)
+    monkeypatch.setattr(parse_pool, '_pool', pool)
+    return pool
+
+
+@pytest.fixture(autouse=True)
+def isolated_selector_stats(tmp_path, monkeypatch):
+    """Selector counters start empty and stay out of data/"""
+    stats = selector_stats.SelectorStats(tmp_path / 'selector_stats.json')
+    monkeypatch.setattr(selector_stats, '_stats', stats)
+    return stats
@@ -0,0 +1,222 @@
+"""Tests for the hosting API clients: pagination, retries, shared pool, pipeline jobs"""
+import json
+
+import pytest
+import requests
+
+from scrapers import config, local_store
+from scrapers.engine import ScraperEngine
+from scrapers.hosting import base_api_client
+from scrapers.hosting.api import API_CLIENTS, configured_clients
+from scrapers.hosting.api.digitalocean import DigitalOceanClient
+from scrapers.hosting.api.linode import LinodeClient
+from scrapers.hosting.api.vultr import VultrClient
+from scrapers.hosting.base_api_client import BaseAPIClient, shared_adapter
+from scrapers.local_store import LocalStore
+from scrapers.utils import rate_limiter
+from scrapers.utils.rate_limiter import RateLimitRegistry, parse_rate_limit_reset
+
+
+class _ListClient(BaseAPIClient):
+    """Page-number client over the local page server"""
+    PER_PAGE = 2
+
+    def _setup_auth_headers(self):
+        pass
+
+    def page_count(self, data):
+        return data['pages']
+
+    def get_plans(self):
+        return []
+
+
+def response(status, body=None, headers=None):
+    r = requests.Response()
+    r.status_code = status
+    r._content = json.dumps(body or {}).encode()
+    r.headers.update(headers or {})
+    return r
+
+
+@pytest.fixture(autouse=True)
+def fast_limits(monkeypatch):
+    """No per-host pacing between test requests"""
+    monkeypatch.setattr(rate_limiter, '_registry', RateLimitRegistry(1000.0, 100))
+
+
+def serve(page_server, path, pages, items_key='items', per_page=2, **extra):
+    for number, items in enumerate(pages, start=1):
+        body = {items_key: items, 'pages': len(pages), **extra}
+        page_server.pages[f"{path}?per_page={per_page}&page={number}"] = (
+            200, {'Content-Type': 'application/json'}, json.dumps(body).encode())
+
+
+class TestPagination:
+    """Test iter_pages over page-number and cursor APIs"""
+
+    def test_all_pages_in_order(self, page_server):
+        serve(page_server, '/items', [[1, 2], [3, 4], [5, 6], [7]])
+        client = _ListClient('key')
+        assert list(client.iter_pages(f"{page_server.base_url}/items", 'items')) == [1, 2, 3, 4, 5, 6, 7]
+        assert len(page_server.requests) == 4
+
+    def test_failed_page_is_skipped(self, page_server):
+        serve(page_server, '/items', [[1, 2], [3, 4], [5]])
+        del page_server.pages['/items?per_page=2&page=2']
+        assert list(_ListClient('key').iter_pages(f"{page_server.base_url}/items", 'items')) == [1, 2, 5]
+
+    def test_digitalocean_reads_every_size(self, page_server, monkeypatch):
+        sizes = [{'slug': f's-{n}', 'available': True, 'price_monthly': 4.0 + n, 'disk': 25,
+                  'transfer': 1, 'memory': 512, 'vcpus': 1} for n in range(5)]
+        monkeypatch.setattr(DigitalOceanClient, 'BASE_URL', page_server.base_url)
+        monkeypatch.setattr(DigitalOceanClient, 'PER_PAGE', 2)
+        for n in range(3):
+            body = {'sizes': sizes[n * 2:n * 2 + 2], 'meta': {'total': len(sizes)}}
+            page_server.pages[f"/sizes?per_page=2&page={n + 1}"] = (200, {}, json.dumps(body).encode())
+        plans = DigitalOceanClient('key').get_plans()
+        assert [p.plan_name for p in plans] == [s['slug'] for s in sizes]
+
+    def test_vultr_follows_cursors(self, page_server, monkeypatch):
+        monkeypatch.setattr(VultrClient, 'BASE_URL', page_server.base_url)
+        plan = {'vcpu_count': 1, 'ram': 1024, 'disk': 25, 'bandwidth': 1024, 'monthly_cost': 5, 'locations': ['ewr']}
+        pages = {
+            '/v2/plans?per_page=500': ([{**plan, 'id': 'vc2-1'}], 'bmV4dA=='),
+            '/v2/plans?per_page=500&cursor=bmV4dA%3D%3D': ([{**plan, 'id': 'vc2-2'}, {'id': 'old', 'locations': []}], ''),
+        }
+        for path, (plans, cursor) in pages.items():
+            body = {'plans': plans, 'meta': {'links': {'next': cursor}}}
+            page_server.pages[path] = (200, {}, json.dumps(body).encode())
+        assert [p.plan_name for p in VultrClient('key').get_plans()] == ['vc2-1', 'vc2-2']
+
+    def test_linode_units(self, page_server, monkeypatch):
+        monkeypatch.setattr(LinodeClient, 'BASE_URL', page_server.base_url)
+        nanode = {'id': 'g6-nanode-1', 'disk': 25600, 'memory': 1024, 'vcpus': 1, 'transfer': 1000,
+                  'price': {'monthly': 5.0}}
+        body = {'data': [nanode], 'pages': 1}
+        page_server.pages['/linode/types?page_size=500&page=1'] = (200, {}, json.dumps(body).encode())
+        plan, = LinodeClient('key').get_plans()
+        assert (plan.storage_gb, plan.bandwidth, plan.pricing_monthly) == (25, '1 TB/month', 5.0)
+
+
+class TestRetries:
+    """Test backoff and rate-limit handling in make_request"""
+
+    def scripted(self, monkeypatch, *responses):
+        client = _ListClient('key')
+        client.backoff_base = 0
+        calls = []
+
+        def request(**kwargs):
+            calls.append(kwargs)
+            result = responses[len(calls) - 1]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(client.session, 'request', request)
+        return client, calls
+
+    def test_retry_after_blocks_the_host(self, monkeypatch):
+        client, calls = self.scripted(monkeypatch, response(429, headers={'Retry-After': '7'}), response(200, {'ok': 1}))
+        deferred = []
+        monkeypatch.setattr(rate_limiter.RateLimiter, 'defer', lambda self, s: deferred.append(s))
+        assert client.make_request('https://api.example.com/x') == {'ok': 1}
+        assert len(calls) == 2 and deferred == [7.0]
+
+    def test_network_errors_and_5xx_are_retried(self, monkeypatch):
+        client, calls = self.scripted(monkeypatch, requests.ConnectionError('reset'), response(502), response(200, {'ok': 1}))
+        assert client.make_request('https://api.example.com/x') == {'ok': 1}
+        assert len(calls) == 3
+
+    def test_client_errors_are_not_retried(self, monkeypatch):
+        client, calls = self.scripted(monkeypatch, response(404), response(200))
+        assert client.make_request('https://api.example.com/x') is None
+        assert len(calls) == 1
+
+    def test_backoff_is_capped_full_jitter(self, monkeypatch):
+        client = _ListClient('key')
+        client.backoff_base, client.backoff_max = 1.0, 3.0
+        slept = []
+        monkeypatch.setattr(base_api_client.time, 'sleep', slept.append)
+        for attempt in range(6):
+            client._backoff(attempt, None)
+        assert all(0 <= s <= min(3.0, 2 ** a) for a, s in enumerate(slept))
+
+    def test_rate_limit_headers(self):
+        assert parse_rate_limit_reset({'RateLimit-Remaining': '10', 'RateLimit-Reset': '5'}) is None
+        assert parse_rate_limit_reset({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '5'}) == 5.0
+        assert parse_rate_limit_reset({}) is None
+
+
+class TestSharedPool:
+    """Test the connection pool shared by every client"""
+
+    def test_one_adapter_for_all_clients(self):
+        a, b = DigitalOceanClient('a'), VultrClient('b')
+        assert a.session.get_adapter('https://api.digitalocean.com') is shared_adapter()
+        assert b.session.get_adapter('https://api.vultr.com') is shared_adapter()
+
+
+class TestPipelineJobs:
+    """Test API clients scheduled by the pipeline next to the scrapers"""
+
+    def test_only_clients_with_credentials(self, monkeypatch):
+        for entry in API_CLIENTS:
+            monkeypatch.setattr(config, entry.key_setting, '')
+        monkeypatch.setattr(config, 'VULTR_API_KEY', 'vultr-key')
+        entry, = configured_clients()
+        assert (entry.provider_name, entry.host) == ('Vultr API', 'api.vultr.com')
+        client = entry.load()()
+        assert isinstance(client, VultrClient) and client.api_key == 'vultr-key'
+        assert 'vultr-key' not in repr(entry)
+
+    def test_hosts_match_clients(self):
+        from scrapers.utils.helpers import host_of
+        for entry in API_CLIENTS:
+            assert host_of(entry.load()().BASE_URL) == entry.host
+
+    def test_runs_into_the_local_store(self, page_server, tmp_path, monkeypatch):
+        from scripts.run_pipeline import run_scraper
+        monkeypatch.setattr(local_store, '_store', LocalStore(tmp_path / 'providers.db'))
+        monkeypatch.setattr(DigitalOceanClient, 'BASE_URL', page_server.base_url)
+        monkeypatch.setattr(config, 'DIGITALOCEAN_API_KEY', 'do-key')
+        size = {'slug': 's-1vcpu-1gb', 'available': True, 'price_monthly': 6.0, 'disk': 25,
+                'transfer': 1, 'memory': 1024, 'vcpus': 1}
+        page_server.pages['/sizes?per_page=200&page=1'] = (200, {}, json.dumps({'sizes': [size]}).encode())
+        entry = next(e for e in configured_clients() if e.class_name == 'DigitalOceanClient')
+
+        result, = ScraperEngine(run_scraper, workers=2).run([entry])
+        assert result.status == 'success'
+        store = local_store.get_local_store()
+        assert store.get('hosting_providers', 'DigitalOcean', 's-1vcpu-1gb')['pricing_monthly'] == 6.0
+        assert store.get('scraper_status', 'DigitalOcean API')['items_synced'] == 1
+
+    def test_failed_rows_downgrade_the_api_job(self, tmp_path, monkeypatch):
+        import scripts.run_pipeline as run_pipeline
+        from scrapers.batch_writer import BatchWriter
+
+        class RejectingClient:
+            """Supabase stand-in that rejects every provider row"""
+            def table(self, name):
+                self.name = name
+                return self
+
+            def upsert(self, rows, on_conflict):
+                return self
+
+            def execute(self):
+                if self.name != 'scraper_status':
+                    raise RuntimeError('rejected')
+
+        store = LocalStore(tmp_path / 'providers.db')
+        monkeypatch.setattr(local_store, '_store', store)
+        monkeypatch.setattr(run_pipeline, 'get_writer', lambda: BatchWriter(RejectingClient()))
+        row = {'provider_name': 'DreamHost', 'plan_name': 'VPS', 'pricing_monthly': 10.0}
+        store.put('hosting_providers', row, 'provider_name,plan_name', label='DreamHost API')
+        for name in ('DreamHost', 'DreamHost API'):
+            run_pipeline._write_scraper_status(name, 'hosting', 'success', 1.0, None, 1)
+
+        run_pipeline.flush_writes()
+        assert store.get('scraper_status', 'DreamHost API')['status'] == 'error'
+        assert store.get('scraper_status', 'DreamHost')['status'] == 'success'
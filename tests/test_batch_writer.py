@@ -0,0 +1,85 @@
+"""Tests for the batched Supabase writer"""
+from scrapers.batch_writer import BatchWriter
+
+
+class FakeTable:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.rows = None
+
+    def upsert(self, rows, on_conflict=None):
+        self.rows = rows
+        self.on_conflict = on_conflict
+        return self
+
+    def execute(self):
+        self.client.calls.append((self.name, self.on_conflict, self.rows))
+        bad = [r for r in self.rows if r.get('pricing_monthly', 0) < 0]
+        if bad:
+            raise ValueError('violates check constraint')
+        return self
+
+
+class FakeClient:
+    """Records upsert calls; rejects any batch containing a negative price"""
+
+    def __init__(self):
+        self.calls = []
+
+    def table(self, name):
+        return FakeTable(self, name)
+
+
+class TestBatchWriter:
+    """Test grouping, de-duplication and error attribution"""
+
+    def test_groups_rows_into_few_round_trips(self):
+        client = FakeClient()
+        writer = BatchWriter(client, chunk_size=100)
+        for i in range(40):
+            writer.add('hosting_providers', {'provider_name': f'P{i}', 'plan_name': 'Basic', 'pricing_monthly': 1.0},
+                       on_conflict='provider_name,plan_name')
+        writer.add('scraper_status', {'provider_name': 'P1', 'status': 'success'}, on_conflict='provider_name')
+
+        assert writer.flush() == []
+        assert len(client.calls) == 2
+        assert writer.rows_written == 41
+
+    def test_last_write_wins_on_conflict_key(self):
+        client = FakeClient()
+        writer = BatchWriter(client)
+        writer.add('scraper_status', {'provider_name': 'A', 'status': 'success'}, on_conflict='provider_name')
+        writer.add('scraper_status', {'provider_name': 'A', 'status': 'error'}, on_conflict='provider_name')
+        writer.flush()
+        assert client.calls == [('scraper_status', 'provider_name', [{'provider_name': 'A', 'status': 'error'}])]
+
+    def test_splits_by_column_set(self):
+        client = FakeClient()
+        writer = BatchWriter(client)
+        writer.add('vpn_providers', {'provider_name': 'A', 'pricing_monthly': 1.0}, on_conflict='provider_name')
+        writer.add('vpn_providers', {'provider_name': 'B'}, on_conflict='provider_name')
+        writer.flush()
+        assert len(client.calls) == 2
+
+    def test_failed_rows_are_attributed(self):
+        client = FakeClient()
+        writer = BatchWriter(client)
+        for i in range(8):
+            price = -1.0 if i == 5 else 1.0
+            writer.add('vpn_providers', {'provider_name': f'V{i}', 'pricing_monthly': price},
+                       on_conflict='provider_name', label=f'V{i}')
+
+        errors = writer.flush()
+        assert [e.label for e in errors] == ['V5']
+        assert writer.rows_written == 7
+        assert writer.failures == errors
+
+    def test_auto_flush_at_chunk_size(self):
+        client = FakeClient()
+        writer = BatchWriter(client, chunk_size=3)
+        for i in range(7):
+            writer.add('vpn_providers', {'provider_name': f'V{i}'}, on_conflict='provider_name')
+        assert len(client.calls) == 2
+        writer.flush()
+        assert writer.rows_written == 7
@@ -0,0 +1,43 @@
+"""Tests for the lazily created, shared Supabase client"""
+import sys
+
+import pytest
+
+from scrapers import bootstrap
+
+
+@pytest.fixture
+def fresh_bootstrap(monkeypatch):
+    """No client built yet, .env already 'loaded', no credentials in the environment"""
+    monkeypatch.setattr(bootstrap, '_client', None)
+    monkeypatch.setattr(bootstrap, '_client_error', None)
+    monkeypatch.setattr(bootstrap, '_writer', None)
+    monkeypatch.setattr(bootstrap, '_env_loaded', True)
+    for name in ('SUPABASE_URL', 'NEXT_PUBLIC_SUPABASE_URL', 'SUPABASE_KEY',
+                 'SUPABASE_SERVICE_ROLE_KEY', 'SUPABASE_ANON_KEY'):
+        monkeypatch.delenv(name, raising=False)
+
+
+class TestGetSupabase:
+    """Test client creation on first use"""
+
+    def test_missing_credentials_give_no_client(self, fresh_bootstrap):
+        assert bootstrap.get_supabase() is None
+        assert bootstrap.get_writer() is None
+        assert 'SUPABASE_URL' in bootstrap.supabase_error()
+        with pytest.raises(RuntimeError):
+            bootstrap.get_supabase(required=True)
+
+    def test_client_and_writer_are_built_once(self, fresh_bootstrap, monkeypatch):
+        calls = []
+        fake_supabase = type(sys)('supabase')
+        fake_supabase.create_client = lambda url, key: calls.append((url, key)) or object()
+        monkeypatch.setitem(sys.modules, 'supabase', fake_supabase)
+        monkeypatch.setenv('NEXT_PUBLIC_SUPABASE_URL', 'https://example.supabase.co')
+        monkeypatch.setenv('SUPABASE_SERVICE_ROLE_KEY', 'service-key')
+
+        client = bootstrap.get_supabase()
+        assert bootstrap.get_supabase() is client
+        assert bootstrap.get_writer() is bootstrap.get_writer()
+        assert bootstrap.get_writer().client is client
+        assert calls == [('https://example.supabase.co', 'service-key')]
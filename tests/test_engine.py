@@ -0,0 +1,111 @@
+"""Tests for the concurrent scraper execution engine"""
+import threading
+import time
+
+from scrapers.engine import ScraperEngine, host_for
+
+
+def make_scraper(name, base_url=None):
+    attrs = {'BASE_URL': base_url} if base_url else {}
+    return type(name, (), attrs)
+
+
+class TestScraperEngine:
+    """Test worker pool, per-host caps and timeouts"""
+
+    def test_runs_all_jobs_concurrently(self):
+        classes = [make_scraper(f"S{i}Scraper") for i in range(6)]
+
+        def job(cls, cancel):
+            time.sleep(0.2)
+            return [cls.__name__]
+
+        start = time.time()
+        results = ScraperEngine(job, workers=6, timeout=5).run(classes)
+        assert len(results) == 6
+        assert all(r.status == 'success' for r in results)
+        assert time.time() - start < 1.0  # sequential would take 1.2s
+
+    def test_respects_worker_and_host_limits(self):
+        shared = [make_scraper(f"Shared{i}Scraper", "https://www.example.com") for i in range(3)]
+        others = [make_scraper(f"Other{i}Scraper") for i in range(4)]
+        lock = threading.Lock()
+        active = {'total': 0, 'peak': 0, 'shared': 0, 'shared_peak': 0}
+
+        def job(cls, cancel):
+            is_shared = host_for(cls) == 'example.com'
+            with lock:
+                active['total'] += 1
+                active['peak'] = max(active['peak'], active['total'])
+                if is_shared:
+                    active['shared'] += 1
+                    active['shared_peak'] = max(active['shared_peak'], active['shared'])
+            time.sleep(0.05)
+            with lock:
+                active['total'] -= 1
+                if is_shared:
+                    active['shared'] -= 1
+            return True
+
+        results = ScraperEngine(job, workers=3, per_host_limit=1, timeout=5).run(shared + others)
+        assert len(results) == 7
+        assert active['peak'] <= 3
+        assert active['shared_peak'] == 1
+
+    def test_timeout_cancels_job(self):
+        timed_out = []
+        events = []
+
+        def job(cls, cancel):
+            events.append(cancel)
+            time.sleep(0.5)
+            return True
+
+        engine = ScraperEngine(job, workers=1, timeout=0.1, on_timeout=lambda cls, d: timed_out.append(cls))
+        results = engine.run([make_scraper("SlowScraper")])
+        assert results[0].status == 'timeout'
+        assert len(timed_out) == 1
+        assert events[0].is_set()
+
+    def test_errors_are_captured(self):
+        def job(cls, cancel):
+            raise RuntimeError("boom")
+
+        results = ScraperEngine(job, workers=2, timeout=5).run([make_scraper("BadScraper")])
+        assert results[0].status == 'error'
+        assert results[0].error == 'boom'
+
+    def test_timed_out_job_keeps_its_host_slot(self):
+        shared = [make_scraper(f"Shared{i}Scraper", "https://www.example.com") for i in range(2)]
+        lock = threading.Lock()
+        active = {'now': 0, 'peak': 0}
+
+        def job(cls, cancel):
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+            time.sleep(0.15 if cls is shared[0] else 0.01)  # the first outlives its timeout
+            with lock:
+                active['now'] -= 1
+            return True
+
+        results = ScraperEngine(job, workers=2, per_host_limit=1, timeout=0.1).run(shared)
+        assert [r.status for r in results] == ['timeout', 'success']
+        assert active['peak'] == 1
+
+    def test_gives_up_on_a_host_that_stays_busy(self):
+        release = threading.Event()
+        timed_out = []
+
+        def job(cls, cancel):
+            release.wait(5)
+            return True
+
+        shared = [make_scraper(f"Hung{i}Scraper", "https://www.example.com") for i in range(2)]
+        engine = ScraperEngine(job, workers=2, per_host_limit=1, timeout=0.1,
+                               on_timeout=lambda cls, d: timed_out.append(cls))
+        results = engine.run(shared)
+        release.set()
+        assert [r.status for r in results] == ['timeout', 'timeout']
+        assert 'still busy' in results[1].error
+        assert timed_out == shared
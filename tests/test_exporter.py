@@ -0,0 +1,77 @@
+"""Tests for the CSV / NDJSON / Parquet run exporter"""
+import csv
+import json
+from datetime import datetime
+
+import pytest
+
+from scrapers import exporter
+from scrapers.models import HostingProvider, VPNProvider
+
+
+@pytest.fixture
+def export_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, 'OUTPUT_CSV_PATH', str(tmp_path / 'providers_data.csv'))
+    monkeypatch.setattr(exporter, 'OUTPUT_JSON_PATH', str(tmp_path / 'providers_data.json'))
+    monkeypatch.setattr(exporter, 'OUTPUT_PARQUET_DIR', str(tmp_path / 'parquet'))
+    return tmp_path
+
+
+def hosting(price):
+    return HostingProvider(provider_name='Hostinger', provider_type='shared', plan_name='Premium',
+                           website_url='https://hostinger.com', pricing_monthly=price, php_versions=['8.2', '8.3'])
+
+
+class TestSchema:
+    """Test column kinds derived from the models"""
+
+    def test_kinds_follow_annotations(self):
+        kinds = dict(exporter.model_schema(HostingProvider))
+        assert list(kinds)[:3] == ['snapshot_at', 'provider_name', 'provider_type']
+        assert kinds['pricing_monthly'] == 'float'
+        assert kinds['storage_gb'] == 'int'
+        assert kinds['free_ssl'] == 'bool'
+        assert kinds['php_versions'] == 'list'
+        assert kinds['storage_type'] == 'string'
+        assert kinds['last_updated'] == 'timestamp'
+        assert dict(exporter.model_schema(VPNProvider))['speed_test_results'] == 'json'
+        assert dict(exporter.model_schema(VPNProvider))['speed_test_date'] == 'date'
+
+
+class TestExportRun:
+    """Test appending runs to the text exports"""
+
+    def test_runs_append_as_snapshots(self, export_paths):
+        exporter.export_run([hosting(2.99)], formats=['csv', 'ndjson'], snapshot_at=datetime(2026, 1, 1))
+        summary = exporter.export_run([hosting(3.49), VPNProvider(provider_name='NordVPN', website_url='x')],
+                                      formats=['csv', 'ndjson'], snapshot_at=datetime(2026, 1, 2))
+        assert summary == "Export (csv, ndjson): 1 hosting, 1 vpn rows"
+
+        with open(export_paths / 'providers_data_hosting.csv', newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [(r['snapshot_at'], r['pricing_monthly']) for r in rows] == [
+            ('2026-01-01T00:00:00', '2.99'), ('2026-01-02T00:00:00', '3.49')
+        ]
+        assert json.loads(rows[0]['php_versions']) == ['8.2', '8.3']
+
+        lines = (export_paths / 'providers_data_vpn.ndjson').read_text().splitlines()
+        assert json.loads(lines[0])['provider_name'] == 'NordVPN'
+
+    def test_schema_change_rotates_csv(self, export_paths):
+        path = export_paths / 'providers_data_hosting.csv'
+        path.write_text('snapshot_at,provider_name\n2025-01-01,Old\n')
+        exporter.export_run([hosting(2.99)], formats=['csv'])
+        assert len(list(export_paths.glob('providers_data_hosting.*.csv'))) == 1
+        assert path.read_text().startswith('snapshot_at,provider_name,provider_type,')
+
+    def test_unknown_format_rejected(self, export_paths):
+        with pytest.raises(ValueError):
+            exporter.export_run([hosting(1.0)], formats=['xlsx'])
+
+    def test_parquet_dataset(self, export_paths):
+        pq = pytest.importorskip('pyarrow.parquet')
+        exporter.export_run([hosting(2.99)], formats=['parquet'], snapshot_at=datetime(2026, 1, 1))
+        exporter.export_run([hosting(3.49)], formats=['parquet'], snapshot_at=datetime(2026, 1, 2))
+        table = pq.read_table(export_paths / 'parquet' / 'hosting')
+        assert sorted(table.column('pricing_monthly').to_pylist()) == [2.99, 3.49]
+        assert table.schema.field('php_versions').type == exporter.arrow_schema(HostingProvider).field('php_versions').type
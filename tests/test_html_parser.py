@@ -0,0 +1,63 @@
+"""Tests for the pluggable HTML parser backends"""
+from scrapers.utils import html_parser
+from scrapers.utils.html_parser import parse_html, select_fields, select_text, soup_builder, strainer_for
+
+PAGE = "<html><body><div class='plan'><span class='price'> $2.95/mo </span></div></body></html>"
+
+
+class TestHtmlParser:
+    """Test backend selection and the selector fast path"""
+
+    def test_builder_follows_config(self):
+        assert soup_builder('html.parser') == 'html.parser'
+        assert soup_builder('lxml') == ('lxml' if html_parser.HAS_LXML else 'html.parser')
+
+    def test_selectolax_mode_still_returns_soup(self):
+        soup = parse_html(PAGE, 'selectolax')
+        assert soup.select_one('span.price').get_text().strip() == '$2.95/mo'
+
+    def test_unknown_backend_falls_back(self):
+        assert soup_builder('nonsense') == soup_builder('auto')
+
+    def test_select_text_every_backend(self):
+        for backend in html_parser.BACKENDS:
+            assert select_text(PAGE, 'div.plan .price', backend) == '$2.95/mo'
+            assert select_text(PAGE, '.missing', backend) is None
+
+    def test_select_fields_in_document_order(self):
+        page = "<div class='plan'><h3>Basic</h3><span class='price'>$2</span></div><h3>Pro</h3><span class='price'>$5</span>"
+        matches = select_fields(page, {'name': 'h3', 'price': '.price', 'none': '.missing'})
+        assert [m.text for m in matches['name']] == ['Basic', 'Pro']
+        assert [m.position for m in matches['name']] < [m.position for m in matches['price']]
+        assert matches['none'] == []
+
+
+class TestStrainer:
+    """Test partial parsing driven by registry selectors"""
+
+    PAGE = (
+        "<html><body><nav><span class='price'>$99</span></nav>"
+        "<div class='pricing-main'><div><span class='price'>$2.95</span></div></div>"
+        "<span data-testid='price'>$3.95</span><ul><li>a</li><li>b</li></ul></body></html>"
+    )
+
+    def test_strained_tree_matches_full_parse(self):
+        for css in ['.pricing-main .price', 'span.price', "span[data-testid='price']",
+                    "span.price-large, span[data-testid='price']", '.missing, .pricing-main']:
+            full = parse_html(self.PAGE).select_one(css)
+            strained = parse_html(self.PAGE, parse_only=strainer_for(css)).select_one(css)
+            assert (full and full.get_text()) == (strained and strained.get_text()), css
+
+    def test_strained_tree_is_smaller(self):
+        soup = parse_html(self.PAGE, parse_only=strainer_for('.pricing-main .price'))
+        assert soup.select_one('nav') is None and soup.select_one('li') is None
+
+    def test_position_dependent_selectors_parse_everything(self):
+        assert strainer_for('li:first-child') is None
+        assert strainer_for('nav + .pricing-main') is None
+        assert strainer_for('.price, li:nth-child(2)') is None
+
+    def test_scraper_parse_target_from_registry(self):
+        from scrapers.hosting.scrapers import BluehostScraper
+        assert BluehostScraper().parse_target() is strainer_for("span.price-large, span[data-testid='price']")
+        assert BluehostScraper().parse_target('unknown_css') is None
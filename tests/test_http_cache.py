@@ -0,0 +1,134 @@
+"""Tests for the conditional-GET HTTP cache"""
+import secrets
+
+from scrapers.utils import http_client
+from scrapers.utils.http_cache import HttpCache
+from scrapers.hosting.scrapers import BluehostScraper
+
+PAGE = b"<html><body><span class='price-large'>$2.95/mo</span></body></html>"
+
+
+class TestHttpCache:
+    """Test storage, validators, TTLs and eviction"""
+
+    def test_store_and_lookup(self, tmp_path):
+        cache = HttpCache(tmp_path, fresh_ttl=60)
+        cache.store('https://a.com', 'body', {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        entry = cache.lookup('https://a.com')
+        assert entry['body'] == 'body' and entry['fresh']
+        assert cache.conditional_headers(entry) == {
+            'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        }
+        assert cache.lookup('https://b.com') is None
+
+    def test_index_persists(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        cache.store('https://a.com', 'body', {})
+        cache.set_extracted('https://a.com', {'price': 2.95})
+        cache.save()
+        assert HttpCache(tmp_path).lookup('https://a.com')['extracted'] == {'price': 2.95}
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        cache = HttpCache(tmp_path, max_age=-1)
+        cache.store('https://a.com', 'body', {})
+        assert cache.lookup('https://a.com') is None
+
+    def test_lru_eviction(self, tmp_path):
+        cache = HttpCache(tmp_path, max_bytes=3000)
+        cache.store('https://old.com', secrets.token_hex(2000), {})
+        cache.store('https://new.com', secrets.token_hex(2000), {})
+        assert cache.lookup('https://old.com') is None
+        assert cache.lookup('https://new.com') is not None
+        assert cache.stats['evictions'] == 1
+
+
+class TestContentHash:
+    """Test extraction reuse for byte-identical bodies"""
+
+    def test_extractions_persist_and_are_bounded(self, tmp_path):
+        cache = HttpCache(tmp_path, max_extractions=2)
+        for n in range(3):
+            cache.remember_content(f'hash-{n}', {'price': float(n)})
+        cache.save()
+        reloaded = HttpCache(tmp_path)
+        assert reloaded.content_extraction('hash-0') is None
+        assert reloaded.content_extraction('hash-2') == {'price': 2.0}
+        assert (reloaded.stats['unchanged'], reloaded.stats['changed']) == (1, 1)
+
+    def test_hash_is_stable_and_content_sensitive(self):
+        assert http_client.content_hash('<p>$2.95</p>') == http_client.content_hash('<p>$2.95</p>')
+        assert http_client.content_hash('<p>$2.95</p>') != http_client.content_hash('<p>$3.95</p>')
+
+    def test_identical_body_skips_extraction(self, page_server, isolated_http_cache, isolated_live_memo, monkeypatch):
+        from scrapers import metrics
+        from scrapers.utils import parse_pool
+        page_server.pages['/pricing'] = (200, {'Content-Type': 'text/html'}, PAGE)  # no validators
+        url = f"{page_server.base_url}/pricing"
+        isolated_http_cache.fresh_ttl = 0
+        isolated_live_memo.ttl = 0
+        scraper = BluehostScraper()
+        assert scraper.get_live_data(url) == {'price': 2.95}
+
+        def no_extract(*args, **kwargs):
+            raise AssertionError("unchanged page was extracted again")
+        monkeypatch.setattr(parse_pool.ParsePool, 'extract', no_extract)
+
+        with metrics.scraper_run('Bluehost') as run:
+            assert scraper.get_live_data(url) == {'price': 2.95}
+        assert len(page_server.requests) == 2
+        assert run.counters.get('content_unchanged') == 1
+
+
+class TestConditionalFetch:
+    """Test 304 revalidation end to end through get_live_data"""
+
+    def test_304_reuses_extraction(self, page_server, isolated_http_cache, isolated_live_memo, monkeypatch):
+        page_server.pages['/pricing'] = (200, {'Content-Type': 'text/html', 'ETag': '"v1"'}, PAGE)
+        url = f"{page_server.base_url}/pricing"
+        isolated_http_cache.fresh_ttl = 0  # always revalidate
+        isolated_live_memo.ttl = 0  # each call behaves like a new pipeline run
+        scraper = BluehostScraper()
+
+        assert scraper.get_live_data(url) == {'price': 2.95}
+
+        # Second run must not parse at all
+        def no_parse(*args, **kwargs):
+            raise AssertionError("page was re-parsed")
+        monkeypatch.setattr('scrapers.adaptive_base.BeautifulSoup', no_parse)
+
+        assert scraper.get_live_data(url) == {'price': 2.95}
+        assert page_server.requests[-1][1].get('If-None-Match') == '"v1"'
+        assert isolated_http_cache.stats['revalidated'] == 1
+
+    def test_304_reextracts_after_selector_or_version_change(self, page_server, isolated_http_cache,
+                                                            isolated_live_memo, monkeypatch):
+        from scrapers import adaptive_base, selector_registry
+        from scrapers.utils import parse_pool
+        page = PAGE.replace(b'</body>', b"<span class='price-new'>$3.95/mo</span></body>")
+        page_server.pages['/pricing'] = (200, {'Content-Type': 'text/html', 'ETag': '"v1"'}, page)
+        url = f"{page_server.base_url}/pricing"
+        isolated_http_cache.fresh_ttl = 0
+        isolated_live_memo.ttl = 0
+        scraper = BluehostScraper()
+        assert scraper.get_live_data(url) == {'price': 2.95}
+
+        extract = parse_pool.ParsePool.extract
+        calls = []
+        monkeypatch.setattr(parse_pool.ParsePool, 'extract', lambda *a, **kw: calls.append(1) or extract(*a, **kw))
+        edited = {**selector_registry.SELECTOR_REGISTRY['Bluehost'], 'price_css': 'span.price-new'}
+        monkeypatch.setitem(selector_registry.SELECTOR_REGISTRY, 'Bluehost', edited)
+        assert scraper.get_live_data(url) == {'price': 3.95}
+        monkeypatch.setattr(adaptive_base, 'LIVE_EXTRACTION_VERSION', adaptive_base.LIVE_EXTRACTION_VERSION + 1)
+        assert scraper.get_live_data(url) == {'price': 3.95}
+        assert scraper.get_live_data(url) == {'price': 3.95}
+
+        assert len(calls) == 2  # the edit and the bump re-extract; the last 304 reuses
+        assert isolated_http_cache.stats['revalidated'] == 3
+
+    def test_fresh_entry_skips_network(self, page_server, isolated_http_cache):
+        page_server.pages['/pricing'] = (200, {'Content-Type': 'text/html'}, PAGE)
+        url = f"{page_server.base_url}/pricing"
+        http_client.run_sync(http_client.fetch_page(url, jitter=None, rate_limit=False))
+        response = http_client.run_sync(http_client.fetch_page(url, jitter=None, rate_limit=False))
+        assert response.from_cache
+        assert len(page_server.requests) == 1
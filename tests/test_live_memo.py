@@ -0,0 +1,69 @@
+"""Tests for per-run memoization of live page extractions"""
+import threading
+import time
+
+from scrapers.utils.live_memo import LiveDataMemo
+from scrapers.hosting.scrapers import BluehostScraper
+
+PAGE = b"<html><body><span class='price-large'>$2.95/mo</span></body></html>"
+
+
+class TestLiveDataMemo:
+    """Test keying, TTL and single-flight behaviour"""
+
+    def test_computes_once_per_key(self):
+        memo = LiveDataMemo(ttl=60)
+        calls = []
+        compute = lambda: calls.append(1) or {'price': 1.0}
+        assert memo.get_or_compute('A', 'https://a.com', compute) == {'price': 1.0}
+        assert memo.get_or_compute('A', 'https://a.com', compute) == {'price': 1.0}
+        memo.get_or_compute('B', 'https://a.com', compute)  # other provider, other key
+        assert len(calls) == 2
+        assert memo.stats == {'hits': 1, 'misses': 2}
+
+    def test_expired_entries_are_recomputed(self):
+        memo = LiveDataMemo(ttl=0.01)
+        calls = []
+        memo.get_or_compute('A', 'u', lambda: calls.append(1) or {})
+        time.sleep(0.02)
+        memo.get_or_compute('A', 'u', lambda: calls.append(1) or {})
+        assert len(calls) == 2
+
+    def test_concurrent_callers_share_one_fetch(self):
+        memo = LiveDataMemo(ttl=60)
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.05)
+            return {'price': 3.0}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(memo.get_or_compute('A', 'u', slow)))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert results == [{'price': 3.0}] * 5
+
+    def test_callers_get_copies(self):
+        memo = LiveDataMemo(ttl=60)
+        memo.get_or_compute('A', 'u', lambda: {'price': 1.0})['price'] = 99
+        assert memo.get_or_compute('A', 'u', lambda: {})['price'] == 1.0
+
+
+class TestVerifiedFieldFetchesOnce:
+    """Repeated get_verified_field('plans') calls hit the network once"""
+
+    def test_plans_twice_one_request(self, page_server, isolated_http_cache, monkeypatch):
+        page_server.pages['/pricing'] = (200, {'Content-Type': 'text/html'}, PAGE)
+        isolated_http_cache.fresh_ttl = 0  # the HTTP cache alone would revalidate every call
+        scraper = BluehostScraper()
+        monkeypatch.setitem(scraper.verified_data, 'url', f"{page_server.base_url}/pricing")
+
+        first = scraper.get_verified_field('plans')
+        second = BluehostScraper().get_verified_field('plans')  # another scraper instance, same run
+        assert first == second and first[0]['price'] == 2.95
+        assert len(page_server.requests) == 1
@@ -0,0 +1,76 @@
+"""Tests for the local SQLite write-through store"""
+from scrapers.batch_writer import BatchWriter
+from scrapers.local_store import LocalStore
+from tests.test_batch_writer import FakeClient
+
+HOSTING = 'provider_name,plan_name'
+
+
+def plan(provider, name, price):
+    return {'provider_name': provider, 'plan_name': name, 'pricing_monthly': price}
+
+
+class TestLocalStore:
+    """Test local upserts, dirty tracking and replication"""
+
+    def test_put_reports_changes_only(self, tmp_path):
+        store = LocalStore(tmp_path / 'providers.db')
+        assert store.put('hosting_providers', plan('A', 'Basic', 2.0), HOSTING)
+        assert not store.put('hosting_providers', {**plan('A', 'Basic', 2.0), 'last_updated': 'now'}, HOSTING)
+        assert store.put('hosting_providers', plan('A', 'Basic', 3.0), HOSTING)
+        assert store.get('hosting_providers', 'A', 'Basic')['pricing_monthly'] == 3.0
+        assert store.rows('hosting_providers') == [plan('A', 'Basic', 3.0)]
+
+    def test_wal_mode_and_persistence(self, tmp_path):
+        store = LocalStore(tmp_path / 'providers.db')
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        store.put('vpn_providers', {'provider_name': 'NordVPN'}, 'provider_name')
+        store.close()
+        assert LocalStore(tmp_path / 'providers.db').get('vpn_providers', 'NordVPN') == {'provider_name': 'NordVPN'}
+
+    def test_replication_is_bulk_and_incremental(self, tmp_path):
+        store = LocalStore(tmp_path / 'providers.db')
+        for i in range(30):
+            store.put('hosting_providers', plan(f'P{i}', 'Basic', 1.0), HOSTING)
+        client = FakeClient()
+        writer = BatchWriter(client, chunk_size=100)
+
+        queued = store.queue_dirty(writer)
+        writer.flush()
+        store.mark_synced(queued, writer.failures)
+        assert len(client.calls) == 1 and store.dirty_count() == 0
+
+        store.put('hosting_providers', plan('P3', 'Basic', 1.0), HOSTING)  # unchanged
+        store.put('hosting_providers', plan('P4', 'Basic', 1.5), HOSTING)  # changed
+        assert store.dirty_count() == 1
+        store.mark_synced(store.queue_dirty(writer), writer.flush())
+        assert client.calls[-1][2] == [plan('P4', 'Basic', 1.5)]
+
+    def test_rejected_rows_stay_dirty(self, tmp_path):
+        store = LocalStore(tmp_path / 'providers.db')
+        store.put('hosting_providers', plan('Good', 'Basic', 1.0), HOSTING)
+        store.put('hosting_providers', plan('Bad', 'Basic', -1.0), HOSTING)
+        writer = BatchWriter(FakeClient(), chunk_size=100)
+
+        queued = store.queue_dirty(writer)
+        store.mark_synced(queued, writer.flush())
+        assert store.dirty_count() == 1
+        assert store.delete('hosting_providers', 'Bad') == 1
+        assert store.dirty_count() == 0
+
+    def test_unchanged_rows_are_refreshed_after_interval(self, tmp_path):
+        store = LocalStore(tmp_path / 'providers.db', refresh_after=3600)
+        store.put('hosting_providers', {**plan('A', 'Basic', 2.0), 'last_updated': 'day 1'}, HOSTING)
+        writer = BatchWriter(FakeClient(), chunk_size=100)
+        store.mark_synced(store.queue_dirty(writer), writer.flush())
+
+        store.put('hosting_providers', {**plan('A', 'Basic', 2.0), 'last_updated': 'day 1, later'}, HOSTING)
+        assert store.dirty_count() == 0  # replicated within the hour
+
+        store._conn.execute("UPDATE rows SET synced_at = synced_at - 7200")
+        assert not store.put('hosting_providers', {**plan('A', 'Basic', 2.0), 'last_updated': 'day 2'}, HOSTING)
+        assert store.dirty_count() == 1
+        queued = store.queue_dirty(writer)
+        assert writer.pending_row('hosting_providers', HOSTING, ('A', 'Basic'))['last_updated'] == 'day 2'
+        store.mark_synced(queued, writer.flush())
+        assert store.dirty_count() == 0
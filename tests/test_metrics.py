@@ -0,0 +1,57 @@
+"""Tests for per-phase run metrics"""
+import json
+import time
+
+from scrapers import metrics
+from scrapers.metrics import MetricsRegistry, scraper_run, span
+from scrapers.utils import http_client
+
+
+class TestSpans:
+    """Test span nesting and attribution"""
+
+    def test_breakdown_uses_self_time(self):
+        with scraper_run('Bluehost') as run:
+            with span('scrape'):
+                time.sleep(0.05)
+                with span('network'):
+                    time.sleep(0.1)
+        assert 0.1 <= run.phases['network'] < 0.2
+        assert 0.05 <= run.phases['scrape'] < 0.1  # nested network time excluded
+
+    def test_counters_outside_a_run_only_hit_registry(self):
+        before = metrics.get_metrics().counters.get('test_event', 0)
+        metrics.incr('test_event')
+        assert metrics.get_metrics().counters['test_event'] == before + 1
+
+    def test_fetch_on_shared_loop_is_attributed_to_scraper(self, page_server):
+        page_server.pages['/p'] = (200, {}, b'<p>$1.99</p>')
+        with scraper_run('Bluehost') as run:
+            http_client.run_sync(http_client.fetch_page(f"{page_server.base_url}/p", jitter=(0.05, 0.05)))
+        assert run.phases['jitter'] >= 0.05
+        assert 'network' in run.phases
+        assert run.counters['http_requests'] == 1
+
+
+class TestRegistryOutput:
+    """Test Prometheus / JSON export"""
+
+    def test_prometheus_histogram(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.observe('parse', 0.05)
+        registry.observe('parse', 0.5)
+        registry.observe('parse', 5.0)
+        registry.incr('http_requests', 3)
+        text = registry.to_prometheus()
+        assert 'scraper_phase_seconds_bucket{phase="parse",le="0.1"} 1' in text
+        assert 'scraper_phase_seconds_bucket{phase="parse",le="1.0"} 2' in text
+        assert 'scraper_phase_seconds_bucket{phase="parse",le="+Inf"} 3' in text
+        assert 'scraper_phase_seconds_count{phase="parse"} 3' in text
+        assert 'scraper_events_total{event="http_requests"} 3' in text
+
+    def test_write_json_by_suffix(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.observe('network', 0.2)
+        registry.write(tmp_path / 'metrics.json')
+        data = json.loads((tmp_path / 'metrics.json').read_text())
+        assert data['phases']['network']['count'] == 1
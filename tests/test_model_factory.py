@@ -0,0 +1,41 @@
+"""Tests for bulk provider model construction"""
+import pytest
+from pydantic import ValidationError
+
+from scrapers.model_factory import build_models, split_specs
+from scrapers.models import HostingProvider
+
+
+def row(plan, price):
+    return {'provider_name': 'Acme', 'provider_type': 'shared', 'plan_name': plan,
+            'website_url': 'https://acme.example', 'pricing_monthly': price}
+
+
+class TestBuildModels:
+    """Test bulk validation and the specs merge"""
+
+    def test_builds_validated_models(self):
+        plans = build_models(HostingProvider, [row('Basic', '2.95'), row('Pro', 5)])
+        assert [p.pricing_monthly for p in plans] == [2.95, 5.0]
+        with pytest.raises(ValidationError):
+            build_models(HostingProvider, [row('Bad', -1)])
+
+    def test_specs_override_rows_before_construction(self):
+        specs = {'ssh_access': True, 'php_versions': ['8.2'], 'storage_gb': 0, 'not_a_field': 1}
+        plans = build_models(HostingProvider, [{**row('Basic', 1), 'storage_gb': 50, 'ssh_access': False}], specs)
+        assert plans[0].ssh_access is True
+        assert plans[0].php_versions == ['8.2']
+        assert plans[0].storage_gb == 50  # falsy spec values never override
+        assert 'ssh_access' in plans[0].model_fields_set
+
+    def test_values_the_model_rejects_are_kept_as_is(self):
+        valid, unvalidated = split_specs(HostingProvider, {'web_server': 'Nginx + Apache', 'cdn_included': True})
+        assert valid == {'cdn_included': True}
+        assert unvalidated == {'web_server': 'Nginx + Apache'}
+        plan = build_models(HostingProvider, [row('Basic', 1)], {'web_server': 'Nginx + Apache'})[0]
+        assert plan.web_server == 'Nginx + Apache'
+
+    def test_plans_do_not_share_list_values(self):
+        plans = build_models(HostingProvider, [row('A', 1), row('B', 2)], {'cms_support': ['WordPress']})
+        plans[0].cms_support.append('Joomla')
+        assert plans[1].cms_support == ['WordPress']
@@ -0,0 +1,96 @@
+"""Tests for the process-pool live extraction stage"""
+from scrapers import metrics
+from scrapers.adaptive_base import merge_live_plans
+from scrapers.utils.parse_pool import ParsePool, extract_live, get_parse_pool
+
+PAGE = '<html><body><div class="plan"><span class="price">$2.95/mo</span></div>{}</body></html>'
+FILLER = '<p>Fast, secure hosting for every site.</p>' * 500
+
+
+def price_page(price):
+    return PAGE.replace('2.95', price).format(FILLER)
+
+
+class TestExtractLive:
+    """Test the extraction that runs in the workers"""
+
+    def test_selector_first(self):
+        result = extract_live(price_page('2.95'), '.plan .price')
+        assert (result['price'], result['method']) == (2.95, 'selector')
+        assert set(result['timings']) == {'parse'}
+
+    def test_heuristics_when_the_selector_misses(self):
+        result = extract_live(price_page('4.99'), '.missing')
+        assert (result['price'], result['method']) == (4.99, 'heuristic')
+        assert set(result['timings']) == {'parse', 'extract'}
+
+    def test_nothing_found(self):
+        assert 'price' not in extract_live('<p>Contact sales</p>')
+
+
+class TestParsePool:
+    """Test pooled vs inline extraction"""
+
+    def test_workers_match_inline(self):
+        pages = [(price_page(f'{n}.99'), '.plan .price' if n % 2 else None) for n in range(1, 9)]
+        inline = ParsePool(workers=0).extract_many(pages)
+        pool = ParsePool(workers=2, chunksize=3, min_bytes=0)
+        try:
+            pooled = pool.extract_many(pages)
+            single = pool.extract(*pages[0])
+        finally:
+            pool.shutdown()
+        strip = lambda results: [{k: v for k, v in r.items() if k != 'timings'} for r in results]
+        assert strip(pooled) == strip(inline)
+        assert strip([single]) == strip(inline[:1])
+        assert pool.stats == {'pooled': 9, 'inline': 0}
+
+    def test_small_pages_stay_inline(self):
+        pool = ParsePool(workers=4, min_bytes=1 << 20)
+        assert pool.extract(price_page('2.95'), '.plan .price')['price'] == 2.95
+        assert pool.stats['inline'] == 1 and pool._executor is None
+
+    def test_worker_timings_reach_the_scraper_breakdown(self):
+        with metrics.scraper_run('Acme') as run:
+            get_parse_pool().extract(price_page('2.95'), '.missing')
+        assert {'parse', 'extract'} <= set(run.phases)
+
+
+CARDS = '''<html><body>
+<div class="card"><h3 class="card-title">Starter</h3><span class="price-large">$1.99/mo</span>
+  <div class="term-renewal">Renews at $11.99/mo</div></div>
+<div class="card"><h3 class="card-title">Business</h3><span class="price-large">$4.99/mo</span></div>
+<div class="card"><h3 class="card-title">eCommerce Essentials</h3><span class="price-large">$8.99/mo</span>
+  <div class="term-renewal">Renews at $24.99/mo</div><ul class="features"><li>Free domain</li><li>Store</li></ul></div>
+</body></html>'''
+FIELDS = {'name': 'h3.card-title', 'renewal': 'div.term-renewal', 'features': 'ul.features'}
+
+
+class TestLivePlans:
+    """Test per-plan records from one walk over a provider's selectors"""
+
+    def test_records_align_despite_missing_fields(self):
+        result = extract_live(CARDS, 'span.price-large', FIELDS)
+        assert result['price'] == 1.99 and result['selector_hit']
+        assert result['plans'] == [
+            {'name': 'Starter', 'price': 1.99, 'renewal': 11.99},
+            {'name': 'Business', 'price': 4.99},
+            {'name': 'eCommerce Essentials', 'price': 8.99, 'renewal': 24.99, 'features': ['Free domain', 'Store']},
+        ]
+        assert result['fields_hit'] == {'name': True, 'renewal': True, 'features': True, 'price': True}
+
+    def test_every_registry_plan_updated(self, page_server):
+        from scrapers.hosting.scrapers import BluehostScraper
+        page_server.pages['/pricing'] = (200, {'Content-Type': 'text/html'}, CARDS.encode())
+        scraper = BluehostScraper()
+        live = scraper.get_live_data(f"{page_server.base_url}/pricing")
+        plans = merge_live_plans(scraper.verified_data['plans'], live)
+        assert [(p['price'], p['renewal']) for p in plans] == [(1.99, 11.99), (4.99, 16.99), (8.99, 24.99)]
+        assert scraper.verified_data['plans'][0]['price'] == 2.95  # registry untouched
+        assert len(page_server.requests) == 1
+
+    def test_unpaired_pages_only_update_the_first_plan(self):
+        plans = [{'name': 'Basic', 'price': 3.0}, {'name': 'Pro', 'price': 6.0}]
+        live = {'price': 2.5, 'plans': [{'name': 'Enterprise', 'price': 99.0}]}
+        assert [p['price'] for p in merge_live_plans(plans, live)] == [2.5, 6.0]
+        assert merge_live_plans(plans, {}) is plans
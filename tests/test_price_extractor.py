@@ -0,0 +1,41 @@
+"""Tests for the single-pass price extraction engine"""
+from scrapers.utils.price_extractor import best_price, extract_prices
+
+
+class TestExtractPrices:
+    """Test candidate detection and ranking"""
+
+    def test_starting_monthly_price_beats_renewal(self):
+        page = "<div>Starting at <span>$2<sup>.95</sup></span>/mo</div><div>Renews at $10.99/mo</div>"
+        top = extract_prices(page)[0]
+        assert (top.value, top.currency, top.period) == (2.95, 'USD', 'month')
+        assert top.confidence > extract_prices(page)[1].confidence
+
+    def test_struck_through_price_ranks_last(self):
+        page = "<p><del>$1.99</del> now $3.49 per month</p>"
+        assert best_price(page) == 3.49
+
+    def test_currencies_and_decimal_comma(self):
+        page = "<p>€4,99 per month</p><p>&pound;5.50/mo</p><p>6 EUR</p><p>7,50 €</p>"
+        found = {(c.value, c.currency) for c in extract_prices(page)}
+        assert found == {(4.99, 'EUR'), (5.5, 'GBP'), (6.0, 'EUR'), (7.5, 'EUR')}
+
+    def test_scripts_and_styles_are_ignored(self):
+        page = "<script>s.replace(/a/, '$1'); var p = '$3.00';</script><style>.x{}</style><p>$9.99/mo</p>"
+        assert [c.value for c in extract_prices(page)] == [9.99]
+
+    def test_bytes_and_str_agree(self):
+        page = "<p>From &#36;3.75/month</p><p>€5 / mo</p><p>$1,299.00</p>"
+        def strip(cands):  # offsets count bytes vs characters
+            return [(c.value, c.currency, c.period, c.confidence) for c in cands]
+        assert strip(extract_prices(page, max_value=2000)) == strip(extract_prices(page.encode('utf-8'), max_value=2000))
+
+    def test_out_of_range_values_dropped(self):
+        assert best_price("<p>$0.01 domain</p><p>$5000 server</p>") == 0.0
+
+    def test_usd_preferred_over_other_currencies(self):
+        page = "<p>Starting at €1.99 per month</p><p>₹149/mo</p><p>Only $2.95</p>"
+        assert extract_prices(page)[0].currency != 'USD'
+        assert best_price(page) == 2.95
+        assert best_price("<p>Starting at €1.99 per month</p><p>€3.99</p>") == 1.99
+        assert best_price(page, currency='EUR') == 1.99
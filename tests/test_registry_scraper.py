@@ -0,0 +1,88 @@
+"""Tests for the generic, registry-driven scraper"""
+import pytest
+
+from scrapers import registry_scraper
+from scrapers.adaptive_base import AdaptiveBaseScraper
+from scrapers.models import HostingProvider, VPNProvider
+from scrapers.registry_scraper import (
+    RegistryHostingScraper, hosting_rows, profiles, scrape_category, scraper_class, storage_gb,
+)
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Registry data only, no live price lookups"""
+    monkeypatch.setattr(AdaptiveBaseScraper, 'get_live_data', lambda self, url: {})
+
+
+def profile(template):
+    return registry_scraper.RegistryProfile('hosting', 'Acme', 'Acme', 'AcmeScraper', 'https://acme.example', template)
+
+
+class TestRegistryRows:
+    """Test the per-template field mapping"""
+
+    def test_storage_parsing(self):
+        assert storage_gb('100 GB NVMe') == 100
+        assert storage_gb('Unlimited SSD') == 999
+        assert storage_gb(50) == 50
+        assert storage_gb('') == 999
+
+    def test_classic_template_fixes_bandwidth_and_domain(self):
+        plan = {'name': 'Basic', 'price': 2.95, 'renewal': 10.99, 'storage': '10 GB SSD', 'bandwidth': '100 GB'}
+        flexible = hosting_rows(profile('flexible'), [plan])[0]
+        classic = hosting_rows(profile('classic'), [plan])[0]
+        assert (flexible['bandwidth'], flexible['free_domain']) == ('100 GB', False)
+        assert (classic['bandwidth'], classic['free_domain']) == ('Unlimited', True)
+        assert classic['storage_gb'] == flexible['storage_gb'] == 10
+
+
+class TestRegistryClasses:
+    """Test the generated per-provider scraper classes"""
+
+    def test_generated_class_per_provider(self):
+        from scrapers.hosting.scrapers import BluehostScraper
+        assert BluehostScraper is scraper_class('hosting', 'BluehostScraper')
+        assert issubclass(BluehostScraper, RegistryHostingScraper)
+        assert BluehostScraper.__module__ == 'scrapers.registry_scraper'
+        assert BluehostScraper().provider_name == 'Bluehost'
+        with pytest.raises(KeyError):
+            scraper_class('hosting', 'NoSuchScraper')
+
+    def test_overrides_rename_without_losing_the_record(self):
+        from scrapers.vpn import PIAScraper
+        scraper = PIAScraper()
+        assert scraper.provider_name == 'PIA'
+        assert scraper.verified_data['provider_name'] == 'Private Internet Access'
+
+    def test_hand_written_module_wins(self):
+        from scrapers.vpn import NordVPNScraper
+        assert 'NordVPN' not in {p.provider_name for p in profiles('vpn')}
+        assert NordVPNScraper.__module__ == 'scrapers.vpn.nordvpn'
+
+
+class TestScrapeCategory:
+    """Test the batched pass"""
+
+    def test_matches_per_provider_run(self, offline):
+        results = scrape_category('hosting')
+        assert len(results) == len(profiles('hosting'))
+        for cls in registry_scraper.scraper_classes('hosting'):
+            expected = [p.model_dump(exclude={'last_updated'}) for p in cls().run()]
+            assert [p.model_dump(exclude={'last_updated'}) for p in results[cls.PROFILE.provider_name]] == expected
+        vpn = scrape_category('vpn')
+        assert all(isinstance(v, VPNProvider) for v in vpn.values())
+
+    def test_bad_record_only_costs_its_own_result(self, offline, monkeypatch):
+        original = RegistryHostingScraper.plan_rows
+
+        def plan_rows(self):
+            rows = original(self)
+            if self.provider_name == 'Kinsta':
+                rows[0]['pricing_monthly'] = -1
+            return rows
+
+        monkeypatch.setattr(RegistryHostingScraper, 'plan_rows', plan_rows)
+        results = scrape_category('hosting')
+        assert results['Kinsta'] == []
+        assert all(isinstance(p, HostingProvider) for p in results['Bluehost']) and results['Bluehost']
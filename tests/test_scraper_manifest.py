@@ -0,0 +1,55 @@
+"""Tests for the build-time scraper manifest"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from scrapers.scraper_manifest import MANIFEST_PATH, ScraperEntry, build_manifest, load_manifest, write_manifest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestScraperManifest:
+    """Test manifest generation and lazy loading"""
+
+    def test_committed_manifest_is_current(self):
+        """Fails when a scraper changed without `python -m scrapers.scraper_manifest`"""
+        committed = json.loads(MANIFEST_PATH.read_text())['scrapers']
+        assert committed == [vars(e) for e in build_manifest()]
+
+    def test_loading_imports_no_scraper_module(self):
+        code = (
+            "import sys; from scrapers.scraper_manifest import load_manifest; "
+            "entries = load_manifest(); "
+            "loaded = [m for m in sys.modules if m.startswith(('scrapers.vpn.', 'scrapers.hosting.scrapers.', 'scrapers.registry_scraper'))]; "
+            "print(len(entries), len(loaded))"
+        )
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+        count, loaded = map(int, out.stdout.split())
+        assert count > 0 and loaded == 0
+
+    def test_entry_loads_its_class(self):
+        entry = next(e for e in load_manifest('hosting') if e.class_name == 'BluehostScraper')
+        assert entry.load().__name__ == 'BluehostScraper'
+        assert entry.host == 'bluehost.com' and entry.provider_name == 'Bluehost'
+
+    def test_stale_manifest_is_rebuilt(self, tmp_path):
+        path = tmp_path / 'manifest.json'
+        write_manifest([ScraperEntry('Gone', 'vpn', 'scrapers.vpn.gone', 'GoneScraper', 'gone.com')], path)
+        data = json.loads(path.read_text())
+        data['modules'] = ['vpn/gone.py']
+        path.write_text(json.dumps(data))
+
+        entries = load_manifest(path=path)
+        assert 'GoneScraper' not in {e.class_name for e in entries}
+        assert json.loads(path.read_text())['modules'] != ['vpn/gone.py']
+
+    def test_registry_change_rebuilds(self, tmp_path):
+        path = tmp_path / 'manifest.json'
+        load_manifest(path=path)
+        data = json.loads(path.read_text())
+        data['registry']['hosting'].remove('Bluehost')
+        data['scrapers'] = [e for e in data['scrapers'] if e['class_name'] != 'BluehostScraper']
+        path.write_text(json.dumps(data))
+
+        assert 'BluehostScraper' in {e.class_name for e in load_manifest(path=path)}
@@ -1,8 +1,8 @@
 """Test suite for all scrapers"""
 import pytest
 from scrapers.vpn.nordvpn import NordVPNScraper
-from scrapers.vpn.expressvpn import ExpressVPNScraper
-from scrapers.hosting.scrapers.bluehost import BluehostScraper
+from scrapers.vpn import ExpressVPNScraper
+from scrapers.hosting.scrapers import BluehostScraper
 from scrapers.hosting.api.digitalocean import DigitalOceanClient
 
 
@@ -0,0 +1,63 @@
+"""Tests for registry selector compilation and hit-rate telemetry"""
+from scrapers import selector_registry
+from scrapers.hosting.scrapers import BluehostScraper
+from scrapers.utils.html_parser import compiled_selector
+from scrapers.utils.selector_stats import SelectorStats
+
+HIT = b"<html><body><span class='price-large'>$2.95/mo</span></body></html>"
+MISS = b"<html><body><p>Plans from <b>$3.95/mo</b></p></body></html>"
+
+
+class TestSelectorStats:
+    """Test counting, persistence and dead-selector detection"""
+
+    def test_counts_persist_across_runs(self, tmp_path):
+        stats = SelectorStats(tmp_path / 'stats.json')
+        stats.record('Acme', 'price_css', '.price', True, 0.01)
+        stats.record('Acme', 'price_css', '.price', False, 0.02, fallback_seconds=0.5)
+        stats.save()
+
+        reloaded = SelectorStats(tmp_path / 'stats.json')
+        entry = reloaded.get('Acme', 'price_css')
+        assert (entry['checks'], entry['hits'], entry['fallback_seconds']) == (2, 1, 0.5)
+        assert entry['last_hit'] is not None
+        assert reloaded.rows()[0]['hit_rate'] == 0.5
+
+    def test_dead_after_misses_only(self, tmp_path):
+        stats = SelectorStats(tmp_path / 'stats.json', dead_after=3)
+        for _ in range(3):
+            stats.record('Acme', 'price_css', '.gone', False, 0.01)
+            stats.record('Beta', 'price_css', '.price', True, 0.01)
+        assert [(r['provider'], r['css']) for r in stats.dead()] == [('Acme', '.gone')]
+        assert '1 dead (Acme.price_css)' in stats.report()
+
+    def test_edited_selector_starts_over(self, tmp_path):
+        stats = SelectorStats(tmp_path / 'stats.json', dead_after=1)
+        stats.record('Acme', 'price_css', '.gone', False, 0.01)
+        stats.record('Acme', 'price_css', '.price-new', True, 0.01)
+        assert stats.get('Acme', 'price_css')['checks'] == 1 and not stats.dead()
+
+
+class TestLiveLookups:
+    """Test that live scraping feeds the counters"""
+
+    def test_hit_and_fallback_are_recorded(self, page_server, isolated_selector_stats, monkeypatch):
+        page_server.pages['/hit'] = (200, {'Content-Type': 'text/html'}, HIT)
+        page_server.pages['/miss'] = (200, {'Content-Type': 'text/html'}, MISS)
+        scraper = BluehostScraper()
+        assert scraper.get_live_data(f"{page_server.base_url}/hit") == {'price': 2.95}
+        assert scraper.get_live_data(f"{page_server.base_url}/miss") == {'price': 3.95}
+
+        entry = isolated_selector_stats.get('Bluehost', 'price_css')
+        assert entry['css'] == selector_registry.get_selectors('Bluehost')['price_css']
+        assert (entry['checks'], entry['hits']) == (2, 1)
+        assert entry['fallback_seconds'] > 0
+
+
+class TestCompiledSelectors:
+    """Test the import-time compilation of the registry"""
+
+    def test_registry_compiles_once(self):
+        assert selector_registry.INVALID_SELECTORS == {}
+        css = selector_registry.get_selectors('Bluehost')['price_css']
+        assert compiled_selector(css) is compiled_selector(css)
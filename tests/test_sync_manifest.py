@@ -0,0 +1,115 @@
+"""Tests for diff-based sync change detection"""
+import copy
+
+from scrapers.batch_writer import BatchWriter
+from scrapers.sync_manifest import SyncManifest, content_hash, row_key
+
+
+def _payload(price=2.99, extracted_at="2026-01-01T00:00:00"):
+    return {
+        "provider_name": "Hostinger",
+        "plan_name": "Premium",
+        "introductory_price": price,
+        "last_updated": extracted_at,
+        "raw_data": {"source": "verified", "extracted_at": extracted_at},
+    }
+
+
+class TestContentHash:
+    """Test payload hashing"""
+
+    def test_timestamps_do_not_change_hash(self):
+        assert content_hash(_payload(extracted_at="a")) == content_hash(_payload(extracted_at="b"))
+
+    def test_price_changes_hash(self):
+        assert content_hash(_payload(2.99)) != content_hash(_payload(3.99))
+
+    def test_stored_hash_is_ignored(self):
+        payload = _payload()
+        digest = content_hash(payload)
+        payload["raw_data"]["content_hash"] = digest
+        assert content_hash(payload) == digest
+
+    def test_row_key(self):
+        assert row_key(_payload(), "provider_name, plan_name") == "Hostinger|Premium"
+
+
+class TestSyncManifest:
+    """Test new/changed/unchanged detection and persistence"""
+
+    def test_status(self, tmp_path):
+        manifest = SyncManifest(tmp_path / "manifest.json")
+        assert manifest.status("hosting_providers", "Hostinger|Premium", "abc") == "new"
+        manifest.record("hosting_providers", "Hostinger|Premium", "abc")
+        assert manifest.status("hosting_providers", "Hostinger|Premium", "abc") == "unchanged"
+        assert manifest.status("hosting_providers", "Hostinger|Premium", "def") == "changed"
+
+    def test_persists_across_runs(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        manifest = SyncManifest(path)
+        manifest.record("vpn_providers", "NordVPN", "abc")
+        manifest.save()
+        assert SyncManifest(path).status("vpn_providers", "NordVPN", "abc") == "unchanged"
+
+    def test_load_remote_hashes_the_rows(self, tmp_path):
+        manifest = SyncManifest(tmp_path / "manifest.json")
+        manifest.record("hosting_providers", "Gone|Basic", "abc")
+        stored = {**_payload(), "raw_data": {"source": "verified", "content_hash": "stale"}}
+        manifest.load_remote("hosting_providers", [stored], "provider_name,plan_name")
+        assert manifest.known("hosting_providers") == {"Hostinger|Premium": content_hash(_payload())}
+
+    def test_corrupt_manifest_starts_empty(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json")
+        assert SyncManifest(path).tables == {}
+
+
+class FakeDatabase:
+    """Supabase stand-in: one table, upserts by provider_name + plan_name"""
+
+    def __init__(self):
+        self.rows = {}
+        self.selects = []
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        self.selects.append(columns)
+        self.result = [{c: row.get(c) for c in columns.split(",")} for row in self.rows.values()]
+        return self
+
+    def upsert(self, rows, on_conflict):
+        self.result = None
+        for row in rows:
+            self.rows[row_key(row, on_conflict)] = copy.deepcopy(row)
+        return self
+
+    def execute(self):
+        self.data = self.result
+        return self
+
+
+class TestSyncRows:
+    """Test sync_verified_data against rows other writers changed"""
+
+    def test_pipeline_overwrite_is_restored(self, tmp_path, monkeypatch):
+        import scripts.sync_verified_data as sync
+        db = FakeDatabase()
+        monkeypatch.setattr(sync, "get_supabase", lambda required=False: db)
+        monkeypatch.setattr(sync, "get_writer", lambda: BatchWriter(db))
+        manifest = SyncManifest(tmp_path / "manifest.json")
+
+        def run(**kwargs):
+            rows = {"Hostinger - Premium": _payload(2.99)}
+            return sync.sync_rows("hosting_providers", "provider_name,plan_name", rows,
+                                  {"Hostinger - Premium": "$2.99"}, manifest, **kwargs)
+
+        assert run() == 1
+        assert run() == 0
+        # run_pipeline upserts a live price and leaves raw_data (and its content_hash) alone
+        db.rows["Hostinger|Premium"]["introductory_price"] = 4.99
+        assert run(trust_manifest=True) == 0  # the opt-in fast path does not look
+        assert run() == 1
+        assert db.rows["Hostinger|Premium"]["introductory_price"] == 2.99
+        assert db.selects[0].startswith("provider_name,plan_name,")
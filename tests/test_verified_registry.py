@@ -0,0 +1,47 @@
+"""Tests for the shared verified_data registry"""
+import json
+import os
+
+from scrapers.verified_registry import VerifiedRegistry, get_registry, normalize_name
+
+
+def write_registry(path, hosting_name, mtime):
+    path.write_text(json.dumps({
+        'hosting': [{'name': hosting_name, 'url': 'https://example.com', 'plans': []}],
+        'vpn': [{'provider_name': 'Hide.me', 'monthly_price': 9.95}],
+    }))
+    os.utime(path, (mtime, mtime))
+
+
+class TestVerifiedRegistry:
+    """Test indexed lookups and mtime invalidation"""
+
+    def test_normalized_lookup(self, tmp_path):
+        path = tmp_path / 'verified_data.json'
+        write_registry(path, 'WP Engine', 1_000_000)
+        registry = VerifiedRegistry(path)
+
+        assert registry.get('hosting', 'wp engine')['url'] == 'https://example.com'
+        assert registry.get('hosting', 'WPEngine')['name'] == 'WP Engine'
+        assert registry.get('vpn', 'hide.me')['monthly_price'] == 9.95
+        assert registry.get('vpn', 'Unknown VPN') == {}
+        assert normalize_name('Hide.me') == 'hideme'
+
+    def test_reloads_on_mtime_change(self, tmp_path):
+        path = tmp_path / 'verified_data.json'
+        write_registry(path, 'Verpex', 1_000_000)
+        registry = VerifiedRegistry(path, check_interval=0)
+        assert registry.get('hosting', 'Verpex')
+
+        write_registry(path, 'NameHero', 2_000_000)
+        assert registry.get('hosting', 'Verpex') == {}
+        assert registry.get('hosting', 'NameHero')
+
+    def test_missing_file_is_empty(self, tmp_path):
+        registry = VerifiedRegistry(tmp_path / 'missing.json')
+        assert registry.get('hosting', 'Bluehost') == {}
+        assert registry.records('vpn') == []
+
+    def test_singleton_serves_repo_data(self):
+        assert get_registry() is get_registry()
+        assert get_registry().get('hosting', 'Bluehost')['name'] == 'Bluehost'